@@ -0,0 +1,92 @@
+"""Compare the JSON codecs available to TeamDynamixInstance.
+
+Times decoding and encoding of recorded TDx responses with every codec
+that is installed. Record payloads by saving response bodies to files,
+eg an asset search over a whole department, and pass them as arguments:
+
+    python benchmarks/bench_codec.py assets_search.json tickets_search.json
+
+Without arguments a synthetic asset search response is used instead.
+"""
+import argparse
+import json
+import random
+import timeit
+
+from tdxapi.codec import get_available_codecs
+
+
+def make_asset_search(count: int) -> bytes:
+    """Build a response shaped like an asset search.
+
+    Args:
+        count (int): Number of assets in the response
+
+    Returns:
+        bytes: JSON body of the response
+    """
+    assets = []
+    for asset_id in range(count):
+        assets.append({
+            "ID": asset_id,
+            "AppID": 42,
+            "FormID": 1234,
+            "ProductModelID": random.randint(1, 5000),
+            "ProductModelName": "Latitude 7420",
+            "ManufacturerName": "Dell",
+            "StatusID": 56,
+            "StatusName": "In Use",
+            "LocationID": random.randint(1, 500),
+            "LocationName": "Shapiro Library",
+            "Tag": f"{random.randint(10**7, 10**8):08d}",
+            "SerialNumber": f"SN{random.getrandbits(40):012X}",
+            "Name": f"euc-{asset_id}",
+            "OwningCustomerID": "00000000-0000-0000-0000-000000000000",
+            "OwningCustomerName": "None",
+            "CreatedDate": "2023-01-31T12:00:00Z",
+            "ModifiedDate": "2023-06-30T08:15:00Z",
+            "Attributes": [],
+        })
+    return json.dumps(assets).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payloads", nargs="*", help="Recorded JSON bodies")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="Assets in the synthetic payload")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    payloads: dict[str, bytes] = {}
+    for filename in args.payloads:
+        with open(filename, "rb") as file:
+            payloads[filename] = file.read()
+    if not payloads:
+        payloads[f"synthetic {args.count} assets"] = \
+            make_asset_search(args.count)
+
+    codecs = get_available_codecs()
+    for name, payload in payloads.items():
+        print(f"{name} ({len(payload) / 1e6:.1f} MB)")
+        baseline = None
+        for codec in reversed(codecs):
+            obj = codec.loads(payload)
+            loads = min(timeit.repeat(
+                lambda: codec.loads(payload), number=1, repeat=args.repeat
+            ))
+            dumps = min(timeit.repeat(
+                lambda: codec.dumps(obj), number=1, repeat=args.repeat
+            ))
+            if baseline is None:
+                baseline = loads
+            print(
+                f"  {codec.name:<8} loads {loads * 1000:8.1f} ms"
+                f"  dumps {dumps * 1000:8.1f} ms"
+                f"  ({baseline / loads:.1f}x decode)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,33 @@
 """TeamDynamix API Client Library."""
 
-__all__ = ["tdxapi", "exceptions"]
+__all__ = [
+    "tdxapi",
+    "exceptions",
+    "bulk",
+    "cache",
+    "codec",
+    "idcache",
+    "jobs",
+    "mirror",
+    "models",
+    "people",
+    "ratelimit",
+    "retry",
+    "streaming",
+    "writequeue",
+]
 
 from .tdxapi import *
 from .exceptions import *
+from .bulk import *
+from .cache import *
+from .codec import *
+from .idcache import *
+from .jobs import *
+from .mirror import *
+from .models import *
+from .people import *
+from .ratelimit import *
+from .retry import *
+from .streaming import *
+from .writequeue import *
@@ -1,6 +1,30 @@
 from .tdxapi import *
 from .exceptions import *
+from .bulk import *
+from .cache import *
+from .codec import *
+from .idcache import *
+from .jobs import *
+from .mirror import *
+from .models import *
+from .people import *
+from .ratelimit import *
+from .retry import *
+from .streaming import *
+from .writequeue import *
 
 # Names in __all__ with no definition:
+#   bulk
+#   cache
+#   codec
 #   exceptions
+#   idcache
+#   jobs
+#   mirror
+#   models
+#   people
+#   ratelimit
+#   retry
+#   streaming
 #   tdxapi
+#   writequeue
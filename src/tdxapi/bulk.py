@@ -0,0 +1,129 @@
+"""Helpers for running an operation over many items concurrently."""
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+)
+
+
+class BulkResult:
+    """Outcome of one item of a bulk operation.
+
+    Either result is set and error is None, or error holds the exception
+    the operation raised for the item.
+    """
+
+    __slots__ = ("item", "index", "result", "error")
+
+    def __init__(
+        self,
+        item: Any,
+        index: int,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Create the outcome of an item.
+
+        Args:
+            item (Any): Item the operation was run for
+            index (int): Position of the item in the input
+            result (Any, optional): Value returned by the operation
+            error (Exception, optional): Exception raised by the operation
+        """
+        self.item: Any = item
+        self.index: int = index
+        self.result: Any = result
+        self.error: Optional[Exception] = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for the item."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"BulkResult(item={self.item!r}, ok=True)"
+        return f"BulkResult(item={self.item!r}, error={self.error!r})"
+
+
+async def iter_bounded(
+    items: Iterable[Any],
+    operation: Callable[[Any], Awaitable[Any]],
+    concurrency: int = 10,
+) -> AsyncIterator[BulkResult]:
+    """Run an operation for each item, yielding outcomes as they finish.
+
+    At most concurrency operations run at once and items are only pulled
+    from the iterable as slots free up, so memory stays flat for large or
+    lazy inputs. Exceptions are captured in the outcome of their item
+    instead of stopping the run.
+
+    Args:
+        items (Iterable): Items to run the operation for
+        operation (Callable): Coroutine function called with each item
+        concurrency (int, optional): Most operations running at once.
+            Defaults to 10.
+
+    Yields:
+        BulkResult: Outcome of each item, in the order they finish
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    iterator = enumerate(items)
+    running: dict[asyncio.Future[Any], tuple[int, Any]] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future: asyncio.Future[Any] = \
+                    asyncio.ensure_future(operation(item))
+                running[future] = (index, item)
+            if not running:
+                return
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                index, item = running.pop(future)
+                try:
+                    outcome = BulkResult(
+                        item, index, result=future.result()
+                    )
+                except Exception as error:  # pylint: disable=broad-except
+                    outcome = BulkResult(item, index, error=error)
+                yield outcome
+    finally:
+        for future in running:
+            future.cancel()
+
+
+async def gather_bounded(
+    items: Iterable[Any],
+    operation: Callable[[Any], Awaitable[Any]],
+    concurrency: int = 10,
+) -> list[BulkResult]:
+    """Run an operation for each item and return outcomes in input order.
+
+    Args:
+        items (Iterable): Items to run the operation for
+        operation (Callable): Coroutine function called with each item
+        concurrency (int, optional): Most operations running at once.
+            Defaults to 10.
+
+    Returns:
+        list[BulkResult]: Outcome of each item, in the order of items
+    """
+    results: list[BulkResult] = []
+    async for result in iter_bounded(items, operation, concurrency):
+        results.append(result)
+    results.sort(key=lambda result: result.index)
+    return results
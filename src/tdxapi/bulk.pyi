@@ -0,0 +1,13 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+class BulkResult:
+    item: Any
+    index: int
+    result: Any
+    error: Optional[Exception]
+    def __init__(self, item: Any, index: int, result: Any = ..., error: Optional[Exception] = ...) -> None: ...
+    @property
+    def ok(self) -> bool: ...
+
+def iter_bounded(items: Iterable[Any], operation: Callable[[Any], Awaitable[Any]], concurrency: int = ...) -> AsyncIterator[BulkResult]: ...
+async def gather_bounded(items: Iterable[Any], operation: Callable[[Any], Awaitable[Any]], concurrency: int = ...) -> list[BulkResult]: ...
@@ -0,0 +1,143 @@
+"""In-memory cache of objects fetched from the remote TDx instance."""
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Mapping, Optional
+
+# Seconds objects of each resource stay valid unless overridden
+DEFAULT_TTLS: dict[str, float] = {
+    "asset": 300,
+    "person": 3600,
+    "ticket": 60,
+}
+
+
+class ResponseCache:
+    """Bounded LRU cache of TDx objects with a TTL per resource.
+
+    By default objects are copied going in and coming out, so callers
+    can modify what they get back without changing the cached copy.
+    Copying a large object costs far more than the lookup, so hot loops
+    that only read what they get back can turn copying off.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 300,
+        ttls: Optional[Mapping[str, float]] = None,
+        copy: bool = True,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize (int, optional):
+            Most objects kept before the least recently used is dropped.
+            Defaults to 10000.
+
+            ttl (float, optional):
+            Seconds objects stay valid for resources without their own
+            TTL. Defaults to 300.
+
+            ttls (Mapping[str, float], optional):
+            Seconds objects stay valid by resource, eg {"asset": 60}.
+            Defaults to DEFAULT_TTLS.
+
+            copy (bool, optional):
+            Whether objects are deep copied going in and coming out.
+            Without copying, callers must not modify cached objects or
+            objects they have cached. Defaults to True.
+        """
+        if ttls is None:
+            ttls = DEFAULT_TTLS
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.ttls: dict[str, float] = dict(ttls)
+        self.copy: bool = copy
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = \
+            OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, resource: str, key: Any) -> Optional[Any]:
+        """Get an object if it is cached and hasn't expired.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (Any): Key of the object within the resource
+
+        Returns:
+            Any: The object, copied unless copying is off, or None on a miss
+        """
+        cache_key = (resource, str(key))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[cache_key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+        if self.copy:
+            return deepcopy(entry[1])
+        return entry[1]
+
+    def set(self, resource: str, key: Any, value: Any) -> None:
+        """Cache an object.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (Any): Key of the object within the resource
+            value (Any): Object to cache
+        """
+        ttl = self.ttls.get(resource, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        cache_key = (resource, str(key))
+        if self.copy:
+            value = deepcopy(value)
+        entry = (time.monotonic() + ttl, value)
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource: str, key: Optional[Any] = None) -> None:
+        """Drop cached objects.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (Any, optional): Key of the object to drop.
+                Defaults to every object of the resource.
+        """
+        with self._lock:
+            if key is not None:
+                self._entries.pop((resource, str(key)), None)
+                return
+            for cache_key in list(self._entries):
+                if cache_key[0] == resource:
+                    del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """Drop every cached object and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the hit and miss counters of the cache.
+
+        Returns:
+            dict: Hits, misses and current size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
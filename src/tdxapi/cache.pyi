@@ -0,0 +1,17 @@
+from typing import Any, Mapping, Optional
+
+DEFAULT_TTLS: dict[str, float]
+
+class ResponseCache:
+    maxsize: int
+    ttl: float
+    ttls: dict[str, float]
+    hits: int
+    misses: int
+    copy: bool
+    def __init__(self, maxsize: int = ..., ttl: float = ..., ttls: Optional[Mapping[str, float]] = ..., copy: bool = ...) -> None: ...
+    def get(self, resource: str, key: Any) -> Optional[Any]: ...
+    def set(self, resource: str, key: Any, value: Any) -> None: ...
+    def invalidate(self, resource: str, key: Optional[Any] = ...) -> None: ...
+    def clear(self) -> None: ...
+    def get_stats(self) -> dict[str, int]: ...
@@ -0,0 +1,112 @@
+"""JSON codecs for request and response bodies."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+
+class JSONCodec:
+    """Encodes and decodes JSON bodies with the standard library.
+
+    Subclass and override dumps and loads to plug in another JSON library.
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as JSON.
+
+        Args:
+            obj (Any): Object to encode
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON into an object.
+
+        Args:
+            data (bytes | str): JSON to decode
+
+        Returns:
+            Any: The decoded object
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON bodies with orjson."""
+
+    name: str = "orjson"
+
+    def __init__(self) -> None:
+        """Create the codec.
+
+        Raises:
+            ImportError: orjson is not installed
+        """
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Encodes and decodes JSON bodies with msgspec."""
+
+    name: str = "msgspec"
+
+    def __init__(self) -> None:
+        """Create the codec.
+
+        Raises:
+            ImportError: msgspec is not installed
+        """
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+def get_available_codecs() -> list[JSONCodec]:
+    """Get a codec for every JSON library that is installed.
+
+    Returns:
+        list[JSONCodec]: Available codecs, the standard library last
+    """
+    codecs: list[JSONCodec] = []
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    if msgspec is not None:
+        codecs.append(MsgspecCodec())
+    codecs.append(JSONCodec())
+    return codecs
+
+
+def get_fastest_codec() -> JSONCodec:
+    """Get the fastest installed codec.
+
+    Returns:
+        JSONCodec: orjson or msgspec if installed, else the standard library
+    """
+    return get_available_codecs()[0]
@@ -0,0 +1,21 @@
+from typing import Any, Union
+
+class JSONCodec:
+    name: str
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+class OrjsonCodec(JSONCodec):
+    name: str
+    def __init__(self) -> None: ...
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+class MsgspecCodec(JSONCodec):
+    name: str
+    def __init__(self) -> None: ...
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+def get_available_codecs() -> list[JSONCodec]: ...
+def get_fastest_codec() -> JSONCodec: ...
@@ -0,0 +1,176 @@
+"""On-disk cache of the name to ID maps of a TDx instance."""
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Mapping, Optional
+
+# Bump when the layout of the cache file changes so old files are ignored
+IDCACHE_VERSION: int = 1
+
+
+class IDCache:
+    """Versioned on-disk snapshot of the name to ID maps of a TDx instance.
+
+    Each map (eg AppIDs, or TicketStatusIDs for one app) is stored with
+    the time it was fetched and expires on its own, so a stale map can be
+    refreshed without throwing away the rest. Writes go to a temporary
+    file that replaces the cache, so an interrupted write never leaves a
+    corrupt cache behind.
+    """
+
+    def __init__(
+        self,
+        filename: str = "tdx_ids.json",
+        ttl: float = 86400,
+        ttls: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Create a cache backed by a file.
+
+        Args:
+            filename (str, optional):
+            File to keep the cache in. Defaults to tdx_ids.json.
+
+            ttl (float, optional):
+            Seconds a map stays valid. Defaults to one day.
+
+            ttls (Mapping[str, float], optional):
+            Seconds a map stays valid by ID type, eg {"GroupIDs": 3600},
+            overriding ttl. Defaults to None.
+        """
+        self.filename: str = filename
+        self.ttl: float = ttl
+        self.ttls: dict[str, float] = dict(ttls or {})
+        self._instance: Optional[str] = None
+        self._maps: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def load(self, instance: str) -> None:
+        """Load the maps saved for a TDx instance.
+
+        Missing, corrupt, outdated or other instances' cache files are
+        ignored and the cache starts out empty.
+
+        Args:
+            instance (str): Url of the TDx api the maps belong to
+        """
+        self._instance = instance
+        self._maps = {}
+        try:
+            with open(self.filename, "r", encoding="UTF-8") as file:
+                snapshot = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logging.warning(f"Ignoring unreadable ID cache {self.filename}")
+            return
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("Version") != IDCACHE_VERSION
+            or snapshot.get("Instance") != instance
+        ):
+            logging.debug(f"Ignoring outdated ID cache {self.filename}")
+            return
+        for entry in snapshot.get("Maps", []):
+            key = (entry["AppName"], entry["IDType"])
+            self._maps[key] = entry
+        logging.debug(f"Loaded {len(self._maps)} ID maps from cache")
+
+    def is_loaded(self, instance: str) -> bool:
+        """Check if the cache has been loaded for a TDx instance.
+
+        Args:
+            instance (str): Url of the TDx api
+
+        Returns:
+            bool: True if load has been called for the instance
+        """
+        return self._instance == instance
+
+    def get(
+        self,
+        id_type: str,
+        app_name: str = ""
+    ) -> Optional[dict[str, Any]]:
+        """Get a map if it is cached and hasn't expired.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            app_name (str, optional): App the map belongs to, if any
+
+        Returns:
+            dict: Name to ID map, or None if missing or expired
+        """
+        entry = self._maps.get((app_name, id_type))
+        if entry is None:
+            return None
+        ttl = self.ttls.get(id_type, self.ttl)
+        if entry["Saved"] + ttl < time.time():
+            logging.debug(f"Cached {id_type} for '{app_name}' expired")
+            return None
+        return entry["IDs"]
+
+    def put(
+        self,
+        id_type: str,
+        ids: dict[str, Any],
+        app_name: str = ""
+    ) -> None:
+        """Store a map and save the cache.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            ids (dict): Name to ID map
+            app_name (str, optional): App the map belongs to, if any
+        """
+        self._maps[(app_name, id_type)] = {
+            "IDType": id_type,
+            "AppName": app_name,
+            "Saved": time.time(),
+            "IDs": ids,
+        }
+        self.save()
+
+    def invalidate(
+        self,
+        id_type: Optional[str] = None,
+        app_name: Optional[str] = None
+    ) -> None:
+        """Drop maps from the cache and save it.
+
+        Args:
+            id_type (str, optional):
+            Type of the IDs to drop. Defaults to all types.
+
+            app_name (str, optional):
+            App to drop maps for, "" for instance-wide maps.
+            Defaults to all apps.
+        """
+        for key in list(self._maps):
+            if (
+                (app_name is None or key[0] == app_name)
+                and (id_type is None or key[1] == id_type)
+            ):
+                del self._maps[key]
+        self.save()
+
+    def save(self) -> None:
+        """Atomically write the cache to its file."""
+        if self._instance is None:
+            return
+        snapshot = {
+            "Version": IDCACHE_VERSION,
+            "Instance": self._instance,
+            "Maps": list(self._maps.values()),
+        }
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        handle, temp_name = tempfile.mkstemp(
+            dir=directory, prefix=".tdx_ids", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(handle, "w", encoding="UTF-8") as file:
+                json.dump(snapshot, file)
+            os.replace(temp_name, self.filename)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
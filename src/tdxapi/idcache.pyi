@@ -0,0 +1,15 @@
+from typing import Any, Mapping, Optional
+
+IDCACHE_VERSION: int
+
+class IDCache:
+    filename: str
+    ttl: float
+    ttls: dict[str, float]
+    def __init__(self, filename: str = ..., ttl: float = ..., ttls: Optional[Mapping[str, float]] = ...) -> None: ...
+    def load(self, instance: str) -> None: ...
+    def is_loaded(self, instance: str) -> bool: ...
+    def get(self, id_type: str, app_name: str = ...) -> Optional[dict[str, Any]]: ...
+    def put(self, id_type: str, ids: dict[str, Any], app_name: str = ...) -> None: ...
+    def invalidate(self, id_type: Optional[str] = ..., app_name: Optional[str] = ...) -> None: ...
+    def save(self) -> None: ...
@@ -0,0 +1,280 @@
+"""Resumable batch jobs with on-disk checkpoints."""
+import json
+import logging
+import time
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sized,
+)
+
+from tdxapi.bulk import BulkResult, iter_bounded
+
+
+class Checkpoint:
+    """Append-only journal of the items a batch operation has finished.
+
+    Each finished item is written as one JSON line as soon as it
+    finishes, so a run that dies loses at most the items in flight. A
+    partly written last line, from a crash mid-write, is ignored.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Open a journal, loading the items finished by earlier runs.
+
+        Args:
+            filename (str): File to keep the journal in, created if missing
+        """
+        self.filename: str = filename
+        self._done: set[str] = set()
+        self._file: Optional[IO[str]] = None
+        # Whether the journal ends in a partly written line
+        self._torn: bool = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the items recorded as finished successfully."""
+        try:
+            with open(self.filename, "r", encoding="UTF-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return
+        self._torn = bool(lines) and not lines[-1].endswith("\n")
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logging.warning(f"Ignoring corrupt line in {self.filename}")
+                continue
+            if entry.get("OK"):
+                self._done.add(entry["Key"])
+        logging.info(
+            f"Loaded {len(self._done)} finished items from {self.filename}"
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return str(key) in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def record(
+        self,
+        key: Any,
+        ok: bool,
+        detail: Optional[str] = None,
+    ) -> None:
+        """Record that an item finished.
+
+        Only items that finished successfully are skipped when resuming,
+        failures are recorded for reference and tried again.
+
+        Args:
+            key (Any): Unique key of the item
+            ok (bool): Whether the item succeeded
+            detail (str, optional): Result or error of the item
+        """
+        if self._file is None:
+            self._file = open(self.filename, "a", encoding="UTF-8")
+            if self._torn:
+                self._file.write("\n")
+                self._torn = False
+        entry = {"Key": str(key), "OK": ok, "Detail": detail}
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        if ok:
+            self._done.add(str(key))
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class JobProgress:
+    """Progress of a job run, with its throughput and estimated finish."""
+
+    def __init__(self, total: Optional[int] = None) -> None:
+        """Start tracking a run.
+
+        Args:
+            total (int, optional): Number of items in the job, if known
+        """
+        self.total: Optional[int] = total
+        self.completed: int = 0
+        self.failed: int = 0
+        self.skipped: int = 0
+        self.started: float = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Items run per second, not counting skipped items."""
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return (self.completed + self.failed) / elapsed
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Items left to run, None if the total is unknown."""
+        if self.total is None:
+            return None
+        return self.total - self.completed - self.failed - self.skipped
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until the run finishes, None if unknown."""
+        remaining = self.remaining
+        throughput = self.throughput
+        if remaining is None or throughput <= 0:
+            return None
+        return remaining / throughput
+
+    def __repr__(self) -> str:
+        eta = self.eta
+        return (
+            f"JobProgress(completed={self.completed}, failed={self.failed}, "
+            f"skipped={self.skipped}, total={self.total}, "
+            f"throughput={self.throughput:.1f}/s, "
+            f"eta={'unknown' if eta is None else f'{eta:.0f}s'})"
+        )
+
+
+class JobRunner:
+    """Runs an async operation over many items and can resume.
+
+    With a journal file, every finished item is recorded as soon as it
+    finishes and items recorded as successful by an earlier run are
+    skipped, so a run interrupted by a crash or an expired token picks
+    up where it stopped. Progress is logged every log_interval seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        operation: Callable[[Any], Awaitable[Any]],
+        journal: Optional[str] = None,
+        key: Callable[[Any], Any] = str,
+        concurrency: int = 10,
+        resumed_result: Any = None,
+        log_interval: float = 30,
+    ) -> None:
+        """Create a job.
+
+        Args:
+            operation (Callable):
+            Coroutine function called with each item.
+
+            journal (str, optional):
+            File recording finished items. Defaults to None, which
+            doesn't record them.
+
+            key (Callable, optional):
+            Gives the unique key of an item in the journal.
+            Defaults to str.
+
+            concurrency (int, optional):
+            Most operations running at once. Defaults to 10.
+
+            resumed_result (Any, optional):
+            Result given to items skipped because an earlier run
+            finished them. Defaults to None.
+
+            log_interval (float, optional):
+            Seconds between progress log messages. Defaults to 30.
+        """
+        self.operation: Callable[[Any], Awaitable[Any]] = operation
+        self.journal: Optional[str] = journal
+        self.key: Callable[[Any], Any] = key
+        self.concurrency: int = concurrency
+        self.resumed_result: Any = resumed_result
+        self.log_interval: float = log_interval
+        self.progress: JobProgress = JobProgress()
+
+    async def run(self, items: Iterable[Any]) -> list[BulkResult]:
+        """Run the operation for every item not finished by an earlier run.
+
+        Args:
+            items (Iterable): Items to run the operation for
+
+        Returns:
+            list[BulkResult]: Outcome of each item, in the order of items
+        """
+        results: list[BulkResult] = []
+        async for result in self.iter_run(items):
+            results.append(result)
+        results.sort(key=lambda result: result.index)
+        return results
+
+    async def iter_run(
+        self, items: Iterable[Any]
+    ) -> AsyncIterator[BulkResult]:
+        """Run the operation for each item, yielding outcomes as they finish.
+
+        Items are pulled from the iterable as they are needed, so large
+        or lazy inputs work. Items skipped from the journal are yielded
+        before the items that run.
+
+        Args:
+            items (Iterable): Items to run the operation for
+
+        Yields:
+            BulkResult: Outcome of each item
+        """
+        total = len(items) if isinstance(items, Sized) else None
+        self.progress = progress = JobProgress(total)
+        checkpoint = Checkpoint(self.journal) if self.journal else None
+        skipped: list[BulkResult] = []
+
+        def pending() -> Iterator[tuple[int, Any]]:
+            for index, item in enumerate(items):
+                if checkpoint is not None and self.key(item) in checkpoint:
+                    skipped.append(
+                        BulkResult(item, index, self.resumed_result)
+                    )
+                    progress.skipped += 1
+                    continue
+                yield index, item
+
+        async def run_item(entry: tuple[int, Any]) -> Any:
+            return await self.operation(entry[1])
+
+        last_log = time.monotonic()
+        try:
+            async for outcome in iter_bounded(
+                pending(), run_item, self.concurrency
+            ):
+                while skipped:
+                    yield skipped.pop(0)
+                index, item = outcome.item
+                if outcome.ok:
+                    progress.completed += 1
+                else:
+                    progress.failed += 1
+                if checkpoint is not None:
+                    detail = (
+                        str(outcome.result) if outcome.ok
+                        else repr(outcome.error)
+                    )
+                    checkpoint.record(self.key(item), outcome.ok, detail)
+                if time.monotonic() - last_log >= self.log_interval:
+                    last_log = time.monotonic()
+                    logging.info(f"Job progress: {progress}")
+                yield BulkResult(item, index, outcome.result, outcome.error)
+            while skipped:
+                yield skipped.pop(0)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        logging.info(f"Job finished: {progress}")
@@ -0,0 +1,38 @@
+from tdxapi.bulk import BulkResult as BulkResult
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+class Checkpoint:
+    filename: str
+    def __init__(self, filename: str) -> None: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __len__(self) -> int: ...
+    def record(self, key: Any, ok: bool, detail: Optional[str] = ...) -> None: ...
+    def close(self) -> None: ...
+
+class JobProgress:
+    total: Optional[int]
+    completed: int
+    failed: int
+    skipped: int
+    started: float
+    def __init__(self, total: Optional[int] = ...) -> None: ...
+    @property
+    def elapsed(self) -> float: ...
+    @property
+    def throughput(self) -> float: ...
+    @property
+    def remaining(self) -> Optional[int]: ...
+    @property
+    def eta(self) -> Optional[float]: ...
+
+class JobRunner:
+    operation: Callable[[Any], Awaitable[Any]]
+    journal: Optional[str]
+    key: Callable[[Any], Any]
+    concurrency: int
+    resumed_result: Any
+    log_interval: float
+    progress: JobProgress
+    def __init__(self, operation: Callable[[Any], Awaitable[Any]], journal: Optional[str] = ..., key: Callable[[Any], Any] = ..., concurrency: int = ..., resumed_result: Any = ..., log_interval: float = ...) -> None: ...
+    async def run(self, items: Iterable[Any]) -> list[BulkResult]: ...
+    def iter_run(self, items: Iterable[Any]) -> AsyncIterator[BulkResult]: ...
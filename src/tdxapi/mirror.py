@@ -0,0 +1,712 @@
+"""Local SQLite mirrors of TDx apps that can be queried offline."""
+import abc
+import logging
+import sqlite3
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Optional,
+    Union,
+)
+
+from tdxapi import exceptions
+from tdxapi.bulk import BulkResult
+from tdxapi.codec import JSONCodec
+
+if TYPE_CHECKING:
+    from tdxapi.tdxapi import TeamDynamixInstance
+
+# Records written to the database between commits during a sync
+SYNC_BATCH_SIZE: int = 500
+
+
+class SQLiteMirror(abc.ABC):
+    """Base for local copies of the records of a TDx app.
+
+    Each record is kept whole, including custom attributes, next to
+    indexed columns for the fields that are commonly filtered on and a
+    table of attribute values. sync() brings the mirror up to date by
+    only fetching records whose ModifiedDate changed since the last sync.
+    """
+
+    # Kind of record, used to name the tables, set by each mirror
+    _resource: str = ""
+    # App type the mirror defaults to, "Asset" or "Ticket"
+    _app_type: str = ""
+    # (column, TDx field, SQL type) of the indexed columns
+    _columns: tuple[tuple[str, str, str], ...] = ()
+    # Whether _iter_summaries can filter by modified date on the server
+    _server_side_delta: bool = False
+    # Most summaries one listing can return, None if it is never cut
+    # short. A listing that reaches it may be missing records.
+    _listing_limit: Optional[int] = None
+
+    def __init__(
+        self,
+        tdx: "TeamDynamixInstance",
+        filename: str,
+        app_name: str = "",
+        concurrency: int = 10,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        """Create a mirror backed by a SQLite database.
+
+        Args:
+            tdx (TeamDynamixInstance):
+            Instance the records are fetched from.
+
+            filename (str):
+            SQLite database to keep the records in, ":memory:" for a
+            mirror that isn't saved.
+
+            app_name (str, optional):
+            App to mirror. Defaults to the instance's default app.
+
+            concurrency (int, optional):
+            Most records fetched at once while syncing. Defaults to 10.
+
+            codec (JSONCodec, optional):
+            Codec records are stored with. Defaults to JSONCodec().
+        """
+        if codec is None:
+            codec = JSONCodec()
+        self._tdx: "TeamDynamixInstance" = tdx
+        self.filename: str = filename
+        self.app_name: str = app_name or tdx.get_default_app_name(
+            self._app_type
+        )
+        self.concurrency: int = concurrency
+        self._codec: JSONCodec = codec
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the database connection, creating the tables on first use.
+
+        Returns:
+            sqlite3.Connection: Connection to the mirror's database
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._create_tables(connection)
+            self._connection = connection
+        return self._connection
+
+    def _create_tables(self, connection: sqlite3.Connection) -> None:
+        """Create the tables and indexes of the mirror if they are missing.
+
+        Args:
+            connection (sqlite3.Connection): Connection to the database
+        """
+        table = self._resource
+        columns = "".join(
+            f", {column} {sql_type}" for column, _, sql_type in self._columns
+        )
+        connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY{columns},
+                modified_date TEXT,
+                data BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS {table}_attributes (
+                {table}_id INTEGER NOT NULL,
+                attr_id INTEGER NOT NULL,
+                name TEXT,
+                value TEXT,
+                value_text TEXT,
+                PRIMARY KEY ({table}_id, attr_id)
+            );
+            CREATE INDEX IF NOT EXISTS {table}_attributes_by_id
+                ON {table}_attributes (attr_id, value);
+            CREATE INDEX IF NOT EXISTS {table}_attributes_by_name
+                ON {table}_attributes (name, value);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                resource TEXT NOT NULL,
+                app_id INTEGER NOT NULL,
+                synced_at REAL NOT NULL,
+                watermark TEXT,
+                PRIMARY KEY (resource, app_id)
+            );
+            """
+        )
+        for column, _, _ in self._columns:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_by_{column} "
+                f"ON {table} ({column})"
+            )
+        connection.commit()
+
+    async def _get_app_id(self) -> int:
+        """Get the ID of the mirrored app.
+
+        Returns:
+            int: ID of the app
+        """
+        return int(await self._tdx.get_id_async("AppIDs", self.app_name))
+
+    async def sync(self, full: bool = False) -> dict[str, int]:
+        """Bring the mirror up to date with TDx.
+
+        The first sync loads every record of the app. Later syncs only
+        fetch records whose ModifiedDate differs from the mirrored copy,
+        and drop records that no longer exist when the whole app was
+        listed. Nothing is dropped if the listing may have been cut
+        short.
+
+        Args:
+            full (bool, optional): Refetch every record. Defaults to False.
+
+        Returns:
+            dict: Number of records fetched, unchanged, deleted and failed
+        """
+        app_id = await self._get_app_id()
+        started = time.time()
+        since = None if full else self._get_watermark(app_id)
+        known = self._get_modified_dates(app_id)
+        # Listed ModifiedDate of each record to fetch
+        changed: dict[int, Optional[str]] = {}
+        seen: set[int] = set()
+        listed = 0
+        newest = since
+        async for summary in self._iter_summaries(since):
+            listed += 1
+            record_id = int(summary["ID"])
+            seen.add(record_id)
+            modified = summary.get("ModifiedDate")
+            if full or known.get(record_id) != modified:
+                changed[record_id] = modified
+            if modified is not None and (newest is None or modified > newest):
+                newest = modified
+        stats = {
+            "fetched": 0,
+            "unchanged": len(seen) - len(changed),
+            "deleted": 0,
+            "failed": 0,
+        }
+        logging.info(
+            f"Syncing {len(changed)} changed {self._resource} records "
+            f"of {self.app_name}"
+        )
+
+        connection = self._get_connection()
+        pending = 0
+        async for result in self._fetch(changed):
+            if not result.ok:
+                logging.warning(
+                    f"Unable to mirror {self._resource} {result.item}: "
+                    f"{result.error!r}"
+                )
+                stats["failed"] += 1
+                continue
+            expected = changed[int(result.item)]
+            fetched = result.result.get("ModifiedDate")
+            if expected is not None and (fetched or "") < expected:
+                # Failing keeps the watermark, so the next sync lists
+                # the record again
+                logging.warning(
+                    f"Fetched {self._resource} {result.item} is older "
+                    f"than listed, modified {fetched} rather than "
+                    f"{expected}"
+                )
+                stats["failed"] += 1
+                continue
+            self._store(connection, result.result)
+            stats["fetched"] += 1
+            pending += 1
+            if pending >= SYNC_BATCH_SIZE:
+                connection.commit()
+                pending = 0
+
+        complete = (
+            self._listing_limit is None or listed < self._listing_limit
+        )
+        if not complete:
+            logging.warning(
+                f"Listing {self._resource} of {self.app_name} returned "
+                "the most results asked for, not dropping missing records"
+            )
+        elif since is None or not self._server_side_delta:
+            missing = [
+                record_id for record_id in known if record_id not in seen
+            ]
+            self._delete(connection, missing)
+            stats["deleted"] = len(missing)
+        # Keep the old watermark if a record failed so the next sync
+        # lists it again
+        if stats["failed"]:
+            newest = since
+        self._set_watermark(connection, app_id, started, newest)
+        connection.commit()
+        logging.info(f"Synced {self._resource} mirror: {stats}")
+        return stats
+
+    @abc.abstractmethod
+    def _iter_summaries(
+        self, since: Optional[str]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """List the records of the app with at least their ID and
+        ModifiedDate.
+
+        Args:
+            since (str): Only list records modified since this TDx date
+                if the mirror supports it, None to list every record
+
+        Returns:
+            AsyncIterator[dict]: Summaries of the records
+        """
+
+    @abc.abstractmethod
+    def _fetch(self, record_ids: Iterable[int]) -> AsyncIterator[BulkResult]:
+        """Fetch whole records from TDx, including custom attributes.
+
+        Records must not come from the response cache, which may hold
+        copies older than the listing.
+
+        Args:
+            record_ids (Iterable[int]): IDs of the records to fetch
+
+        Returns:
+            AsyncIterator[BulkResult]: Result for each record
+        """
+
+    def _get_watermark(self, app_id: int) -> Optional[str]:
+        """Get the newest ModifiedDate listed by the last sync of the app.
+
+        Args:
+            app_id (int): ID of the mirrored app
+
+        Returns:
+            str: TDx date, or None if the app has never been synced
+        """
+        row = self._get_connection().execute(
+            "SELECT watermark FROM sync_state "
+            "WHERE resource = ? AND app_id = ?",
+            (self._resource, app_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return row["watermark"]
+
+    def _set_watermark(
+        self,
+        connection: sqlite3.Connection,
+        app_id: int,
+        synced_at: float,
+        watermark: Optional[str],
+    ) -> None:
+        """Record a completed sync of the app.
+
+        The watermark comes from the listed summaries rather than the
+        fetched records, since a record modified after it was listed
+        would otherwise move the watermark past changes not yet listed.
+
+        Args:
+            connection (sqlite3.Connection): Connection to the database
+            app_id (int): ID of the mirrored app
+            synced_at (float): Unix time the sync started
+            watermark (str): Newest ModifiedDate listed
+        """
+        connection.execute(
+            "INSERT OR REPLACE INTO sync_state "
+            "(resource, app_id, synced_at, watermark) VALUES (?, ?, ?, ?)",
+            (self._resource, app_id, synced_at, watermark),
+        )
+
+    def _get_modified_dates(self, app_id: int) -> dict[int, Optional[str]]:
+        """Get the ModifiedDate of every mirrored record of the app.
+
+        Args:
+            app_id (int): ID of the mirrored app
+
+        Returns:
+            dict: ModifiedDate by record ID
+        """
+        rows = self._get_connection().execute(
+            f"SELECT id, modified_date FROM {self._resource} "
+            "WHERE app_id = ?",
+            (app_id,),
+        )
+        return {row["id"]: row["modified_date"] for row in rows}
+
+    def _store(
+        self, connection: sqlite3.Connection, record: dict[str, Any]
+    ) -> None:
+        """Write a record and its custom attributes to the database.
+
+        Args:
+            connection (sqlite3.Connection): Connection to the database
+            record (dict): Record as returned by TDx
+        """
+        table = self._resource
+        record_id = int(record["ID"])
+        names = ", ".join(column for column, _, _ in self._columns)
+        marks = ", ".join("?" for _ in self._columns)
+        connection.execute(
+            f"INSERT OR REPLACE INTO {table} "
+            f"(id, {names}, modified_date, data) "
+            f"VALUES (?, {marks}, ?, ?)",
+            (
+                record_id,
+                *(record.get(field) for _, field, _ in self._columns),
+                record.get("ModifiedDate"),
+                self._codec.dumps(record),
+            ),
+        )
+        connection.execute(
+            f"DELETE FROM {table}_attributes WHERE {table}_id = ?",
+            (record_id,),
+        )
+        connection.executemany(
+            f"INSERT OR REPLACE INTO {table}_attributes "
+            f"({table}_id, attr_id, name, value, value_text) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    record_id,
+                    attr.get("ID"),
+                    attr.get("Name"),
+                    _to_text(attr.get("Value")),
+                    attr.get("ValueText"),
+                )
+                for attr in record.get("Attributes") or []
+            ],
+        )
+
+    def _delete(
+        self, connection: sqlite3.Connection, record_ids: list[int]
+    ) -> None:
+        """Drop records from the database.
+
+        Args:
+            connection (sqlite3.Connection): Connection to the database
+            record_ids (list[int]): IDs of the records to drop
+        """
+        table = self._resource
+        rows = [(record_id,) for record_id in record_ids]
+        connection.executemany(f"DELETE FROM {table} WHERE id = ?", rows)
+        connection.executemany(
+            f"DELETE FROM {table}_attributes WHERE {table}_id = ?", rows
+        )
+
+    def get(self, record_id: Union[int, str]) -> dict[str, Any]:
+        """Get a mirrored record.
+
+        Args:
+            record_id (int | str): Internal TDx ID of the record
+
+        Raises:
+            ObjectNotFoundException: The record is not in the mirror
+
+        Returns:
+            dict: Record as returned by TDx, includes custom attributes
+        """
+        row = self._get_connection().execute(
+            f"SELECT data FROM {self._resource} WHERE id = ?",
+            (int(record_id),),
+        ).fetchone()
+        if row is None:
+            raise exceptions.ObjectNotFoundException
+        return self._codec.loads(row["data"])
+
+    def find(self, **filters: Any) -> list[dict[str, Any]]:
+        """Get the mirrored records whose columns equal the given values.
+
+        Args:
+            **filters: Column and value pairs, eg status_id=1234
+
+        Raises:
+            InvalidParameterException: A filter is not an indexed column
+
+        Returns:
+            list[dict]: Matching records as returned by TDx
+        """
+        columns = {column for column, _, _ in self._columns}
+        columns.add("id")
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in filters.items():
+            if column not in columns:
+                raise exceptions.InvalidParameterException
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        where = " AND ".join(clauses) or "1"
+        return self._load(
+            f"SELECT data FROM {self._resource} WHERE {where}", params
+        )
+
+    def find_by_attribute(
+        self, attr: Union[str, int], value: Any
+    ) -> list[dict[str, Any]]:
+        """Get the mirrored records with a custom attribute value.
+
+        Args:
+            attr (str | int): Name or ID of the custom attribute
+            value (Any): Value of the attribute to look for
+
+        Returns:
+            list[dict]: Matching records as returned by TDx
+        """
+        table = self._resource
+        key = "attr_id" if isinstance(attr, int) else "name"
+        return self._load(
+            f"SELECT data FROM {table} WHERE id IN ("
+            f"SELECT {table}_id FROM {table}_attributes "
+            f"WHERE {key} = ? AND value = ?)",
+            (attr, _to_text(value)),
+        )
+
+    def query(
+        self, sql: str, params: Iterable[Any] = ()
+    ) -> list[dict[str, Any]]:
+        """Run a SQL query against the mirror.
+
+        Args:
+            sql (str): Query to run
+            params (Iterable, optional): Parameters of the query
+
+        Returns:
+            list[dict]: Rows as dictionaries of column to value
+        """
+        rows = self._get_connection().execute(sql, tuple(params))
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Get the number of mirrored records.
+
+        Returns:
+            int: Number of records in the mirror
+        """
+        row = self._get_connection().execute(
+            f"SELECT COUNT(*) FROM {self._resource}"
+        ).fetchone()
+        return row[0]
+
+    def get_last_sync(self) -> Optional[float]:
+        """Get when the mirror was last synced.
+
+        Returns:
+            float: Unix time the last sync started, None if never synced
+        """
+        row = self._get_connection().execute(
+            "SELECT MAX(synced_at) FROM sync_state WHERE resource = ?",
+            (self._resource,),
+        ).fetchone()
+        return row[0]
+
+    def _load(
+        self, sql: str, params: Iterable[Any] = ()
+    ) -> list[dict[str, Any]]:
+        """Run a query selecting the data column and decode the records.
+
+        Args:
+            sql (str): Query to run
+            params (Iterable, optional): Parameters of the query
+
+        Returns:
+            list[dict]: Records as returned by TDx
+        """
+        rows = self._get_connection().execute(sql, tuple(params))
+        return [self._codec.loads(row["data"]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class AssetMirror(SQLiteMirror):
+    """Local copy of the assets of a TDx asset app.
+
+    TDx's asset search can't filter by modified date, so each sync lists
+    the app's assets, which is a single streamed request, and only
+    fetches the assets that changed. The search can't be paged either,
+    so assets missing from a listing that returned max_results assets
+    are kept rather than dropped.
+    """
+
+    _resource = "assets"
+    _app_type = "Asset"
+    _columns = (
+        ("app_id", "AppID", "INTEGER"),
+        ("tag", "Tag", "TEXT"),
+        ("serial_number", "SerialNumber", "TEXT"),
+        ("name", "Name", "TEXT"),
+        ("status_id", "StatusID", "INTEGER"),
+        ("location_id", "LocationID", "INTEGER"),
+        ("product_model_id", "ProductModelID", "INTEGER"),
+        ("owning_customer_id", "OwningCustomerID", "TEXT"),
+        ("requesting_customer_id", "RequestingCustomerID", "TEXT"),
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        tdx: "TeamDynamixInstance",
+        filename: str = "tdx_assets.db",
+        app_name: str = "",
+        concurrency: int = 10,
+        codec: Optional[JSONCodec] = None,
+        max_results: int = 100000,
+    ) -> None:
+        """Create an asset mirror backed by a SQLite database.
+
+        Args:
+            tdx (TeamDynamixInstance):
+            Instance the assets are fetched from.
+
+            filename (str, optional):
+            SQLite database to keep the assets in. Defaults to
+            tdx_assets.db.
+
+            app_name (str, optional):
+            Asset app to mirror. Defaults to the default asset app.
+
+            concurrency (int, optional):
+            Most assets fetched at once while syncing. Defaults to 10.
+
+            codec (JSONCodec, optional):
+            Codec assets are stored with. Defaults to JSONCodec().
+
+            max_results (int, optional):
+            Most assets one listing asks TDx for, should be more than
+            the app has. Defaults to 100000.
+        """
+        super().__init__(tdx, filename, app_name, concurrency, codec)
+        self._listing_limit = max_results
+
+    def _iter_summaries(
+        self, since: Optional[str]
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._tdx.iter_search_assets(
+            "", self.app_name, {"MaxResults": self._listing_limit}
+        )
+
+    def _fetch(self, record_ids: Iterable[int]) -> AsyncIterator[BulkResult]:
+        return self._tdx.iter_assets(
+            [str(record_id) for record_id in record_ids],
+            self.app_name,
+            self.concurrency,
+            cached=False,
+        )
+
+    def search(self, search_string: str) -> list[dict[str, Any]]:
+        """Find mirrored assets by name or serial number.
+
+        Works like TeamDynamixInstance.search_assets() but runs locally
+        and includes custom attributes.
+
+        Args:
+            search_string (str): Part of the name or serial of the asset
+
+        Returns:
+            list[dict]: Matching assets as returned by TDx
+        """
+        pattern = f"%{search_string}%"
+        return self._load(
+            "SELECT data FROM assets "
+            "WHERE serial_number LIKE ? OR name LIKE ?",
+            (pattern, pattern),
+        )
+
+
+class TicketMirror(SQLiteMirror):
+    """Local copy of the tickets of a TDx ticket app.
+
+    After the first sync, only tickets modified since the last sync are
+    listed, so records deleted in TDx stay in the mirror until a full
+    sync.
+    """
+
+    _resource = "tickets"
+    _app_type = "Ticket"
+    _server_side_delta = True
+    _columns = (
+        ("app_id", "AppID", "INTEGER"),
+        ("type_id", "TypeID", "INTEGER"),
+        ("form_id", "FormID", "INTEGER"),
+        ("title", "Title", "TEXT"),
+        ("status_id", "StatusID", "INTEGER"),
+        ("priority_id", "PriorityID", "INTEGER"),
+        ("requestor_uid", "RequestorUid", "TEXT"),
+        ("responsible_group_id", "ResponsibleGroupID", "INTEGER"),
+        ("responsible_uid", "ResponsibleUid", "TEXT"),
+        ("account_id", "AccountID", "INTEGER"),
+        ("created_date", "CreatedDate", "TEXT"),
+    )
+
+    def __init__(
+        self,
+        tdx: "TeamDynamixInstance",
+        filename: str = "tdx_tickets.db",
+        app_name: str = "",
+        concurrency: int = 10,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        """Create a ticket mirror backed by a SQLite database.
+
+        Args:
+            tdx (TeamDynamixInstance):
+            Instance the tickets are fetched from.
+
+            filename (str, optional):
+            SQLite database to keep the tickets in. Defaults to
+            tdx_tickets.db.
+
+            app_name (str, optional):
+            Ticket app to mirror. Defaults to the default ticket app.
+
+            concurrency (int, optional):
+            Most tickets fetched at once while syncing. Defaults to 10.
+
+            codec (JSONCodec, optional):
+            Codec tickets are stored with. Defaults to JSONCodec().
+        """
+        super().__init__(tdx, filename, app_name, concurrency, codec)
+
+    def _iter_summaries(
+        self, since: Optional[str]
+    ) -> AsyncIterator[dict[str, Any]]:
+        criteria = {"ModifiedDateFrom": since} if since else {}
+        return self._tdx.iter_search_tickets("", criteria, self.app_name)
+
+    def _fetch(self, record_ids: Iterable[int]) -> AsyncIterator[BulkResult]:
+        return self._tdx.iter_tickets(
+            [str(record_id) for record_id in record_ids],
+            self.app_name,
+            self.concurrency,
+            cached=False,
+        )
+
+    def search(self, title: str, **filters: Any) -> list[dict[str, Any]]:
+        """Find mirrored tickets with a title.
+
+        Works like TeamDynamixInstance.search_tickets() but runs locally
+        and includes custom attributes.
+
+        Args:
+            title (str): Title of the ticket
+            **filters: Other column and value pairs, eg status_id=1234
+
+        Returns:
+            list[dict]: Matching tickets as returned by TDx
+        """
+        return self.find(title=title, **filters)
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """Convert an attribute value to the text it is stored as.
+
+    Args:
+        value (Any): Value of a custom attribute
+
+    Returns:
+        str: The value as text, None if it has no value
+    """
+    if value is None:
+        return None
+    return str(value)
@@ -0,0 +1,30 @@
+import abc
+import sqlite3
+from tdxapi.bulk import BulkResult as BulkResult
+from tdxapi.codec import JSONCodec as JSONCodec
+from tdxapi.tdxapi import TeamDynamixInstance as TeamDynamixInstance
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+SYNC_BATCH_SIZE: int
+
+class SQLiteMirror(abc.ABC, metaclass=abc.ABCMeta):
+    filename: str
+    app_name: str
+    concurrency: int
+    def __init__(self, tdx: TeamDynamixInstance, filename: str, app_name: str = ..., concurrency: int = ..., codec: Optional[JSONCodec] = ...) -> None: ...
+    async def sync(self, full: bool = ...) -> dict[str, int]: ...
+    def get(self, record_id: Union[int, str]) -> dict[str, Any]: ...
+    def find(self, **filters: Any) -> list[dict[str, Any]]: ...
+    def find_by_attribute(self, attr: Union[str, int], value: Any) -> list[dict[str, Any]]: ...
+    def query(self, sql: str, params: Iterable[Any] = ...) -> list[dict[str, Any]]: ...
+    def count(self) -> int: ...
+    def get_last_sync(self) -> Optional[float]: ...
+    def close(self) -> None: ...
+
+class AssetMirror(SQLiteMirror):
+    def __init__(self, tdx: TeamDynamixInstance, filename: str = ..., app_name: str = ..., concurrency: int = ..., codec: Optional[JSONCodec] = ..., max_results: int = ...) -> None: ...
+    def search(self, search_string: str) -> list[dict[str, Any]]: ...
+
+class TicketMirror(SQLiteMirror):
+    def __init__(self, tdx: TeamDynamixInstance, filename: str = ..., app_name: str = ..., concurrency: int = ..., codec: Optional[JSONCodec] = ...) -> None: ...
+    def search(self, title: str, **filters: Any) -> list[dict[str, Any]]: ...
@@ -0,0 +1,449 @@
+"""Typed, slotted records for objects returned by TDx."""
+from typing import Any, Optional, Union
+
+from tdxapi import exceptions
+
+
+class Record:
+    """Base for typed TDx records.
+
+    Fields are kept in slots named after the snake case version of their
+    TDx name. Fields TDx didn't send read as None and are left out of
+    to_dict(), so records convert back to exactly what TDx sent.
+    """
+
+    __slots__ = ()
+    # (slot, TDx field) pairs, set by each record type
+    _fields: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Any:
+        """Create a record from a dictionary returned by TDx.
+
+        Args:
+            data (dict): Object as returned by TDx
+
+        Returns:
+            Record: The typed record
+        """
+        record = cls.__new__(cls)
+        for slot, field in cls._fields:
+            if field in data:
+                setattr(record, slot, data[field])
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record back to the dictionary form TDx uses.
+
+        Returns:
+            dict: Object as TDx expects it
+        """
+        data: dict[str, Any] = {}
+        for slot, field in self._fields:
+            try:
+                data[field] = object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for slots TDx didn't send a value for
+        if any(slot == name for slot, _ in self._fields):
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copy and pickle through to_dict() so unset slots stay unset
+        return (type(self).from_dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+
+class Attribute(Record):
+    """A custom attribute of an asset, ticket or person.
+
+    Every field TDx documents for custom attributes has a slot, so
+    attributes don't carry a dictionary of their own.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "order",
+        "description",
+        "section_id",
+        "section_name",
+        "field_type",
+        "data_type",
+        "choices",
+        "is_required",
+        "is_updatable",
+        "value",
+        "value_text",
+        "choices_text",
+        "associated_item_ids",
+    )
+    id: Any
+    name: Optional[str]
+    value: Any
+    _fields = (
+        ("id", "ID"),
+        ("name", "Name"),
+        ("order", "Order"),
+        ("description", "Description"),
+        ("section_id", "SectionID"),
+        ("section_name", "SectionName"),
+        ("field_type", "FieldType"),
+        ("data_type", "DataType"),
+        ("choices", "Choices"),
+        ("is_required", "IsRequired"),
+        ("is_updatable", "IsUpdatable"),
+        ("value", "Value"),
+        ("value_text", "ValueText"),
+        ("choices_text", "ChoicesText"),
+        ("associated_item_ids", "AssociatedItemIDs"),
+    )
+
+
+class AttributedRecord(Record):
+    """Record with custom attributes that can be looked up in O(1).
+
+    Fields without a slot are kept as is in extra. The name and ID index
+    is built the first time an attribute is looked up, so records that
+    are never queried don't pay for it.
+    """
+
+    __slots__ = ("extra", "attributes", "_by_name", "_by_id")
+    extra: dict[str, Any]
+    attributes: list[Attribute]
+    _by_name: Optional[dict[Any, Attribute]]
+    _by_id: Optional[dict[Any, Attribute]]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Any:
+        record = super().from_dict(data)
+        fields = {field for _, field in cls._fields}
+        record.extra = {
+            field: value for field, value in data.items()
+            if field not in fields and field != "Attributes"
+        }
+        record.attributes = [
+            Attribute.from_dict(attr)
+            for attr in data.get("Attributes") or []
+        ]
+        record._by_name = None
+        record._by_id = None
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        data = dict(self.extra)
+        data.update(super().to_dict())
+        data["Attributes"] = [attr.to_dict() for attr in self.attributes]
+        return data
+
+    def _build_index(self) -> None:
+        """Index the custom attributes by name and ID."""
+        self._by_name = {attr.name: attr for attr in self.attributes}
+        self._by_id = {attr.id: attr for attr in self.attributes}
+
+    def get_attribute(self, key: Union[str, int]) -> Attribute:
+        """Get a custom attribute by name or ID.
+
+        Args:
+            key (str | int): Name or ID of the attribute
+
+        Raises:
+            NoSuchAttributeException: The record has no such attribute
+
+        Returns:
+            Attribute: The custom attribute
+        """
+        if self._by_name is None or self._by_id is None:
+            self._build_index()
+        attr: Optional[Attribute] = self._by_name.get(key)  # type: ignore
+        if attr is None:
+            attr = self._by_id.get(key)  # type: ignore
+        if attr is None:
+            raise exceptions.NoSuchAttributeException
+        return attr
+
+    def set_attribute(
+        self,
+        key: Union[str, int],
+        value: Any,
+        attr_id: Optional[Any] = None
+    ) -> Attribute:
+        """Set the value of a custom attribute, adding it if it is missing.
+
+        Args:
+            key (str | int): Name or ID of the attribute
+            value (Any): New value of the attribute
+            attr_id (Any, optional): ID to add the attribute with when the
+                record doesn't have it and key is a name
+
+        Raises:
+            NoSuchAttributeException: The attribute is missing and has no ID
+
+        Returns:
+            Attribute: The custom attribute
+        """
+        try:
+            attr = self.get_attribute(key)
+        except exceptions.NoSuchAttributeException:
+            if attr_id is None and isinstance(key, int):
+                attr_id = key
+            if attr_id is None:
+                raise
+            data: dict[str, Any] = {"ID": attr_id, "Value": value}
+            if isinstance(key, str):
+                data["Name"] = key
+            attr = Attribute.from_dict(data)
+            self.attributes.append(attr)
+            self._by_name = None
+            self._by_id = None
+            return attr
+        attr.value = value
+        return attr
+
+
+class Asset(AttributedRecord):
+    """An asset in a TDx asset app."""
+
+    __slots__ = (
+        "id",
+        "app_id",
+        "form_id",
+        "product_model_id",
+        "manufacturer_id",
+        "supplier_id",
+        "status_id",
+        "status_name",
+        "location_id",
+        "location_name",
+        "tag",
+        "serial_number",
+        "name",
+        "owning_customer_id",
+        "owning_customer_name",
+        "requesting_customer_id",
+        "modified_date",
+    )
+    _fields = (
+        ("id", "ID"),
+        ("app_id", "AppID"),
+        ("form_id", "FormID"),
+        ("product_model_id", "ProductModelID"),
+        ("manufacturer_id", "ManufacturerID"),
+        ("supplier_id", "SupplierID"),
+        ("status_id", "StatusID"),
+        ("status_name", "StatusName"),
+        ("location_id", "LocationID"),
+        ("location_name", "LocationName"),
+        ("tag", "Tag"),
+        ("serial_number", "SerialNumber"),
+        ("name", "Name"),
+        ("owning_customer_id", "OwningCustomerID"),
+        ("owning_customer_name", "OwningCustomerName"),
+        ("requesting_customer_id", "RequestingCustomerID"),
+        ("modified_date", "ModifiedDate"),
+    )
+
+
+class Ticket(AttributedRecord):
+    """A ticket in a TDx ticket app."""
+
+    __slots__ = (
+        "id",
+        "app_id",
+        "type_id",
+        "form_id",
+        "title",
+        "description",
+        "status_id",
+        "status_name",
+        "priority_id",
+        "requestor_uid",
+        "requestor_name",
+        "responsible_group_id",
+        "responsible_uid",
+        "account_id",
+        "created_date",
+        "modified_date",
+    )
+    _fields = (
+        ("id", "ID"),
+        ("app_id", "AppID"),
+        ("type_id", "TypeID"),
+        ("form_id", "FormID"),
+        ("title", "Title"),
+        ("description", "Description"),
+        ("status_id", "StatusID"),
+        ("status_name", "StatusName"),
+        ("priority_id", "PriorityID"),
+        ("requestor_uid", "RequestorUid"),
+        ("requestor_name", "RequestorName"),
+        ("responsible_group_id", "ResponsibleGroupID"),
+        ("responsible_uid", "ResponsibleUid"),
+        ("account_id", "AccountID"),
+        ("created_date", "CreatedDate"),
+        ("modified_date", "ModifiedDate"),
+    )
+
+
+class Person(AttributedRecord):
+    """A person in TDx."""
+
+    __slots__ = (
+        "uid",
+        "username",
+        "first_name",
+        "last_name",
+        "full_name",
+        "primary_email",
+        "alternate_id",
+        "is_active",
+    )
+    _fields = (
+        ("uid", "UID"),
+        ("username", "UserName"),
+        ("first_name", "FirstName"),
+        ("last_name", "LastName"),
+        ("full_name", "FullName"),
+        ("primary_email", "PrimaryEmail"),
+        ("alternate_id", "AlternateID"),
+        ("is_active", "IsActive"),
+    )
+
+    def __repr__(self) -> str:
+        return f"Person(uid={self.uid!r})"
+
+
+class AttributeIndex:
+    """Index of the custom attributes of a ticket or asset dictionary.
+
+    Looks attributes up by name or ID in O(1) and writes values back into
+    the record's Attributes list, so the record can be sent back to TDx
+    as is. The index notices when the list has been replaced or
+    reordered and rebuilds itself.
+    """
+
+    __slots__ = ("_record", "_attributes", "_by_name", "_by_id")
+
+    def __init__(self, record: dict[str, Any]) -> None:
+        """Index the attributes of a record.
+
+        Args:
+            record (dict): Ticket or asset as returned by TDx
+        """
+        self._record: dict[str, Any] = record
+        self._build()
+
+    def _build(self) -> None:
+        """Index the record's current Attributes list."""
+        self._attributes: list[dict[str, Any]] = \
+            self._record.get("Attributes") or []
+        self._by_name: dict[Any, int] = {}
+        self._by_id: dict[Any, int] = {}
+        for position, attr in enumerate(self._attributes):
+            self._by_name[attr.get("Name")] = position
+            self._by_id[attr.get("ID")] = position
+
+    def _find(self, key: Union[str, int]) -> Optional[dict[str, Any]]:
+        """Find an attribute, checking the index is still accurate.
+
+        Args:
+            key (str | int): Name or ID of the attribute
+
+        Returns:
+            dict: The attribute, or None if the record doesn't have it
+        """
+        for index, field in ((self._by_name, "Name"), (self._by_id, "ID")):
+            position = index.get(key)
+            if position is None:
+                continue
+            if (
+                self._record.get("Attributes") is self._attributes
+                and position < len(self._attributes)
+                and self._attributes[position].get(field) == key
+            ):
+                return self._attributes[position]
+        return None
+
+    def get(self, key: Union[str, int]) -> dict[str, Any]:
+        """Get an attribute by name or ID.
+
+        Args:
+            key (str | int): Name or ID of the attribute
+
+        Raises:
+            NoSuchAttributeException: The record has no such attribute
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        attr = self._find(key)
+        if attr is None:
+            # The list may have changed since it was indexed
+            self._build()
+            attr = self._find(key)
+        if attr is None:
+            raise exceptions.NoSuchAttributeException
+        return attr
+
+    def __contains__(self, key: Union[str, int]) -> bool:
+        try:
+            self.get(key)
+        except exceptions.NoSuchAttributeException:
+            return False
+        return True
+
+    def set(
+        self,
+        key: Union[str, int],
+        value: Any,
+        attr_id: Optional[Any] = None
+    ) -> dict[str, Any]:
+        """Set the value of an attribute, adding it if it is missing.
+
+        Args:
+            key (str | int): Name or ID of the attribute
+            value (Any): New value of the attribute
+            attr_id (Any, optional): ID to add the attribute with when the
+                record doesn't have it and key is a name
+
+        Raises:
+            NoSuchAttributeException: The attribute is missing and has no ID
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        try:
+            attr = self.get(key)
+        except exceptions.NoSuchAttributeException:
+            if attr_id is None and isinstance(key, int):
+                attr_id = key
+            if attr_id is None:
+                raise
+            attr = {"ID": attr_id, "Value": value}
+            if isinstance(key, str):
+                attr["Name"] = key
+            self._record.setdefault("Attributes", []).append(attr)
+            self._build()
+            return attr
+        attr["Value"] = value
+        return attr
+
+
+def index_attributes(record: dict[str, Any]) -> AttributeIndex:
+    """Index the custom attributes of a ticket or asset dictionary.
+
+    Args:
+        record (dict): Ticket or asset as returned by TDx
+
+    Returns:
+        AttributeIndex: Index for looking up and setting attributes
+    """
+    return AttributeIndex(record)
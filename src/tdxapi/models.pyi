@@ -0,0 +1,87 @@
+from typing import Any, Optional, Union
+
+class Record:
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Any: ...
+    def to_dict(self) -> dict[str, Any]: ...
+
+class Attribute(Record):
+    id: Any
+    name: Optional[str]
+    order: Optional[int]
+    description: Optional[str]
+    section_id: Any
+    section_name: Optional[str]
+    field_type: Optional[str]
+    data_type: Optional[str]
+    choices: Optional[list[dict[str, Any]]]
+    is_required: Optional[bool]
+    is_updatable: Optional[bool]
+    value: Any
+    value_text: Optional[str]
+    choices_text: Optional[str]
+    associated_item_ids: Optional[list[int]]
+
+class AttributedRecord(Record):
+    extra: dict[str, Any]
+    attributes: list[Attribute]
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Any: ...
+    def to_dict(self) -> dict[str, Any]: ...
+    def get_attribute(self, key: Union[str, int]) -> Attribute: ...
+    def set_attribute(self, key: Union[str, int], value: Any, attr_id: Optional[Any] = ...) -> Attribute: ...
+
+class Asset(AttributedRecord):
+    id: Any
+    app_id: Any
+    form_id: Any
+    product_model_id: Any
+    manufacturer_id: Any
+    supplier_id: Any
+    status_id: Any
+    status_name: Optional[str]
+    location_id: Any
+    location_name: Optional[str]
+    tag: Optional[str]
+    serial_number: Optional[str]
+    name: Optional[str]
+    owning_customer_id: Optional[str]
+    owning_customer_name: Optional[str]
+    requesting_customer_id: Optional[str]
+    modified_date: Optional[str]
+
+class Ticket(AttributedRecord):
+    id: Any
+    app_id: Any
+    type_id: Any
+    form_id: Any
+    title: Optional[str]
+    description: Optional[str]
+    status_id: Any
+    status_name: Optional[str]
+    priority_id: Any
+    requestor_uid: Optional[str]
+    requestor_name: Optional[str]
+    responsible_group_id: Any
+    responsible_uid: Optional[str]
+    account_id: Any
+    created_date: Optional[str]
+    modified_date: Optional[str]
+
+class Person(AttributedRecord):
+    uid: Optional[str]
+    username: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    full_name: Optional[str]
+    primary_email: Optional[str]
+    alternate_id: Optional[str]
+    is_active: Optional[bool]
+
+class AttributeIndex:
+    def __init__(self, record: dict[str, Any]) -> None: ...
+    def get(self, key: Union[str, int]) -> dict[str, Any]: ...
+    def __contains__(self, key: Union[str, int]) -> bool: ...
+    def set(self, key: Union[str, int], value: Any, attr_id: Optional[Any] = ...) -> dict[str, Any]: ...
+
+def index_attributes(record: dict[str, Any]) -> AttributeIndex: ...
@@ -0,0 +1,212 @@
+"""In-memory directory of TDx people that can be looked up by any ID."""
+import copy
+import logging
+import threading
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+# Fields people can be looked up by
+PERSON_KEYS: tuple[str, ...] = (
+    "UID",
+    "UserName",
+    "PrimaryEmail",
+    "AlternateID",
+)
+
+
+class PeopleDirectory:
+    """Cache of people indexed by UID, username, email and alternate ID.
+
+    Each person is stored once and reachable by every key they have, so
+    a person fetched by UID is also found by their email. Usernames,
+    emails and alternate IDs are matched case-insensitively. People
+    expire ttl seconds after they were added.
+    """
+
+    def __init__(self, ttl: float = 3600) -> None:
+        """Create an empty directory.
+
+        Args:
+            ttl (float, optional): Seconds a person stays valid.
+                Defaults to one hour.
+        """
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        # (expiry, person) by UID
+        self._people: dict[str, tuple[float, dict[str, Any]]] = {}
+        # UID by (key, normalized value)
+        self._index: dict[tuple[str, str], str] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, person: dict[str, Any]) -> bool:
+        """Add or replace a person.
+
+        Args:
+            person (dict): Person as returned by TDx, must have a UID
+
+        Returns:
+            bool: True if the person was added
+        """
+        return self.add_many([person]) == 1
+
+    def add_many(self, people: Iterable[dict[str, Any]]) -> int:
+        """Add or replace many people at once.
+
+        Args:
+            people (Iterable[dict]): People as returned by TDx
+
+        Returns:
+            int: Number of people added
+        """
+        if self.ttl <= 0:
+            return 0
+        expiry = time.monotonic() + self.ttl
+        count = 0
+        with self._lock:
+            for person in people:
+                uid = person.get("UID")
+                if not uid:
+                    continue
+                self._remove(uid)
+                self._people[uid] = (expiry, copy.deepcopy(person))
+                for key in PERSON_KEYS:
+                    value = person.get(key)
+                    if value:
+                        self._index[(key, _normalize(value))] = uid
+                count += 1
+        return count
+
+    def get(self, key: str, value: Any) -> Optional[dict[str, Any]]:
+        """Get a person by one of their IDs.
+
+        Args:
+            key (str): One of PERSON_KEYS, eg "AlternateID"
+            value (Any): Value of the key to look up
+
+        Returns:
+            dict: Copy of the person, or None if they aren't cached
+        """
+        with self._lock:
+            person = self._get(key, value)
+            if person is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(person)
+
+    def find(self, criteria: Mapping[str, Any]) -> Optional[dict[str, Any]]:
+        """Get the person matching people search criteria.
+
+        Only criteria made up entirely of PERSON_KEYS can be answered
+        from the directory, anything else counts as a miss.
+
+        Args:
+            criteria (Mapping): Search criteria, eg {"AlternateID": "..."}
+
+        Returns:
+            dict: Copy of the person, or None if they aren't cached
+        """
+        if not criteria or any(key not in PERSON_KEYS for key in criteria):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            people = {
+                id(person): person
+                for person in (
+                    self._get(key, value) for key, value in criteria.items()
+                )
+            }
+            person = people.popitem()[1] if len(people) == 1 else None
+            if person is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(person)
+
+    def invalidate(self, uid: Optional[str] = None) -> None:
+        """Drop people from the directory.
+
+        Args:
+            uid (str, optional): UID of the person to drop.
+                Defaults to everyone.
+        """
+        with self._lock:
+            if uid is None:
+                self._people.clear()
+                self._index.clear()
+            else:
+                self._remove(uid)
+
+    def clear(self) -> None:
+        """Drop everyone and reset the counters."""
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the hit and miss counters of the directory.
+
+        Returns:
+            dict: Hits, misses and number of people cached
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._people),
+            }
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def _get(self, key: str, value: Any) -> Optional[dict[str, Any]]:
+        """Get a person without copying them, the lock must be held.
+
+        Args:
+            key (str): One of PERSON_KEYS
+            value (Any): Value of the key to look up
+
+        Returns:
+            dict: The cached person, or None if they aren't cached
+        """
+        if value is None:
+            return None
+        uid = self._index.get((key, _normalize(value)))
+        if uid is None:
+            return None
+        expiry, person = self._people[uid]
+        if expiry < time.monotonic():
+            logging.debug(f"Person {uid} expired from the directory")
+            self._remove(uid)
+            return None
+        return person
+
+    def _remove(self, uid: str) -> None:
+        """Drop a person and their keys, the lock must be held.
+
+        Args:
+            uid (str): UID of the person
+        """
+        entry = self._people.pop(uid, None)
+        if entry is None:
+            return
+        for key in PERSON_KEYS:
+            value = entry[1].get(key)
+            index_key = (key, _normalize(value))
+            if value and self._index.get(index_key) == uid:
+                del self._index[index_key]
+
+
+def _normalize(value: Any) -> str:
+    """Normalize an ID so lookups ignore case.
+
+    Args:
+        value (Any): Value of a person key
+
+    Returns:
+        str: The value, lowercased
+    """
+    return str(value).lower()
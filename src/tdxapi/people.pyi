@@ -0,0 +1,17 @@
+from typing import Any, Iterable, Mapping, Optional
+
+PERSON_KEYS: tuple[str, ...]
+
+class PeopleDirectory:
+    ttl: float
+    hits: int
+    misses: int
+    def __init__(self, ttl: float = ...) -> None: ...
+    def add(self, person: dict[str, Any]) -> bool: ...
+    def add_many(self, people: Iterable[dict[str, Any]]) -> int: ...
+    def get(self, key: str, value: Any) -> Optional[dict[str, Any]]: ...
+    def find(self, criteria: Mapping[str, Any]) -> Optional[dict[str, Any]]: ...
+    def invalidate(self, uid: Optional[str] = ...) -> None: ...
+    def clear(self) -> None: ...
+    def get_stats(self) -> dict[str, int]: ...
+    def __len__(self) -> int: ...
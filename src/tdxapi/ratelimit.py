@@ -0,0 +1,456 @@
+"""Rate limiting for requests to the remote TDx instance."""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, Mapping, Optional
+
+# TDx limits most endpoints to 60 calls per 60 seconds per client
+DEFAULT_RATE_LIMITS: dict[str, tuple[int, float]] = {
+    "assets": (60, 60.0),
+    "tickets": (60, 60.0),
+    "people": (60, 60.0),
+    "search": (60, 60.0),
+    "default": (60, 60.0),
+}
+
+
+class TokenBucket:
+    """Token bucket allowing a number of requests per period."""
+
+    def __init__(self, rate: int, period: float) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate (int): Number of requests allowed per period
+            period (float): Length of the period in seconds
+        """
+        self.rate: int = rate
+        self.period: float = period
+        self._tokens: float = float(rate)
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token from the bucket, going into debt if it is empty.
+
+        Requests that go into debt are queued behind each other, each one
+        waiting for the token it reserved to be refilled.
+
+        Returns:
+            float: Seconds to wait before the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens
+                    + (now - self._updated) * self.rate / self.period
+                )
+                self._updated = now
+            self._tokens -= 1
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens * self.period / self.rate
+            return wait
+
+    def block(self, delay: float) -> None:
+        """Stop handing out tokens until the delay has passed.
+
+        Args:
+            delay (float): Seconds until the remote limit resets
+        """
+        with self._lock:
+            until = time.monotonic() + delay
+            if until > self._updated:
+                self._updated = until
+                self._tokens = 1.0
+
+
+class RateLimiter:
+    """Schedules requests to TDx within per-endpoint-family rate limits.
+
+    Endpoints are grouped into families (assets, tickets, people, search)
+    that each get their own token bucket. Requests beyond the limit wait
+    their turn instead of being sent, and the limiter backs off when TDx
+    answers with 429 or reports that the limit has been used up.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, tuple[int, float]]] = None,
+        max_rate_limit_retries: int = 5,
+    ) -> None:
+        """Create a rate limiter.
+
+        Args:
+            limits (Mapping[str, tuple[int, float]], optional):
+            Requests allowed per period in seconds for each endpoint
+            family. Families without a limit use "default", if it is set,
+            or are not limited. Defaults to DEFAULT_RATE_LIMITS.
+
+            max_rate_limit_retries (int, optional):
+            Times a request is resent after a 429 before the response is
+            returned to the caller. Defaults to 5.
+        """
+        if limits is None:
+            limits = DEFAULT_RATE_LIMITS
+        self.max_rate_limit_retries: int = max_rate_limit_retries
+        self._buckets: dict[str, TokenBucket] = {
+            family: TokenBucket(rate, period)
+            for family, (rate, period) in limits.items()
+        }
+
+    def get_family(self, endpoint: str) -> str:
+        """Get the endpoint family used to rate limit an endpoint.
+
+        Args:
+            endpoint (str): Api endpoint, eg "123/assets/456"
+
+        Returns:
+            str: Family of the endpoint, eg "assets"
+        """
+        parts = endpoint.split("?")[0].strip("/").split("/")
+        if parts[-1] == "search":
+            return "search"
+        for family in ("assets", "tickets", "people"):
+            if family in parts:
+                return family
+        return "default"
+
+    def _get_bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        family = self.get_family(endpoint)
+        return self._buckets.get(family, self._buckets.get("default"))
+
+    async def acquire(self, endpoint: str) -> None:
+        """Wait until a request may be sent to the endpoint.
+
+        Args:
+            endpoint (str): Api endpoint the request is for
+        """
+        bucket = self._get_bucket(endpoint)
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        if wait > 0:
+            logging.debug(f"Rate limiting {endpoint} for {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, endpoint: str) -> None:
+        """Block until a request may be sent to the endpoint.
+
+        Args:
+            endpoint (str): Api endpoint the request is for
+        """
+        bucket = self._get_bucket(endpoint)
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        if wait > 0:
+            logging.debug(f"Rate limiting {endpoint} for {wait:.2f}s")
+            time.sleep(wait)
+
+    def update(
+        self,
+        endpoint: str,
+        status: int,
+        headers: Mapping[str, str]
+    ) -> None:
+        """Adjust the limiter from the response to a request.
+
+        Args:
+            endpoint (str): Api endpoint the request was sent to
+            status (int): Status code of the response
+            headers (Mapping[str, str]): Headers of the response
+        """
+        bucket = self._get_bucket(endpoint)
+        if bucket is None:
+            return
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            delay = get_retry_delay(headers)
+            if delay is None:
+                delay = bucket.period / bucket.rate
+            logging.warning(
+                f"Rate limited by TDx on {endpoint}, "
+                f"pausing {self.get_family(endpoint)} for {delay:.2f}s"
+            )
+            bucket.block(delay)
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            delay = get_retry_delay(headers)
+            if delay is not None:
+                bucket.block(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits requests in flight, adapting the limit to how TDx responds.
+
+    The limit grows additively, by about one per round trip, while
+    latency stays close to its usual level, and is cut multiplicatively
+    when TDx answers with 429 or a server error, a request fails to
+    send, or latency rises above latency_tolerance times its usual level.
+    Recent latency is a moving average over about short_window
+    responses, compared with a moving average over about long_window
+    responses, so single slow responses don't cut the limit. Latency is
+    tracked per endpoint family, since searches are slower than gets
+    even when TDx isn't loaded.
+    Only one cut is made for requests that were already in flight when
+    the limit was last cut, so a burst of failures doesn't collapse it.
+    Retries count as the request they resend, so a request that keeps
+    failing cuts the limit at most once.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        short_window: int = 10,
+        long_window: int = 500,
+    ) -> None:
+        """Create a limiter.
+
+        Args:
+            initial_limit (int, optional):
+            Requests allowed in flight at first. Defaults to 10.
+
+            min_limit (int, optional):
+            Fewest requests allowed in flight. Defaults to 1.
+
+            max_limit (int, optional):
+            Most requests allowed in flight. Defaults to 100.
+
+            backoff (float, optional):
+            Factor the limit is multiplied by when it is cut.
+            Defaults to 0.5.
+
+            latency_tolerance (float, optional):
+            How many times the long-run latency recent responses may
+            take before the limit is cut. Defaults to 2.0.
+
+            short_window (int, optional):
+            Number of responses recent latency is averaged over, latency
+            is only judged once this many responses were seen.
+            Defaults to 10.
+
+            long_window (int, optional):
+            Number of responses long-run latency is averaged over.
+            Defaults to 500.
+        """
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.backoff: float = backoff
+        self.latency_tolerance: float = latency_tolerance
+        self.short_window: int = short_window
+        self.long_window: int = long_window
+        self.limit: float = float(
+            min(max(initial_limit, min_limit), max_limit)
+        )
+        self.in_flight: int = 0
+        # Moving averages of latency by endpoint family
+        self.recent_latencies: dict[str, float] = {}
+        self.baseline_latencies: dict[str, float] = {}
+        self._samples: dict[str, int] = {}
+        self._last_cut: float = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> float:
+        """Wait until another request may be in flight.
+
+        Every acquire must be followed by a release.
+
+        Returns:
+            float: Time the request was let through, to pass to release()
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return time.monotonic()
+        waiter: asyncio.Future[None] = \
+            asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        status: Optional[int],
+        family: str = "default",
+        first_started: Optional[float] = None,
+    ) -> None:
+        """Free the slot of a finished request and adapt the limit.
+
+        Args:
+            started (float): Time returned by acquire()
+            status (int, optional): Status code of the response, None if
+                the request failed to send
+            family (str, optional): Endpoint family of the request, see
+                RateLimiter.get_family(). Defaults to "default".
+            first_started (float, optional): Time returned by acquire()
+                for the first attempt of a request that is being resent,
+                so its retries cut the limit at most once. Defaults to
+                started.
+        """
+        if first_started is None:
+            first_started = started
+        now = time.monotonic()
+        latency = now - started
+        self.in_flight -= 1
+        # Only responses TDx actually served say anything about latency
+        slow = (
+            status is not None
+            and status != HTTPStatus.TOO_MANY_REQUESTS
+            and status < HTTPStatus.INTERNAL_SERVER_ERROR
+            and self._record_latency(family, latency)
+        )
+        overloaded = (
+            slow
+            or status is None
+            or status == HTTPStatus.TOO_MANY_REQUESTS
+            or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+        if overloaded:
+            if first_started >= self._last_cut:
+                self.limit = max(
+                    float(self.min_limit), self.limit * self.backoff
+                )
+                self._last_cut = now
+                logging.debug(
+                    f"Cut concurrency limit to {int(self.limit)} after "
+                    f"status {status} in {latency:.2f}s"
+                )
+        else:
+            self.limit = min(
+                float(self.max_limit), self.limit + 1 / self.limit
+            )
+        self._wake()
+
+    def _record_latency(self, family: str, latency: float) -> bool:
+        """Add a response to the latency averages of its family.
+
+        Args:
+            family (str): Endpoint family of the request
+            latency (float): Seconds the response took
+
+        Returns:
+            bool: Whether recent latency is above latency_tolerance times
+            the long-run latency
+        """
+        samples = self._samples.get(family, 0) + 1
+        self._samples[family] = samples
+        recent = self.recent_latencies.get(family, latency)
+        baseline = self.baseline_latencies.get(family, latency)
+        # Exponential moving averages, weighted to cover about as many
+        # responses as their window, or every response while fewer
+        # have been seen so the first one doesn't dominate
+        recent += (latency - recent) / min(samples, self.short_window)
+        baseline += (latency - baseline) / min(samples, self.long_window)
+        self.recent_latencies[family] = recent
+        self.baseline_latencies[family] = baseline
+        return (
+            samples >= self.short_window
+            and recent > baseline * self.latency_tolerance
+        )
+
+    def abandon(self) -> None:
+        """Free the slot of a request that was cancelled.
+
+        The limit is left alone since the cancellation says nothing
+        about how loaded TDx is.
+        """
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiting requests."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the current state of the limiter.
+
+        Returns:
+            dict: Limit, requests in flight and waiting, and the recent
+            and long-run latency of each endpoint family in seconds
+        """
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "recent_latencies": dict(self.recent_latencies),
+            "baseline_latencies": dict(self.baseline_latencies),
+        }
+
+
+def get_retry_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """Get how long TDx asked us to wait from the response headers.
+
+    Args:
+        headers (Mapping[str, str]): Headers of the response
+
+    Returns:
+        float: Seconds to wait, or None if the headers don't say
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        delay = _parse_header_time(retry_after, relative=True)
+        if delay is not None:
+            return delay
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        return _parse_header_time(reset, relative=False)
+    return None
+
+
+def _parse_header_time(value: str, relative: bool) -> Optional[float]:
+    """Parse a header holding either seconds or a date into a delay.
+
+    Args:
+        value (str): Value of the header
+        relative (bool): Whether a number means seconds from now
+            rather than a unix timestamp
+
+    Returns:
+        float: Seconds from now, or None if the value can't be parsed
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None:
+        if relative:
+            return max(number, 0.0)
+        return max(number - time.time(), 0.0)
+    moment: Any = None
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(moment.timestamp() - time.time(), 0.0)
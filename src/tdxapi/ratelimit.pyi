@@ -0,0 +1,37 @@
+from typing import Any, Mapping, Optional
+
+DEFAULT_RATE_LIMITS: dict[str, tuple[int, float]]
+
+class TokenBucket:
+    rate: int
+    period: float
+    def __init__(self, rate: int, period: float) -> None: ...
+    def reserve(self) -> float: ...
+    def block(self, delay: float) -> None: ...
+
+class RateLimiter:
+    max_rate_limit_retries: int
+    def __init__(self, limits: Optional[Mapping[str, tuple[int, float]]] = ..., max_rate_limit_retries: int = ...) -> None: ...
+    def get_family(self, endpoint: str) -> str: ...
+    async def acquire(self, endpoint: str) -> None: ...
+    def acquire_sync(self, endpoint: str) -> None: ...
+    def update(self, endpoint: str, status: int, headers: Mapping[str, str]) -> None: ...
+
+class AdaptiveConcurrencyLimiter:
+    min_limit: int
+    max_limit: int
+    backoff: float
+    latency_tolerance: float
+    short_window: int
+    long_window: int
+    limit: float
+    in_flight: int
+    recent_latencies: dict[str, float]
+    baseline_latencies: dict[str, float]
+    def __init__(self, initial_limit: int = ..., min_limit: int = ..., max_limit: int = ..., backoff: float = ..., latency_tolerance: float = ..., short_window: int = ..., long_window: int = ...) -> None: ...
+    async def acquire(self) -> float: ...
+    def release(self, started: float, status: Optional[int], family: str = ..., first_started: Optional[float] = ...) -> None: ...
+    def abandon(self) -> None: ...
+    def get_stats(self) -> dict[str, Any]: ...
+
+def get_retry_delay(headers: Mapping[str, str]) -> Optional[float]: ...
@@ -0,0 +1,138 @@
+"""Retry policy for requests to the remote TDx instance."""
+import random
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+from tdxapi import exceptions
+
+DEFAULT_RETRY_STATUSES: frozenset[int] = frozenset({
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+})
+
+
+class RetryPolicy:
+    """Decides when and how long to wait before resending a request.
+
+    Waits grow exponentially with each attempt, are capped at
+    backoff_max, and with jitter enabled are drawn uniformly between zero
+    and the capped wait so many clients don't retry in lockstep.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_multiplier: float = 2.0,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Optional[Iterable[int]] = None,
+        retry_exceptions: tuple[type[BaseException], ...] = (
+            exceptions.TDXCommunicationException,
+        ),
+    ) -> None:
+        """Create a retry policy.
+
+        Args:
+            max_attempts (int, optional):
+            Total times a request is sent, including the first.
+            Defaults to 3.
+
+            backoff_base (float, optional):
+            Seconds to wait before the first retry. Defaults to 0.5.
+
+            backoff_multiplier (float, optional):
+            Factor the wait grows by with each retry. Defaults to 2.0.
+
+            backoff_max (float, optional):
+            Longest wait between attempts in seconds. Defaults to 30.0.
+
+            jitter (bool, optional):
+            Whether to randomize waits. Defaults to True.
+
+            retry_statuses (Iterable[int], optional):
+            Response status codes that are retried.
+            Defaults to DEFAULT_RETRY_STATUSES.
+
+            retry_exceptions (tuple, optional):
+            Exceptions raised while sending that are retried.
+            Defaults to TDXCommunicationException.
+        """
+        if retry_statuses is None:
+            retry_statuses = DEFAULT_RETRY_STATUSES
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_multiplier: float = backoff_multiplier
+        self.backoff_max: float = backoff_max
+        self.jitter: bool = jitter
+        self.retry_statuses: frozenset[int] = frozenset(retry_statuses)
+        self.retry_exceptions: tuple[type[BaseException], ...] = \
+            retry_exceptions
+
+    def get_delay(self, attempt: int) -> float:
+        """Get how long to wait after a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay = min(
+            self.backoff_max,
+            self.backoff_base * self.backoff_multiplier ** (attempt - 1)
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def should_retry_status(self, status: int, attempt: int) -> bool:
+        """Check if a response status should be retried.
+
+        Args:
+            status (int): Status code of the response
+            attempt (int): Number of the attempt, starting at 1
+
+        Returns:
+            bool: True if another attempt should be made
+        """
+        return attempt < self.max_attempts and status in self.retry_statuses
+
+    def should_retry_exception(
+        self,
+        error: BaseException,
+        attempt: int
+    ) -> bool:
+        """Check if an exception raised while sending should be retried.
+
+        Args:
+            error (BaseException): Exception raised by the attempt
+            attempt (int): Number of the attempt, starting at 1
+
+        Returns:
+            bool: True if another attempt should be made
+        """
+        return (
+            attempt < self.max_attempts
+            and isinstance(error, self.retry_exceptions)
+        )
+
+    def is_idempotent(self, request_type: str, endpoint: str) -> bool:
+        """Check if a request is safe to send more than once.
+
+        Gets and searches don't change anything in TDx, so they are
+        retried by default. Other posts are only retried when asked.
+
+        Args:
+            request_type (str): The type of request, eg "get"
+            endpoint (str): Api endpoint of the request
+
+        Returns:
+            bool: True if the request can be retried safely
+        """
+        if request_type == "get":
+            return True
+        path = endpoint.split("?")[0].strip("/")
+        return path.split("/")[-1] == "search"
@@ -0,0 +1,17 @@
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUSES: frozenset[int]
+
+class RetryPolicy:
+    max_attempts: int
+    backoff_base: float
+    backoff_multiplier: float
+    backoff_max: float
+    jitter: bool
+    retry_statuses: frozenset[int]
+    retry_exceptions: tuple[type[BaseException], ...]
+    def __init__(self, max_attempts: int = ..., backoff_base: float = ..., backoff_multiplier: float = ..., backoff_max: float = ..., jitter: bool = ..., retry_statuses: Optional[Iterable[int]] = ..., retry_exceptions: tuple[type[BaseException], ...] = ...) -> None: ...
+    def get_delay(self, attempt: int) -> float: ...
+    def should_retry_status(self, status: int, attempt: int) -> bool: ...
+    def should_retry_exception(self, error: BaseException, attempt: int) -> bool: ...
+    def is_idempotent(self, request_type: str, endpoint: str) -> bool: ...
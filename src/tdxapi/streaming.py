@@ -0,0 +1,151 @@
+"""Incremental decoding of large JSON arrays returned by TDx."""
+import codecs
+import json
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+import aiohttp
+
+
+class JSONArrayDecoder:
+    """Decodes the items of a top-level JSON array as its bytes arrive.
+
+    Only the text of the item currently being decoded is buffered, so
+    memory is bounded by the largest item rather than the whole array.
+    """
+
+    def __init__(self) -> None:
+        """Create a decoder waiting for the start of an array."""
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._text_decoder: codecs.IncrementalDecoder = \
+            codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        # One of "start", "first", "item", "separator" or "done"
+        self._state: str = "start"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Decode the next chunk of the response.
+
+        Args:
+            chunk (bytes): Next bytes of the response body
+
+        Returns:
+            list: Items completed by the chunk
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Finish decoding once the whole response has been fed.
+
+        Raises:
+            ValueError: The response was not a complete JSON array
+
+        Returns:
+            list: Items completed by the end of the response
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state != "done":
+            raise ValueError("Response ended before the JSON array did")
+        return items
+
+    def _drain(self, final: bool) -> list[Any]:
+        """Decode every complete item in the buffer.
+
+        Args:
+            final (bool): Whether no more data will be fed
+
+        Returns:
+            list: Items decoded from the buffer
+        """
+        items: list[Any] = []
+        buffer = self._buffer
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position >= len(buffer):
+                break
+            character = buffer[position]
+            if self._state == "done":
+                raise ValueError("Unexpected data after the JSON array")
+            if self._state == "start":
+                if character != "[":
+                    raise ValueError("Response is not a JSON array")
+                self._state = "first"
+                position += 1
+                continue
+            if self._state in ("first", "separator") and character == "]":
+                self._state = "done"
+                position += 1
+                continue
+            if self._state == "separator":
+                if character != ",":
+                    raise ValueError(f"Expected ',' in array, got {character}")
+                self._state = "item"
+                position += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # A number may continue in the next chunk unless something
+            # ends it, objects, arrays and strings are closed explicitly
+            if (
+                not final
+                and not isinstance(item, (dict, list, str))
+                and (end == len(buffer) or buffer[end] not in ",] \t\r\n")
+            ):
+                break
+            items.append(item)
+            position = end
+            self._state = "separator"
+        self._buffer = buffer[position:]
+        return items
+
+
+def iter_json_array_chunks(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the items of a JSON array from chunks of its bytes.
+
+    Works with any iterable of bytes, eg requests' Response.iter_content.
+
+    Args:
+        chunks (Iterable[bytes]): Chunks of the JSON text
+
+    Yields:
+        Any: Each item of the array, in order
+    """
+    decoder = JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def iter_json_array(
+    response: aiohttp.ClientResponse,
+    chunk_size: int = 65536,
+) -> AsyncIterator[Any]:
+    """Yield the items of a JSON array response as it is downloaded.
+
+    The response is released when iteration stops, even if it stops
+    before the end of the array.
+
+    Args:
+        response (aiohttp.ClientResponse): Response whose body is an array
+        chunk_size (int, optional): Bytes read at a time. Defaults to 64KiB.
+
+    Yields:
+        Any: Each item of the array, in order
+    """
+    decoder = JSONArrayDecoder()
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            for item in decoder.feed(chunk):
+                yield item
+        for item in decoder.close():
+            yield item
+    finally:
+        response.release()
@@ -0,0 +1,10 @@
+import aiohttp
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+class JSONArrayDecoder:
+    def __init__(self) -> None: ...
+    def feed(self, chunk: bytes) -> list[Any]: ...
+    def close(self) -> list[Any]: ...
+
+def iter_json_array_chunks(chunks: Iterable[bytes]) -> Iterator[Any]: ...
+def iter_json_array(response: aiohttp.ClientResponse, chunk_size: int = ...) -> AsyncIterator[Any]: ...
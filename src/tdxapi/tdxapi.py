@@ -1,16 +1,37 @@
 """Team Dynamix API as a Python Module."""
 import asyncio
+import hashlib
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    NoReturn,
+    Optional,
+    Union,
+)
 
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import logging.config
 from tdxapi import exceptions
+from tdxapi.bulk import BulkResult, gather_bounded, iter_bounded
+from tdxapi.cache import ResponseCache
+from tdxapi.codec import JSONCodec
+from tdxapi.idcache import IDCache
+from tdxapi.jobs import JobRunner
+from tdxapi.models import Asset, Person, Ticket
+from tdxapi.people import PeopleDirectory
+from tdxapi.ratelimit import AdaptiveConcurrencyLimiter, RateLimiter
+from tdxapi.retry import RetryPolicy
+from tdxapi.streaming import iter_json_array
 import json
 import jwt
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import os
 import time
 logging.basicConfig(
@@ -41,6 +62,9 @@ class TeamDynamixInstance:
     """
 
     no_owner_uid: str = "00000000-0000-0000-0000-000000000000"
+    # Most assets whose last known state is kept for skipping unchanged
+    # updates
+    _asset_state_limit: int = 100000
     # These are hardcoded into the API
     _component_ids: dict[str, int] = {"Ticket": 9, "Asset": 27}
     # This is used to construct a name -> id dictionary so descriptive names
@@ -98,6 +122,18 @@ class TeamDynamixInstance:
         default_ticket_app_name: str = "",
         default_asset_app_name: str = "",
         api_session: Optional[aiohttp.ClientSession] = None,
+        max_connections_per_host: int = 10,
+        dns_cache_ttl: int = 300,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: float = 10,
+        token_refresh_margin: float = 60,
+        id_cache: Optional[IDCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        people_directory: Optional[PeopleDirectory] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ) -> None:
         """Create a new TDx object to interact with the remote instance.
 
@@ -121,19 +157,111 @@ class TeamDynamixInstance:
             default_asset_app_name (str, optional):
             Asset app to use when none is defined.
             Default to None.
+
+            api_session (aiohttp.ClientSession, optional):
+            Session to use for async requests instead of creating one.
+            Defaults to None.
+
+            max_connections_per_host (int, optional):
+            Number of keep-alive connections pooled for the TDx host,
+            shared by the sync and async request paths. Defaults to 10.
+
+            dns_cache_ttl (int, optional):
+            Seconds to cache DNS lookups for the async session.
+            Defaults to 300.
+
+            rate_limiter (RateLimiter, optional):
+            Scheduler keeping requests within TDx rate limits.
+            Defaults to a RateLimiter with the default TDx limits.
+
+            retry_policy (RetryPolicy, optional):
+            Policy for resending failed gets and searches.
+            Defaults to a RetryPolicy with its default settings.
+
+            timeout (float, optional):
+            Seconds to wait for a response before giving up on an
+            attempt. Defaults to 10.
+
+            token_refresh_margin (float, optional):
+            Seconds before the auth token expires that it is refreshed.
+            Defaults to 60.
+
+            id_cache (IDCache, optional):
+            On-disk cache of the name to ID dictionaries built by
+            initialize(). Defaults to None, which always fetches them.
+
+            response_cache (ResponseCache, optional):
+            Read-through cache for get_asset, get_person and get_ticket.
+            Defaults to None, which disables caching.
+
+            coalesce_requests (bool, optional):
+            Whether identical gets and searches in flight at the same
+            time share one request. Defaults to True.
+
+            json_codec (JSONCodec, optional):
+            Codec used to encode request bodies and decode responses,
+            eg tdxapi.codec.get_fastest_codec(). Defaults to the
+            standard library json module.
+
+            people_directory (PeopleDirectory, optional):
+            Cache of people used by search_person, get_person and
+            resolve_people. Defaults to None, which disables caching.
+
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional):
+            Limit on async requests in flight that adapts to latency and
+            429s. Defaults to an AdaptiveConcurrencyLimiter with its
+            default settings.
         """
         logging.debug("Creating TDx instance")
         self._domain: str = domain
-        self._auth_token: str = auth_token
+        self._auth_token: str = ""
+        self._reauth_time: float = 0
+        self._token_refresh_margin: float = token_refresh_margin
+        self._login_task: Optional[asyncio.Future[None]] = None
+        self._refresh_task: Optional[asyncio.Future[None]] = None
+        if auth_token:
+            self.set_auth_token(auth_token)
         self._sandbox: bool = sandbox
         self._content: dict[str, Any] = {}
         self._default_ticket_app_name: str = default_ticket_app_name
         self._default_asset_app_name: str = default_asset_app_name
         self._api_session: aiohttp.ClientSession | None = api_session
+        self._session: requests.Session | None = None
+        self._max_connections_per_host: int = max_connections_per_host
+        self._dns_cache_ttl: int = dns_cache_ttl
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+        self._rate_limiter: RateLimiter = rate_limiter
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self._retry_policy: RetryPolicy = retry_policy
+        self._timeout: float = timeout
+        self._id_cache: Optional[IDCache] = id_cache
+        self._response_cache: Optional[ResponseCache] = response_cache
+        self._coalesce_requests: bool = coalesce_requests
+        if json_codec is None:
+            json_codec = JSONCodec()
+        self._json_codec: JSONCodec = json_codec
+        self._people_directory: Optional[PeopleDirectory] = people_directory
+        self._write_stats: dict[str, int] = {"sent": 0, "skipped": 0}
+        # Fingerprint of the last fetched or written state by asset
+        # endpoint, oldest first
+        self._asset_states: dict[str, int] = {}
+        if concurrency_limiter is None:
+            concurrency_limiter = AdaptiveConcurrencyLimiter()
+        self._concurrency_limiter: AdaptiveConcurrencyLimiter = \
+            concurrency_limiter
+        self._attribute_names: dict[
+            str, tuple[dict[str, Any], int, dict[Any, str]]
+        ] = {}
+        self._inflight_requests: dict[
+            str, asyncio.Future[aiohttp.ClientResponse]
+        ] = {}
+        self._id_tasks: dict[tuple[str, str], asyncio.Future[None]] = {}
 
     async def load_ids(self, filename: str = "manual_ids.json") -> None:
-        with open(filename, 'r') as file:
-            ids = json.load(file)
+        with open(filename, 'rb') as file:
+            ids = self._json_codec.loads(file.read())
         for app in ids:
             if (app["Name"] not in self._content.keys()):
                 self._content[app["Name"]] = {}
@@ -177,12 +305,45 @@ class TeamDynamixInstance:
         """
         logging.debug(f"Getting id for {name} in {app_name}")
         if id_type:
+            if self._get_loaded_ids(id_type, app_name) is None:
+                self._populate_ids_sync(id_type, app_name)
             logging.debug(f"Found id {self._content[app_name][id_type][name]}")
             return self._content[app_name][id_type][name]
         else:
+            if self._get_loaded_ids(app_name) is None:
+                if app_name == "GroupIDs":
+                    self._populate_group_ids_sync()
+                elif app_name in self._populating_dict:
+                    self._populate_ids_sync(app_name)
             logging.debug(f"Found id {self._content[app_name][name]}")
             return self._content[app_name][name]
 
+    async def get_id_async(
+        self,
+        app_name: str,
+        name: str,
+        id_type: Optional[str] = None
+    ) -> str:
+        """Convert a name to an ID, fetching the IDs on first use.
+
+        Args:
+            app_name (str): App to search for the ID with given name
+            id_type (str): Type of the ID (ie AssetStatusIDs)
+            name (str): Name to convert to ID
+
+        Returns:
+            str: ID of the object
+        """
+        logging.debug(f"Getting id for {name} in {app_name}")
+        if id_type:
+            ids = await self._ensure_ids(id_type, app_name)
+        elif app_name in self._populating_dict or app_name == "GroupIDs":
+            ids = await self._ensure_ids(app_name)
+        else:
+            ids = self._content[app_name]
+        logging.debug(f"Found id {ids[name]}")
+        return ids[name]
+
     def get_default_app_name(self, app_type: str) -> str:
         """Get the default name of an app type.
 
@@ -200,10 +361,15 @@ class TeamDynamixInstance:
         raise exceptions.InvalidParameterException
 
     async def close_api_session(self) -> None:
-        """Close the API session."""
+        """Close the API sessions and their pooled connections."""
+        await self.stop_token_refresh()
         logging.debug("Closing client session")
         if isinstance(self._api_session, aiohttp.ClientSession):
             await self._api_session.close()
+        self._api_session = None
+        if isinstance(self._session, requests.Session):
+            self._session.close()
+        self._session = None
 
     def set_auth_token(self, token: str) -> None:
         """Set authentication token.
@@ -225,6 +391,69 @@ class TeamDynamixInstance:
                         f"{datetime.fromtimestamp(decoded_jwt['exp'])}")
         self._reauth_time = decoded_jwt['exp']
 
+    def _token_needs_refresh(self) -> bool:
+        """Check if the auth token expires within the refresh margin.
+
+        Returns:
+            bool: True if the token should be refreshed
+        """
+        return self._reauth_time - self._token_refresh_margin < time.time()
+
+    async def _refresh_auth_token(self) -> None:
+        """Log in again if the auth token is about to expire.
+
+        Refreshing is single-flight: the first caller to notice the token
+        is expiring starts the login and every other caller waits on that
+        same login instead of sending its own.
+        """
+        if not self._token_needs_refresh():
+            return
+        if self._login_task is None or self._login_task.done():
+            logging.debug("Auth token expiring, reauthenticating...")
+            self._login_task = asyncio.ensure_future(self.login())
+        await asyncio.shield(self._login_task)
+
+    async def _auto_refresh_auth_token(self) -> None:
+        """Refresh the auth token shortly before it expires, forever."""
+        while True:
+            delay = self._reauth_time - self._token_refresh_margin \
+                - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self._refresh_auth_token()
+            except (
+                exceptions.NotAuthorizedException,
+                exceptions.TDXCommunicationException,
+            ):
+                logging.error("Background reauthentication failed")
+                await asyncio.sleep(self._token_refresh_margin)
+
+    def start_token_refresh(self) -> None:
+        """Start refreshing the auth token in the background.
+
+        The token is refreshed token_refresh_margin seconds before it
+        expires, so requests never have to wait on a login. Must be
+        called from a running event loop.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            logging.debug("Starting background token refresh")
+            self._refresh_task = asyncio.ensure_future(
+                self._auto_refresh_auth_token()
+            )
+
+    async def stop_token_refresh(self) -> None:
+        """Stop refreshing the auth token in the background."""
+        if self._refresh_task is None:
+            return
+        logging.debug("Stopping background token refresh")
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
     def get_current_user(self) -> dict[str, Any]:
         """Get current TDx user.
 
@@ -238,15 +467,38 @@ class TeamDynamixInstance:
         response: requests.Response = self._make_request(
             "get", "auth/getuser", True)
         if response.ok:
-            user = response.json()
+            user = self._read_json_sync(response)
+            return user
+        self._raise_not_authorized(response.status_code, response.text)
+
+    async def get_current_user_async(self) -> dict[str, Any]:
+        """Get current TDx user without blocking the event loop.
+
+        Returns:
+            dict: The current user
+        """
+        logging.debug("Getting current TDx user")
+        response: aiohttp.ClientResponse = await self._make_async_request(
+            "get", "auth/getuser", True)
+        if response.ok:
+            user = await self._read_json(response)
             return user
-        if response.status_code == HTTPStatus.UNAUTHORIZED:
+        self._raise_not_authorized(response.status, await response.text())
+
+    def _raise_not_authorized(self, status: int, text: str) -> NoReturn:
+        """Log why the current user could not be retrieved and raise.
+
+        Args:
+            status (int): Status code of the response
+            text (str): Body of the response
+        """
+        if status == HTTPStatus.UNAUTHORIZED:
             logging.error("TDx auth_key is not authorized")
             raise exceptions.NotAuthorizedException
 
         logging.error(
             f"Something went wrong \
-                checking authentication: {response.text}"
+                checking authentication: {text}"
         )
         raise exceptions.NotAuthorizedException
 
@@ -275,40 +527,23 @@ class TeamDynamixInstance:
         self._domain = domain
 
     async def initialize(self) -> None:
-        """Initialize the TDx instance from the remote instance."""
+        """Initialize the TDx instance from the remote instance.
+
+        Populates the instance-wide IDs. Per-app IDs like TicketStatusIDs
+        are populated on first use, or with populate_ids_for_app().
+        """
         logging.debug(f"Initializing TDx instance for {self.get_domain()}")
         tasks: list[Any] = []
         tasks.append(self._populate_ids("AppIDs"))
         tasks.append(self._populate_ids("LocationIDs"))
         tasks.append(self._populate_ids("AssetAttributes"))
         tasks.append(self._populate_ids("TicketAttributes"))
+        tasks.append(self._populate_group_ids())
 
         logging.debug("Running initilization tasks")
         await asyncio.gather(*tasks)
-        logging.debug("First init tasks complete")
-        tasks = []
-        if self._default_asset_app_name:
-            tasks.append(self.populate_ids_for_app(
-                "AssetStatusIDs",
-                self._default_asset_app_name
-            ))
-            tasks.append(self.populate_ids_for_app(
-                "AssetFormIDs",
-                self._default_asset_app_name
-            ))
-        if self._default_ticket_app_name:
-            tasks.append(self.populate_ids_for_app(
-                "TicketStatusIDs",
-                self._default_ticket_app_name
-            ))
-            tasks.append(self.populate_ids_for_app(
-                "TicketFormIDs",
-                self._default_ticket_app_name
-            ))
-
-        await asyncio.gather(*tasks)
-        logging.debug("Second init tasks complete")
-        self._populate_group_ids()
+        # Status and form IDs are per app, so they are fetched the first
+        # time an app's IDs are looked up instead of here
         logging.debug("Initialization complete")
 
     async def _populate_all_ids(self) -> None:
@@ -370,13 +605,18 @@ class TeamDynamixInstance:
     async def get_asset(
             self,
             asset_id: str,
-            app_name: str = ""
-    ) -> dict[str, Any]:
+            app_name: str = "",
+            typed: bool = False,
+            cached: bool = True
+    ) -> Union[dict[str, Any], Asset]:
         """Fetch an asset and returns it in dictionary form.
 
         Args:
             app_name (str): App the asset exists in
             asset_id (str): Internal TDx ID of the asset
+            typed (bool): Return an Asset record instead of a dictionary
+            cached (bool): Use a copy in the response cache if there is
+                one, the fetched copy is cached either way
 
         Returns:
             dict: Asset as dictionary, includes custom attributes
@@ -385,12 +625,99 @@ class TeamDynamixInstance:
         if not app_name:
             app_name = self._default_asset_app_name
         app_id = self._content["AppIDs"][app_name]
-        response = await self._make_async_request(
-            "get", f"{app_id}/assets/{asset_id}"
-        )
-        asset = await response.json()
+        endpoint = f"{app_id}/assets/{asset_id}"
+        asset = self._read_cache("asset", endpoint) if cached else None
+        if asset is None:
+            asset = await self._fetch_asset(asset_id, endpoint)
+        if typed:
+            return Asset.from_dict(asset)
+        return asset
+
+    async def _fetch_asset(
+        self,
+        asset_id: str,
+        endpoint: str
+    ) -> dict[str, Any]:
+        """Fetch an asset from TDx and cache it.
+
+        Args:
+            asset_id (str): Internal TDx ID of the asset
+            endpoint (str): Endpoint of the asset
+
+        Returns:
+            dict: Asset as dictionary, includes custom attributes
+        """
+        response = await self._make_async_request("get", endpoint)
+        if response.status == HTTPStatus.NOT_FOUND:
+            logging.error(f"Asset {asset_id} does not exist")
+            raise exceptions.ObjectNotFoundException
+        if not response.ok:
+            logging.error(f"Unable to get asset: {await response.text()}")
+            raise exceptions.RequestFailedException
+        asset = await self._read_json(response)
+        self._write_cache("asset", endpoint, asset)
+        self._set_asset_state(endpoint, asset)
         return asset
 
+    async def get_assets(
+        self,
+        asset_ids: Iterable[str],
+        app_name: str = "",
+        concurrency: int = 10,
+        typed: bool = False,
+    ) -> list[BulkResult]:
+        """Fetch many assets concurrently.
+
+        A failure to fetch one asset is recorded in its result instead of
+        failing the whole batch.
+
+        Args:
+            asset_ids (Iterable[str]): Internal TDx IDs of the assets
+            app_name (str): App the assets exist in
+            concurrency (int): Most assets fetched at once
+            typed (bool): Return Asset records instead of dictionaries
+
+        Returns:
+            list[BulkResult]: Result for each asset in the order given,
+            with the asset dictionary as the result
+        """
+        return await gather_bounded(
+            asset_ids,
+            lambda asset_id: self.get_asset(asset_id, app_name, typed),
+            concurrency,
+        )
+
+    async def iter_assets(
+        self,
+        asset_ids: Iterable[str],
+        app_name: str = "",
+        concurrency: int = 10,
+        typed: bool = False,
+        cached: bool = True,
+    ) -> AsyncIterator[BulkResult]:
+        """Fetch many assets concurrently, yielding them as they arrive.
+
+        Args:
+            asset_ids (Iterable[str]): Internal TDx IDs of the assets
+            app_name (str): App the assets exist in
+            concurrency (int): Most assets fetched at once
+            typed (bool): Return Asset records instead of dictionaries
+            cached (bool): Use copies in the response cache if there are
+                any
+
+        Yields:
+            BulkResult: Result for each asset in the order they finish,
+            with the asset dictionary as the result
+        """
+        async for result in iter_bounded(
+            asset_ids,
+            lambda asset_id: self.get_asset(
+                asset_id, app_name, typed, cached
+            ),
+            concurrency,
+        ):
+            yield result
+
     async def search_assets(
         self, search_string: str, app_name: str = ""
     ) -> list[dict[str, Any]]:
@@ -415,33 +742,167 @@ class TeamDynamixInstance:
         response: aiohttp.ClientResponse = await self._make_async_request(
             "post", f"{app_id}/assets/search", body=body
         )
-        assets = await response.json()
+        assets = await self._read_json(response)
         return assets
 
+    async def iter_search_assets(
+        self,
+        search_string: str,
+        app_name: str = "",
+        criteria: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Find assets, yielding them as the response is downloaded.
+
+        Works like search_assets() but decodes the response incrementally,
+        so searches with many results only hold one asset at a time.
+
+        Args:
+            app_name (str): App to search in
+            search_string (str): Name or Serial of the asset to be searched for
+            criteria (dict): Other TDx asset search criteria to send
+
+        Yields:
+            dict: Dictionaries representing assets,
+            does not include custom attributes
+        """
+        if not app_name:
+            app_name = self._default_asset_app_name
+        app_id = self._content["AppIDs"][app_name]
+        body = {"SerialLike": search_string}
+        if criteria:
+            body.update(criteria)
+        response: aiohttp.ClientResponse = await self._make_async_request(
+            "post", f"{app_id}/assets/search", body=body, stream=True
+        )
+        if not response.ok:
+            logging.error(f"Unable to search assets: {await response.text()}")
+            raise exceptions.RequestFailedException
+        async for asset in iter_json_array(response):
+            yield asset
+
     async def update_asset(
-        self, asset: dict[str, Any], app_name: str = ""
-    ) -> aiohttp.ClientResponse:
+        self,
+        asset: dict[str, Any],
+        app_name: str = "",
+        skip_unchanged: bool = False
+    ) -> Optional[aiohttp.ClientResponse]:
         """Update an asset in TDx.
 
         Args:
             app_name (str): App the asset to be updated exists in
             asset (dict): Asset with updated values to be synced with TDx
+            skip_unchanged (bool): Don't send the update if the asset is
+                identical to how it was last fetched or written, see
+                is_asset_unchanged()
 
         Returns:
             requests.Response:
             The response from the remote TDx instance,
-            can be used for error handling but typically unconsumed
+            can be used for error handling but typically unconsumed.
+            None if the update was skipped
         """
         if not app_name:
             app_name = self._default_asset_app_name
         app_id = self._content["AppIDs"][app_name]
+        endpoint = f"{app_id}/assets/{asset['ID']}"
+        if skip_unchanged and self.is_asset_unchanged(asset, app_name):
+            logging.debug(f"Asset {asset['ID']} is unchanged, skipping")
+            self._write_stats["skipped"] += 1
+            return None
         response = await self._make_async_request(
-            "post", f"{app_id}/assets/{asset['ID']}", body=asset
+            "post", endpoint, body=asset
         )
+        self._write_stats["sent"] += 1
+        self._invalidate_cache("asset", endpoint)
         if not response.ok:
-            logging.error(f"Unable to update asset: {response.text()}")
+            logging.error(f"Unable to update asset: {await response.text()}")
+            self._asset_states.pop(endpoint, None)
+            return response
+        self._set_asset_state(endpoint, asset)
+        if self._response_cache is not None:
+            # TDx returns the updated asset, so later gets can use it
+            updated = await self._read_json(response)
+            self._write_cache("asset", endpoint, updated)
         return response
 
+    def is_asset_unchanged(
+        self, asset: dict[str, Any], app_name: str = ""
+    ) -> bool:
+        """Check if updating an asset would change nothing.
+
+        Compares the asset with the state it was last fetched in or
+        written with through this instance. Custom attributes are
+        compared by ID and value, in any order. Assets this instance
+        hasn't seen, or has forgotten after the most recent
+        _asset_state_limit assets, count as changed.
+
+        Args:
+            asset (dict): Asset as it would be sent to TDx
+            app_name (str): App the asset exists in
+
+        Returns:
+            bool: True if the asset is known to be unchanged
+        """
+        if not app_name:
+            app_name = self._default_asset_app_name
+        app_id = self._content["AppIDs"][app_name]
+        state = self._asset_states.get(f"{app_id}/assets/{asset['ID']}")
+        return state is not None and state == _get_asset_fingerprint(asset)
+
+    def _set_asset_state(self, endpoint: str, asset: dict[str, Any]) -> None:
+        """Remember the state of an asset in TDx.
+
+        Args:
+            endpoint (str): Endpoint of the asset
+            asset (dict): Asset as it is in TDx
+        """
+        # Move to the end so the least recently seen asset is dropped
+        self._asset_states.pop(endpoint, None)
+        self._asset_states[endpoint] = _get_asset_fingerprint(asset)
+        if len(self._asset_states) > self._asset_state_limit:
+            del self._asset_states[next(iter(self._asset_states))]
+
+    async def import_assets(
+        self,
+        assets: list[dict[str, Any]],
+        app_name: str = "",
+        settings: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Update many assets with one bulk import.
+
+        Args:
+            assets (list[dict]): Assets with updated values
+            app_name (str): App the assets exist in
+            settings (dict): Import settings from TDx docs,
+                defaults to only updating existing assets
+
+        Raises:
+            RequestFailedException: TDx rejected the import
+
+        Returns:
+            Any: Import result returned by TDx
+        """
+        if not app_name:
+            app_name = self._default_asset_app_name
+        app_id = self._content["AppIDs"][app_name]
+        if settings is None:
+            settings = {"CreateItems": False, "UpdateItems": True}
+        logging.info(f"Importing {len(assets)} assets into {app_name}")
+        response = await self._make_async_request(
+            "post",
+            f"{app_id}/assets/import",
+            body={"Items": assets, "Settings": settings},
+        )
+        for asset in assets:
+            endpoint = f"{app_id}/assets/{asset['ID']}"
+            self._invalidate_cache("asset", endpoint)
+            # Imports can fail for single assets, so their state is unknown
+            self._asset_states.pop(endpoint, None)
+        if not response.ok:
+            logging.error(f"Unable to import assets: {await response.text()}")
+            raise exceptions.RequestFailedException
+        return await self._read_json(response)
+
     ###################
     #                 #
     #     Tickets     #
@@ -465,23 +926,150 @@ class TeamDynamixInstance:
             requests.Response: Response from TDx,
             can be used for error handling
         """
-        if not ticket_app_name:
-            ticket_app_name = self._default_ticket_app_name
-        app_id = self._content["AppIDs"][ticket_app_name]
-        response = self._make_request(
-            "post", f"{app_id}/tickets/{ticket_id}/assets/{asset_id}"
+        endpoint = self._attach_asset_endpoint(
+            ticket_id, asset_id, ticket_app_name
         )
+        response = self._make_request("post", endpoint)
         if not response.ok:
-            logging.error(
-                f"Unable to attach asset {asset_id} to ticket {ticket_id}:\
-                    {response.text}"
-            )
-            raise exceptions.UnableToAttachAssetException(
-                ticket_id,
-                asset_id
+            self._raise_unable_to_attach(ticket_id, asset_id, response.text)
+        return response
+
+    async def attach_asset_to_ticket_async(
+        self,
+        ticket_id: str,
+        asset_id: str,
+        ticket_app_name: str = "",
+    ) -> aiohttp.ClientResponse:
+        """Attaches an asset to a ticket without blocking the event loop.
+
+        Args:
+            ticket_app_name (str): App name the ticket exists in
+            ticket_id (str): Ticket number of the ticket to attach the asset to
+            asset_id (str): Internal TDx ID of the asset to be attached
+
+        Returns:
+            aiohttp.ClientResponse: Response from TDx,
+            can be used for error handling
+        """
+        endpoint = self._attach_asset_endpoint(
+            ticket_id, asset_id, ticket_app_name
+        )
+        response = await self._make_async_request("post", endpoint)
+        if not response.ok:
+            self._raise_unable_to_attach(
+                ticket_id, asset_id, await response.text()
             )
         return response
 
+    async def attach_assets(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        ticket_app_name: str = "",
+        concurrency: int = 10,
+    ) -> list[BulkResult]:
+        """Attach many assets to tickets concurrently.
+
+        The assets already attached to each ticket are fetched first and
+        those attachments are counted as successes without posting them
+        again. A failure to attach one asset is recorded in its result
+        instead of failing the whole batch.
+
+        Args:
+            pairs (Iterable[tuple[str, str]]): Ticket number and internal
+                TDx asset ID of each attachment
+            ticket_app_name (str): App name the tickets exist in
+            concurrency (int): Most requests sent at once
+
+        Returns:
+            list[BulkResult]: Result for each pair in the order given,
+            "attached" or "already attached" on success
+        """
+        pairs = [(str(ticket), str(asset)) for ticket, asset in pairs]
+        tickets = list(dict.fromkeys(ticket for ticket, _ in pairs))
+        attached: dict[str, set[str]] = {}
+        for outcome in await gather_bounded(
+            tickets,
+            lambda ticket: self.get_ticket_assets(ticket, ticket_app_name),
+            concurrency,
+        ):
+            if not outcome.ok:
+                # Try attaching anyway, the attachment reports any error
+                continue
+            attached[outcome.item] = {
+                str(item.get("BackingItemID")) for item in outcome.result
+            }
+
+        missing = [
+            pair for pair in dict.fromkeys(pairs)
+            if pair[1] not in attached.get(pair[0], ())
+        ]
+        logging.info(
+            f"Attaching {len(missing)} of {len(pairs)} assets to tickets"
+        )
+        failures: dict[tuple[str, str], Exception] = {}
+        for outcome in await gather_bounded(
+            missing,
+            lambda pair: self.attach_asset_to_ticket_async(
+                pair[0], pair[1], ticket_app_name
+            ),
+            concurrency,
+        ):
+            if outcome.error is not None:
+                failures[outcome.item] = outcome.error
+
+        results: list[BulkResult] = []
+        for index, pair in enumerate(pairs):
+            if pair in failures:
+                results.append(BulkResult(pair, index, error=failures[pair]))
+            elif pair[1] in attached.get(pair[0], ()):
+                results.append(BulkResult(pair, index, "already attached"))
+            else:
+                results.append(BulkResult(pair, index, "attached"))
+        return results
+
+    def _attach_asset_endpoint(
+        self,
+        ticket_id: str,
+        asset_id: str,
+        ticket_app_name: str = "",
+    ) -> str:
+        """Build the endpoint for attaching an asset to a ticket.
+
+        Args:
+            ticket_id (str): Ticket number of the ticket to attach the asset to
+            asset_id (str): Internal TDx ID of the asset to be attached
+            ticket_app_name (str): App name the ticket exists in
+
+        Returns:
+            str: Endpoint to post to
+        """
+        if not ticket_app_name:
+            ticket_app_name = self._default_ticket_app_name
+        app_id = self._content["AppIDs"][ticket_app_name]
+        return f"{app_id}/tickets/{ticket_id}/assets/{asset_id}"
+
+    def _raise_unable_to_attach(
+        self,
+        ticket_id: str,
+        asset_id: str,
+        text: str
+    ) -> NoReturn:
+        """Log a failed attachment and raise.
+
+        Args:
+            ticket_id (str): Ticket number the asset was attached to
+            asset_id (str): Internal TDx ID of the asset
+            text (str): Body of the response
+        """
+        logging.error(
+            f"Unable to attach asset {asset_id} to ticket {ticket_id}:\
+                {text}"
+        )
+        raise exceptions.UnableToAttachAssetException(
+            ticket_id,
+            asset_id
+        )
+
     async def get_ticket_assets(
             self,
             ticket_id: str,
@@ -496,6 +1084,9 @@ class TeamDynamixInstance:
             ticket_id (str): Ticket number to get assets for
             app_name (str): Name of the ticket app to search for ticket in
 
+        Raises:
+            RequestFailedException: The assets could not be retrieved
+
         Returns:
             list: List of dictionaries representing configuration items
         """
@@ -506,7 +1097,13 @@ class TeamDynamixInstance:
         response = await self._make_async_request(
             "get", f"{app_id}/tickets/{ticket_id}/assets"
         )
-        conf_items = await response.json()
+        if not response.ok:
+            logging.error(
+                f"Unable to get assets of ticket {ticket_id}: "
+                f"{await response.text()}"
+            )
+            raise exceptions.RequestFailedException
+        conf_items = await self._read_json(response)
 
         return conf_items
 
@@ -515,56 +1112,290 @@ class TeamDynamixInstance:
         title: str,
         criteria: dict[str, Any],
         app_name: str = "",
+        page_size: int = 1000,
     ) -> list[dict[str, Any]]:
         """Search for ticket.
 
         Searches a ticket application for a ticket matching the given\
-            search criteria
+            search criteria. Pages through the results the same way as
+            iter_search_tickets().
 
         Args:
             app_name (str): Name of the ticket application
-            title (str): Title of the ticket
+            title (str): Title of the ticket, empty to match any
             criteria (dict): Dictionary matching search criteria from TDx docs
+            page_size (int): Most tickets requested per search
 
         Returns:
             list: A list of dictionaries representing tickets
         """
-        if not app_name:
-            app_name = self._default_ticket_app_name
-
-        app_id = self._content["AppIDs"][app_name]
-
-        response = self._make_request(
-            "post", f"{app_id}/tickets/search", body=criteria
+        endpoint = self._ticket_endpoint("search", app_name)
+        search = _TicketSearch(
+            self._get_title_criteria(title, criteria), title, page_size
         )
-        tickets = response.json()
-
-        # TDx search doesn't let us search by title,
-        # so we filter the list for tickets with matching title
-        filtered_tickets: list[dict[str, Any]] = []
-        for ticket in tickets:
-            if ticket["Title"] == title:
-                filtered_tickets.append(ticket)
-        return filtered_tickets
-
-    def get_ticket(self, ticket_id: str, app_name: str = "") -> dict[str, Any]:
-        """Get full ticket.
-
-        Gets a full ticket based on ID, includes custom attributes
+        tickets: list[dict[str, Any]] = []
+        for body in search:
+            response = self._make_request("post", endpoint, body=body)
+            if not response.ok:
+                logging.error(f"Unable to search tickets: {response.text}")
+                raise exceptions.RequestFailedException
+            for ticket in self._read_json_sync(response):
+                if search.add(ticket):
+                    tickets.append(ticket)
+        return tickets
+
+    async def search_tickets_async(
+        self,
+        title: str,
+        criteria: dict[str, Any],
+        app_name: str = "",
+    ) -> list[dict[str, Any]]:
+        """Search for ticket without blocking the event loop.
 
         Args:
-            app_name (str): Name of the ticket app the ticket exists in
-            ticket_id (str): Ticket number
+            app_name (str): Name of the ticket application
+            title (str): Title of the ticket
+            criteria (dict): Dictionary matching search criteria from TDx docs
 
         Returns:
-            dict: Dictionary representing the ticket
+            list: A list of dictionaries representing tickets
         """
-        if not app_name:
-            app_name = self._default_ticket_app_name
-        app_id = self._content["AppIDs"][app_name]
-        response = self._make_request("get", f"{app_id}/tickets/{ticket_id}")
-        ticket = response.json()
-        return ticket
+        return [
+            ticket async for ticket in self.iter_search_tickets(
+                title, criteria, app_name
+            )
+        ]
+
+    async def iter_search_tickets(
+        self,
+        title: str,
+        criteria: dict[str, Any],
+        app_name: str = "",
+        page_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Search for tickets page by page, yielding them as they arrive.
+
+        TDx ticket search has no offset to page with, so the search is
+        split into windows of creation date that each return at most
+        page_size tickets. A window that comes back full is split in half
+        and searched again until every window fits. Tickets created
+        before CreatedDateFrom, or at any time if it isn't given, are
+        found by searching further back until a window isn't full. A
+        MaxResults in the criteria caps the tickets yielded. Tickets are
+        decoded as they are downloaded, so the full results are never
+        held.
+
+        Args:
+            title (str): Title of the ticket, empty to match any
+            criteria (dict): Dictionary matching search criteria from TDx docs
+            app_name (str): Name of the ticket application
+            page_size (int): Most tickets requested per search
+
+        Yields:
+            dict: Dictionaries representing matching tickets
+        """
+        endpoint = self._ticket_endpoint("search", app_name)
+        search = _TicketSearch(
+            self._get_title_criteria(title, criteria), title, page_size
+        )
+        for body in search:
+            response = await self._make_async_request(
+                "post", endpoint, body=body, stream=True
+            )
+            if not response.ok:
+                logging.error(
+                    f"Unable to search tickets: {await response.text()}"
+                )
+                raise exceptions.RequestFailedException
+
+            async for ticket in iter_json_array(response):
+                if search.add(ticket):
+                    yield ticket
+                if search.done:
+                    return
+
+    def _get_title_criteria(
+        self,
+        title: str,
+        criteria: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Add the title to search criteria so TDx filters by it.
+
+        Args:
+            title (str): Title of the ticket
+            criteria (dict): Dictionary matching search criteria from TDx docs
+
+        Returns:
+            dict: Copy of the criteria that also searches for the title
+        """
+        search = dict(criteria)
+        if title and "SearchText" not in search:
+            search["SearchText"] = title
+        return search
+
+    def get_ticket(
+        self,
+        ticket_id: str,
+        app_name: str = "",
+        typed: bool = False
+    ) -> Union[dict[str, Any], Ticket]:
+        """Get full ticket.
+
+        Gets a full ticket based on ID, includes custom attributes
+
+        Args:
+            app_name (str): Name of the ticket app the ticket exists in
+            ticket_id (str): Ticket number
+            typed (bool): Return a Ticket record instead of a dictionary
+
+        Returns:
+            dict: Dictionary representing the ticket
+        """
+        endpoint = self._ticket_endpoint(ticket_id, app_name)
+        ticket = self._read_cache("ticket", endpoint)
+        if ticket is None:
+            response = self._make_request("get", endpoint)
+            if not response.ok:
+                self._raise_ticket_not_retrieved(
+                    ticket_id, response.status_code, response.text
+                )
+            ticket = self._read_json_sync(response)
+            self._write_cache("ticket", endpoint, ticket)
+        if typed:
+            return Ticket.from_dict(ticket)
+        return ticket
+
+    async def get_ticket_async(
+        self,
+        ticket_id: str,
+        app_name: str = "",
+        typed: bool = False,
+        cached: bool = True
+    ) -> Union[dict[str, Any], Ticket]:
+        """Get full ticket without blocking the event loop.
+
+        Args:
+            app_name (str): Name of the ticket app the ticket exists in
+            ticket_id (str): Ticket number
+            typed (bool): Return a Ticket record instead of a dictionary
+            cached (bool): Use a copy in the response cache if there is
+                one, the fetched copy is cached either way
+
+        Returns:
+            dict: Dictionary representing the ticket
+        """
+        endpoint = self._ticket_endpoint(ticket_id, app_name)
+        ticket = self._read_cache("ticket", endpoint) if cached else None
+        if ticket is None:
+            response = await self._make_async_request("get", endpoint)
+            if not response.ok:
+                self._raise_ticket_not_retrieved(
+                    ticket_id, response.status, await response.text()
+                )
+            ticket = await self._read_json(response)
+            self._write_cache("ticket", endpoint, ticket)
+        if typed:
+            return Ticket.from_dict(ticket)
+        return ticket
+
+    def _raise_ticket_not_retrieved(
+        self,
+        ticket_id: str,
+        status: int,
+        text: str
+    ) -> NoReturn:
+        """Log why a ticket could not be retrieved and raise.
+
+        Args:
+            ticket_id (str): Ticket number
+            status (int): Status code of the response
+            text (str): Body of the response
+        """
+        if status == HTTPStatus.NOT_FOUND:
+            logging.error(f"Ticket {ticket_id} does not exist")
+            raise exceptions.ObjectNotFoundException
+        logging.error(f"Unable to get ticket {ticket_id}: {text}")
+        raise exceptions.RequestFailedException
+
+    async def get_tickets(
+        self,
+        ticket_ids: Iterable[str],
+        app_name: str = "",
+        concurrency: int = 10,
+        typed: bool = False,
+    ) -> list[BulkResult]:
+        """Get many full tickets concurrently.
+
+        A failure to get one ticket is recorded in its result instead of
+        failing the whole batch.
+
+        Args:
+            ticket_ids (Iterable[str]): Ticket numbers
+            app_name (str): Name of the ticket app the tickets exist in
+            concurrency (int): Most tickets fetched at once
+            typed (bool): Return Ticket records instead of dictionaries
+
+        Returns:
+            list[BulkResult]: Result for each ticket in the order given,
+            with the ticket dictionary as the result
+        """
+        return await gather_bounded(
+            ticket_ids,
+            lambda ticket_id: self.get_ticket_async(
+                ticket_id, app_name, typed
+            ),
+            concurrency,
+        )
+
+    async def iter_tickets(
+        self,
+        ticket_ids: Iterable[str],
+        app_name: str = "",
+        concurrency: int = 10,
+        typed: bool = False,
+        cached: bool = True,
+    ) -> AsyncIterator[BulkResult]:
+        """Get many full tickets concurrently, yielding them as they arrive.
+
+        Ticket numbers are pulled from ticket_ids as earlier tickets
+        finish, so a lazy iterable keeps memory flat however many tickets
+        there are.
+
+        Args:
+            ticket_ids (Iterable[str]): Ticket numbers
+            app_name (str): Name of the ticket app the tickets exist in
+            concurrency (int): Most tickets fetched at once
+            typed (bool): Return Ticket records instead of dictionaries
+            cached (bool): Use copies in the response cache if there are
+                any
+
+        Yields:
+            BulkResult: Result for each ticket in the order they finish,
+            with the ticket dictionary as the result
+        """
+        async for result in iter_bounded(
+            ticket_ids,
+            lambda ticket_id: self.get_ticket_async(
+                ticket_id, app_name, typed, cached
+            ),
+            concurrency,
+        ):
+            yield result
+
+    def _ticket_endpoint(self, path: str, app_name: str = "") -> str:
+        """Build a ticket endpoint in the given ticket app.
+
+        Args:
+            path (str): Path under the app's tickets, eg a ticket number
+            app_name (str): Name of the ticket app
+
+        Returns:
+            str: Endpoint for the ticket app, eg 123/tickets/456
+        """
+        if not app_name:
+            app_name = self._default_ticket_app_name
+        app_id = self._content["AppIDs"][app_name]
+        return f"{app_id}/tickets/{path}"
 
     def get_ticket_attribute(
         self, ticket: dict[str, Any], attr_name: str
@@ -572,6 +1403,9 @@ class TeamDynamixInstance:
         """
         Get a specific attribute from a ticket.
 
+        To read many attributes of one ticket, index it once with
+        index_attributes() or get it with typed=True instead.
+
         Args:
             ticket (dict): Ticket to pull attribute from
             attr_name (str): Internal TDx name of the attribute, usually ugly
@@ -579,10 +1413,117 @@ class TeamDynamixInstance:
         Returns:
             dict: Dictionary of the attribute
         """
-        for attr in ticket["Attributes"]:
-            if attr["Name"] == attr_name:
-                return attr
-        raise exceptions.NoSuchAttributeException
+        return _find_attribute(ticket, attr_name)
+
+    def set_ticket_attribute(
+        self, ticket: dict[str, Any], attr_name: str, value: Any
+    ) -> dict[str, Any]:
+        """
+        Set a specific attribute of a ticket, adding it if it is missing.
+
+        Args:
+            ticket (dict): Ticket to set the attribute on
+            attr_name (str): Internal TDx name of the attribute, usually ugly
+            value (Any): New value of the attribute
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        return self._set_attribute(
+            ticket, "TicketAttributes", attr_name, value
+        )
+
+    def get_asset_attribute(
+        self, asset: dict[str, Any], attr_name: str
+    ) -> dict[str, Any]:
+        """
+        Get a specific attribute from an asset.
+
+        To read many attributes of one asset, index it once with
+        index_attributes() or get it with typed=True instead.
+
+        Args:
+            asset (dict): Asset to pull attribute from
+            attr_name (str): Internal TDx name of the attribute, usually ugly
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        return _find_attribute(asset, attr_name)
+
+    def set_asset_attribute(
+        self, asset: dict[str, Any], attr_name: str, value: Any
+    ) -> dict[str, Any]:
+        """
+        Set a specific attribute of an asset, adding it if it is missing.
+
+        Args:
+            asset (dict): Asset to set the attribute on
+            attr_name (str): Internal TDx name of the attribute, usually ugly
+            value (Any): New value of the attribute
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        return self._set_attribute(asset, "AssetAttributes", attr_name, value)
+
+    def get_attribute_name(self, id_type: str, attr_id: Any) -> str:
+        """Convert a custom attribute ID to its name.
+
+        Args:
+            id_type (str): "TicketAttributes" or "AssetAttributes"
+            attr_id (Any): ID of the custom attribute
+
+        Raises:
+            NoSuchAttributeException: No attribute has the ID
+
+        Returns:
+            str: Name of the custom attribute
+        """
+        ids: dict[str, Any] = self._content.get(id_type, {})
+        cached = self._attribute_names.get(id_type)
+        if cached is None or cached[0] is not ids or cached[1] != len(ids):
+            names = {attr_id: name for name, attr_id in ids.items()}
+            cached = (ids, len(ids), names)
+            self._attribute_names[id_type] = cached
+        try:
+            return cached[2][attr_id]
+        except KeyError:
+            raise exceptions.NoSuchAttributeException
+
+    def _set_attribute(
+        self,
+        record: dict[str, Any],
+        id_type: str,
+        attr_name: str,
+        value: Any
+    ) -> dict[str, Any]:
+        """Set a custom attribute, looking up its ID if it is missing.
+
+        Args:
+            record (dict): Ticket or asset dictionary
+            id_type (str): "TicketAttributes" or "AssetAttributes"
+            attr_name (str): Internal TDx name of the attribute
+            value (Any): New value of the attribute
+
+        Raises:
+            NoSuchAttributeException: The attribute is missing and its ID
+                isn't known
+
+        Returns:
+            dict: Dictionary of the attribute
+        """
+        try:
+            attr = _find_attribute(record, attr_name)
+        except exceptions.NoSuchAttributeException:
+            attr_id = self._content.get(id_type, {}).get(attr_name)
+            if attr_id is None:
+                raise
+            attr = {"ID": attr_id, "Name": attr_name, "Value": value}
+            record.setdefault("Attributes", []).append(attr)
+            return attr
+        attr["Value"] = value
+        return attr
 
     def update_ticket_status(
         self,
@@ -604,20 +1545,258 @@ class TeamDynamixInstance:
         """
         if not app_name:
             app_name = self._default_ticket_app_name
-        app_id = self._content["AppIDs"][app_name]
-        status_id = self._content[app_name]["TicketStatusIDs"][status_name]
+        status_id = self.get_id(app_name, status_name, "TicketStatusIDs")
+        body = self._ticket_status_body(status_id, comments)
+        response = self._make_request(
+            "post", self._ticket_endpoint(f"{ticket_id}/feed", app_name),
+            body=body
+        )
+        self._invalidate_cache(
+            "ticket", self._ticket_endpoint(ticket_id, app_name)
+        )
+        if not response.ok:
+            logging.error(f"Unable to update ticket status: {response.text}")
+        return response
+
+    async def update_ticket_status_async(
+        self,
+        ticket_id: str,
+        status_name: str,
+        comments: str,
+        app_name: str = "",
+    ) -> aiohttp.ClientResponse:
+        """Update a ticket status without blocking the event loop.
+
+        Args:
+            ticket_id (str): Ticket number
+            status_name (str): Name of the status to set ticket to
+            comments (str): Comments to attach to ticket when updating status
+            app_name (str): Name of the ticket app the ticket exists in
+
+        Returns:
+            aiohttp.ClientResponse: Response from the TDx instance
+        """
+        if not app_name:
+            app_name = self._default_ticket_app_name
+        status_id = await self.get_id_async(
+            app_name, status_name, "TicketStatusIDs"
+        )
+        return await self._post_ticket_status(
+            ticket_id, status_id, comments, app_name
+        )
+
+    async def update_ticket_statuses(
+        self,
+        updates: Iterable[tuple[str, str, str]],
+        app_name: str = "",
+        concurrency: int = 10,
+        checkpoint: Optional[str] = None,
+    ) -> list[BulkResult]:
+        """Update the status of many tickets concurrently.
+
+        Status names are resolved once for the whole batch. Each feed
+        post adds an entry and notifies people, so every ticket is read
+        before it is posted to, and a post that fails is only sent
+        again, following the instance's retry policy, if rereading the
+        ticket shows its status didn't change. A ticket whose status
+        changed to the new one after a failed post counts as updated,
+        one that was already in it fails. A failure to update one
+        ticket is recorded in its result instead of failing the whole
+        batch.
+
+        With a checkpoint file, every updated ticket is recorded as soon
+        as it is done and tickets recorded by an earlier, interrupted
+        run aren't updated again.
+
+        Args:
+            updates (Iterable[tuple[str, str, str]]): Ticket number,
+                status name and comments of each update
+            app_name (str): Name of the ticket app the tickets exist in
+            concurrency (int): Most updates sent at once
+            checkpoint (str): File recording finished tickets,
+                defaults to not recording them
+
+        Raises:
+            InvalidParameterException: A ticket is updated more than once
+
+        Returns:
+            list[BulkResult]: Result for each update in the order given,
+            "updated" or "already updated" on success
+        """
+        if not app_name:
+            app_name = self._default_ticket_app_name
+        updates = list(updates)
+        ticket_ids: set[str] = set()
+        for ticket_id, _, _ in updates:
+            # Updates of one ticket would race and share a checkpoint
+            if str(ticket_id) in ticket_ids:
+                logging.error(f"Ticket {ticket_id} is updated more than once")
+                raise exceptions.InvalidParameterException
+            ticket_ids.add(str(ticket_id))
+        status_ids = await self._ensure_ids("TicketStatusIDs", app_name)
+
+        async def update(item: tuple[str, str, str]) -> str:
+            ticket_id, status_name, comments = item
+            try:
+                status_id = status_ids[status_name]
+            except KeyError:
+                logging.error(f"No ticket status named {status_name}")
+                raise exceptions.InvalidParameterException
+            await self._set_ticket_status(
+                ticket_id, status_id, comments, app_name
+            )
+            return "updated"
+
+        runner = JobRunner(
+            update,
+            journal=checkpoint,
+            key=lambda item: item[0],
+            concurrency=concurrency,
+            resumed_result="already updated",
+        )
+        return await runner.run(updates)
+
+    async def _set_ticket_status(
+        self,
+        ticket_id: str,
+        status_id: Any,
+        comments: str,
+        app_name: str,
+    ) -> None:
+        """Change a ticket's status, resending only posts that didn't land.
+
+        A failed post may still have reached TDx, so before sending it
+        again the ticket is reread. A status that changed to the new one
+        since before the first post shows the post landed, and one that
+        didn't change shows it can be resent. A ticket that was already
+        in the new status can't show either, so the update fails rather
+        than risk posting the entry twice.
+
+        Args:
+            ticket_id (str): Ticket number
+            status_id (Any): ID of the status to set ticket to
+            comments (str): Comments to attach to ticket when updating status
+            app_name (str): Name of the ticket app the ticket exists in
+
+        Raises:
+            RequestFailedException: TDx rejected the post, or it failed
+                and can't be resent safely
+            TDXCommunicationException: The post couldn't be sent
+        """
+        already_set = (
+            await self._get_ticket_status(ticket_id, app_name)
+            == str(status_id)
+        )
+        attempt = 1
+        while True:
+            try:
+                response = await self._post_ticket_status(
+                    ticket_id, status_id, comments, app_name
+                )
+            except exceptions.TDXCommunicationException as error:
+                if not self._retry_policy.should_retry_exception(
+                    error, attempt
+                ):
+                    raise
+            else:
+                if response.ok:
+                    return
+                if not self._retry_policy.should_retry_status(
+                    response.status, attempt
+                ):
+                    raise exceptions.RequestFailedException
+            if (
+                await self._get_ticket_status(ticket_id, app_name)
+                == str(status_id)
+            ):
+                if already_set:
+                    logging.error(
+                        f"Ticket {ticket_id} was already in the status, "
+                        "unable to tell if the failed post landed"
+                    )
+                    raise exceptions.RequestFailedException
+                logging.info(
+                    f"Status of ticket {ticket_id} changed despite the "
+                    "failed post, not sending it again"
+                )
+                return
+            delay = self._retry_policy.get_delay(attempt)
+            logging.warning(
+                f"Status of ticket {ticket_id} didn't change, "
+                f"posting again in {delay:.2f}s"
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get_ticket_status(self, ticket_id: str, app_name: str) -> str:
+        """Get the current status of a ticket, bypassing the cache.
+
+        Args:
+            ticket_id (str): Ticket number
+            app_name (str): Name of the ticket app the ticket exists in
+
+        Returns:
+            str: ID of the ticket's status
+        """
+        self._invalidate_cache(
+            "ticket", self._ticket_endpoint(ticket_id, app_name)
+        )
+        ticket = await self.get_ticket_async(ticket_id, app_name)
+        return str(ticket.get("StatusID"))
+
+    async def _post_ticket_status(
+        self,
+        ticket_id: str,
+        status_id: Any,
+        comments: str,
+        app_name: str,
+    ) -> aiohttp.ClientResponse:
+        """Post the feed entry that changes a ticket's status.
+
+        Args:
+            ticket_id (str): Ticket number
+            status_id (Any): ID of the status to set ticket to
+            comments (str): Comments to attach to ticket when updating status
+            app_name (str): Name of the ticket app the ticket exists in
+
+        Returns:
+            aiohttp.ClientResponse: Response from the TDx instance
+        """
+        body = self._ticket_status_body(status_id, comments)
+        response = await self._make_async_request(
+            "post", self._ticket_endpoint(f"{ticket_id}/feed", app_name),
+            body=body,
+        )
+        self._invalidate_cache(
+            "ticket", self._ticket_endpoint(ticket_id, app_name)
+        )
+        if not response.ok:
+            logging.error(
+                f"Unable to update ticket status: {await response.text()}"
+            )
+        return response
+
+    def _ticket_status_body(
+        self,
+        status_id: Any,
+        comments: str
+    ) -> dict[str, Any]:
+        """Build the feed entry that changes a ticket's status.
+
+        Args:
+            status_id (Any): ID of the status to set ticket to
+            comments (str): Comments to attach to ticket when updating status
+
+        Returns:
+            dict: Body for the ticket feed endpoint
+        """
         body: dict[str, Any | str | bool] = {
             "NewStatusID": status_id,
             "Comments": comments,
             "IsPrivate": True,
             "IsRichHTML": False,
         }
-        response = self._make_request(
-            "post", f"{app_id}/tickets/{ticket_id}/feed", body=body
-        )
-        if not response.ok:
-            logging.error(f"Unable to update ticket status: {response.text}")
-        return response
+        return body
 
     #####################
     #                   #
@@ -635,6 +1814,11 @@ class TeamDynamixInstance:
             dict: Dictionary representing the person if found
         """
         logging.info(f"Searching for person with criteria {criteria}")
+        if self._people_directory is not None:
+            person = self._people_directory.find(criteria)
+            if person is not None:
+                logging.debug(f"Found person {person['UID']} in directory")
+                return person
         response: aiohttp.ClientResponse = \
             await self._make_async_request(
                 "post",
@@ -643,39 +1827,132 @@ class TeamDynamixInstance:
             )
 
         if not response.ok:
-            logging.error(f"Unable to search user: {response.text}")
+            logging.error(f"Unable to search user: {await response.text()}")
             raise exceptions.RequestFailedException
-        people: list[dict[str, Any]] = await response.json()
+        people: list[dict[str, Any]] = await self._read_json(response)
         if (len(people) == 0):
             logging.error(f"No person matches {criteria}")
             raise exceptions.PersonDoesNotExistException(criteria)
         if (len(people) >= 2):
             logging.error(f"Found more than one match for {criteria}")
             raise exceptions.MultipleMatchesException("person")
-        logging.info(f"Found person matching {criteria}")
-        logging.info(f"{json.dumps(people, indent=4)}")
+        logging.info(f"Found person {people[0].get('UID')} for {criteria}")
+        if self._people_directory is not None:
+            self._people_directory.add(people[0])
         return people[0]
 
-    async def get_person(self, uid: str) -> dict[str, Any]:
-        """Get a specific person based on UID.
+    async def resolve_people(
+        self,
+        criteria_list: Iterable[dict[str, Any]],
+        concurrency: int = 10,
+    ) -> list[BulkResult]:
+        """Search for many people concurrently.
+
+        Identical criteria are only searched once and people already in
+        the people directory aren't searched at all. A failure to find
+        one person is recorded in their result instead of failing the
+        whole batch.
 
         Args:
-            uid (str): Base64 string unique to each person
+            criteria_list (Iterable[dict]): Criteria to match each person
+            concurrency (int): Most searches running at once
 
         Returns:
-            dict: Dictionary representing the person
+            list[BulkResult]: Result for each criteria in the order given,
+            with the person dictionary as the result
         """
-        logging.info(f"Getting person with uid {uid}")
-        response: aiohttp.ClientResponse = \
-            await self._make_async_request(
-                "get",
-                f"people/{uid}"
+        criteria_list = list(criteria_list)
+        unique: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
+        for criteria in criteria_list:
+            unique.setdefault(_get_criteria_key(criteria), criteria)
+        logging.info(
+            f"Resolving {len(criteria_list)} people "
+            f"with {len(unique)} distinct criteria"
+        )
+        found = {
+            key: result
+            for key, result in zip(
+                unique,
+                await gather_bounded(
+                    unique.values(), self.search_person, concurrency
+                ),
+            )
+        }
+        results: list[BulkResult] = []
+        for index, criteria in enumerate(criteria_list):
+            outcome = found[_get_criteria_key(criteria)]
+            results.append(
+                BulkResult(criteria, index, outcome.result, outcome.error)
             )
+        return results
+
+    async def load_people(self, criteria: dict[str, Any]) -> int:
+        """Fill the people directory with everyone matching a search.
+
+        Args:
+            criteria (dict): People search criteria from TDx docs,
+                eg {"IsActive": True, "MaxResults": 10000}
 
+        Raises:
+            PropertyNotSetException: No people directory was given
+
+        Returns:
+            int: Number of people added to the directory
+        """
+        if self._people_directory is None:
+            logging.error("No people directory to load people into")
+            raise exceptions.PropertyNotSetException
+        response: aiohttp.ClientResponse = await self._make_async_request(
+            "post", "people/search", body=criteria, stream=True
+        )
         if not response.ok:
-            logging.error(f"Unable to get user: {response.text}")
+            logging.error(f"Unable to search people: {await response.text()}")
             raise exceptions.RequestFailedException
-        return await response.json()
+        # Add people as they are decoded so the whole search isn't held
+        count = 0
+        async for person in iter_json_array(response):
+            if self._people_directory.add(person):
+                count += 1
+        logging.info(f"Loaded {count} people into the directory")
+        return count
+
+    async def get_person(
+        self,
+        uid: str,
+        typed: bool = False
+    ) -> Union[dict[str, Any], Person]:
+        """Get a specific person based on UID.
+
+        Args:
+            uid (str): Base64 string unique to each person
+            typed (bool): Return a Person record instead of a dictionary
+
+        Returns:
+            dict: Dictionary representing the person
+        """
+        logging.info(f"Getting person with uid {uid}")
+        person = None
+        if self._people_directory is not None:
+            person = self._people_directory.get("UID", uid)
+        if person is None:
+            person = self._read_cache("person", uid)
+        if person is None:
+            response: aiohttp.ClientResponse = \
+                await self._make_async_request(
+                    "get",
+                    f"people/{uid}"
+                )
+
+            if not response.ok:
+                logging.error(f"Unable to get user: {await response.text()}")
+                raise exceptions.RequestFailedException
+            person = await self._read_json(response)
+            self._write_cache("person", uid, person)
+            if self._people_directory is not None:
+                self._people_directory.add(person)
+        if typed:
+            return Person.from_dict(person)
+        return person
 
     #####################
     #                   #
@@ -683,16 +1960,41 @@ class TeamDynamixInstance:
     #                   #
     #####################
 
-    def _populate_group_ids(self) -> None:
+    async def _populate_group_ids(self) -> None:
         """Populate the group name to ID dictionary for the TDx instance."""
-        response = self._make_request("post", "groups/search")
+        cached_ids = self._get_cached_ids("GroupIDs")
+        if cached_ids is not None:
+            self._content["GroupIDs"] = cached_ids
+            return
+        response = await self._make_async_request("post", "groups/search")
         if not response.ok:
             logging.error("Could not populate groups")
             return
-        groups = response.json()
+        groups = await self._read_json(response)
+        self._content["GroupIDs"] = {}
+        for group in groups:
+            self._content["GroupIDs"][group["Name"]] = group["ID"]
+        self._cache_ids("GroupIDs", self._content["GroupIDs"])
+
+    def _populate_group_ids_sync(self) -> None:
+        """Populate the group name to ID dictionary without asyncio.
+
+        Raises:
+            RequestFailedException: The groups could not be retrieved
+        """
+        cached_ids = self._get_cached_ids("GroupIDs")
+        if cached_ids is not None:
+            self._content["GroupIDs"] = cached_ids
+            return
+        response = self._make_request("post", "groups/search")
+        if not response.ok:
+            logging.error("Could not populate groups")
+            raise exceptions.RequestFailedException
+        groups = self._read_json_sync(response)
         self._content["GroupIDs"] = {}
         for group in groups:
             self._content["GroupIDs"][group["Name"]] = group["ID"]
+        self._cache_ids("GroupIDs", self._content["GroupIDs"])
 
     #####################
     #                   #
@@ -710,16 +2012,152 @@ class TeamDynamixInstance:
             app_name (str, optional):
             Name of the application to find IDs for. Defaults to None.
         """
-        obj_id: str = self._populating_dict[id_type]["ID"]
-        name: str = self._populating_dict[id_type]["Name"]
-        endpoint: str = self._populating_dict[id_type]["Endpoint"]
+        ids = self._get_cached_ids(id_type, app_name)
+        if ids is None:
+            if app_name:
+                await self._ensure_ids("AppIDs")
+            response: aiohttp.ClientResponse = \
+                await self._make_async_request(
+                    "get",
+                    self._get_ids_endpoint(id_type, app_name)
+                )
+            if not response.ok:
+                logging.error(f"Could not populate {id_type}")
+                raise exceptions.RequestFailedException
+            ids = self._parse_ids(id_type, await self._read_json(response))
+            self._cache_ids(id_type, ids, app_name)
+        self._store_ids(id_type, ids, app_name)
+
+    def _populate_ids_sync(self, id_type: str, app_name: str = "") -> None:
+        """Populate name to id dictionary for given app without asyncio.
+
+        Args:
+            type (str):
+            Type of app to populate, eg "AppIDs"
+
+            app_name (str, optional):
+            Name of the application to find IDs for. Defaults to None.
+        """
+        ids = self._get_cached_ids(id_type, app_name)
+        if ids is None:
+            if app_name and self._get_loaded_ids("AppIDs") is None:
+                self._populate_ids_sync("AppIDs")
+            response = self._make_request(
+                "get", self._get_ids_endpoint(id_type, app_name))
+            if not response.ok:
+                logging.error(f"Could not populate {id_type}")
+                raise exceptions.RequestFailedException
+            ids = self._parse_ids(id_type, self._read_json_sync(response))
+            self._cache_ids(id_type, ids, app_name)
+        self._store_ids(id_type, ids, app_name)
+
+    async def _ensure_ids(
+        self,
+        id_type: str,
+        app_name: str = ""
+    ) -> dict[str, Any]:
+        """Get a name to id dictionary, fetching it on first use.
+
+        Concurrent callers asking for the same missing dictionary share a
+        single fetch.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            app_name (str, optional): App the IDs belong to, if any
+
+        Returns:
+            dict: Name to ID dictionary
+        """
+        ids = self._get_loaded_ids(id_type, app_name)
+        if ids is not None:
+            return ids
+        key = (id_type, app_name)
+        task = self._id_tasks.get(key)
+        if task is None or task.done():
+            logging.debug(f"Fetching {id_type} for '{app_name}' on demand")
+            if id_type == "GroupIDs":
+                task = asyncio.ensure_future(self._populate_group_ids())
+            else:
+                task = asyncio.ensure_future(
+                    self._populate_ids(id_type, app_name)
+                )
+            self._id_tasks[key] = task
+        await asyncio.shield(task)
+        ids = self._get_loaded_ids(id_type, app_name)
+        if ids is None:
+            logging.error(f"Unable to populate {id_type} for '{app_name}'")
+            raise exceptions.RequestFailedException
+        return ids
+
+    def _get_loaded_ids(
+        self,
+        id_type: str,
+        app_name: str = ""
+    ) -> Optional[dict[str, Any]]:
+        """Get a name to id dictionary if it has already been populated.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            app_name (str, optional): App the IDs belong to, if any
+
+        Returns:
+            dict: Name to ID dictionary, or None if not populated
+        """
         content: dict[str, Any] = self._content
+        if app_name:
+            content = self._content.get(app_name, {})
+        return content.get(id_type)
+
+    def _get_ids_endpoint(self, id_type: str, app_name: str = "") -> str:
+        """Get the endpoint listing the objects of an ID type.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            app_name (str, optional): App the IDs belong to, if any
 
+        Returns:
+            str: Api endpoint, eg "123/tickets/statuses"
+        """
+        endpoint: str = self._populating_dict[id_type]["Endpoint"]
         if app_name:
             endpoint = str(self._content["AppIDs"][app_name]) + f"/{endpoint}"
-        response: aiohttp.ClientResponse = await self._make_async_request(
-            "get", endpoint)
-        response_data = await response.json()
+        return endpoint
+
+    def _parse_ids(
+        self,
+        id_type: str,
+        response_data: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Build a name to id dictionary from a list of objects.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            response_data (list): Objects returned from TDx
+
+        Returns:
+            dict: Name to ID dictionary
+        """
+        obj_id: str = self._populating_dict[id_type]["ID"]
+        name: str = self._populating_dict[id_type]["Name"]
+        ids: dict[str, Any] = {}
+        for obj in response_data:
+            ids[obj[name]] = obj[obj_id]
+        return ids
+
+    def _store_ids(
+        self,
+        id_type: str,
+        ids: dict[str, Any],
+        app_name: str = ""
+    ) -> None:
+        """Merge a name to id dictionary into the instance's content.
+
+        Args:
+            id_type (str): Type of the IDs, eg "TicketStatusIDs"
+            ids (dict): Name to ID dictionary
+            app_name (str, optional): App the IDs belong to, if any
+        """
+        content: dict[str, Any] = self._content
 
         # If working with a specific app name,
         # move into that app name's subdictionary
@@ -730,8 +2168,227 @@ class TeamDynamixInstance:
 
         if id_type not in content:
             content[id_type] = {}
-        for obj in response_data:
-            content[id_type][obj[name]] = obj[obj_id]
+        content[id_type].update(ids)
+
+    def _get_cached_ids(
+        self,
+        id_type: str,
+        app_name: str = ""
+    ) -> Optional[dict[str, Any]]:
+        """Get a name to id dictionary from the on-disk cache.
+
+        Args:
+            id_type (str): Type of the IDs, eg "AppIDs"
+            app_name (str, optional): App the IDs belong to, if any
+
+        Returns:
+            dict: Name to ID dictionary, or None if not cached
+        """
+        id_cache = self._get_id_cache()
+        if id_cache is None:
+            return None
+        return id_cache.get(id_type, app_name)
+
+    def _cache_ids(
+        self,
+        id_type: str,
+        ids: dict[str, Any],
+        app_name: str = ""
+    ) -> None:
+        """Save a name to id dictionary to the on-disk cache.
+
+        Args:
+            id_type (str): Type of the IDs, eg "AppIDs"
+            ids (dict): Name to ID dictionary
+            app_name (str, optional): App the IDs belong to, if any
+        """
+        id_cache = self._get_id_cache()
+        if id_cache is not None:
+            id_cache.put(id_type, ids, app_name)
+
+    def invalidate_ids(
+        self,
+        id_type: Optional[str] = None,
+        app_name: Optional[str] = None
+    ) -> None:
+        """Forget name to ID dictionaries so they are fetched again.
+
+        Args:
+            id_type (str, optional):
+            Type of the IDs to forget, eg "TicketStatusIDs".
+            Defaults to all types.
+
+            app_name (str, optional):
+            App to forget IDs for, "" for instance-wide IDs.
+            Defaults to all apps.
+        """
+        logging.debug(f"Invalidating {id_type or 'all'} IDs")
+        instance_id_types = set(self._populating_dict) | {"GroupIDs"}
+        for key in list(self._content):
+            if key in instance_id_types:
+                if app_name in (None, "") and id_type in (None, key):
+                    del self._content[key]
+            elif app_name in (None, key):
+                app_ids = self._content[key]
+                for app_id_type in list(app_ids):
+                    if (
+                        app_id_type in self._populating_dict
+                        and id_type in (None, app_id_type)
+                    ):
+                        del app_ids[app_id_type]
+        id_cache = self._get_id_cache()
+        if id_cache is not None:
+            id_cache.invalidate(id_type, app_name)
+
+    def _get_id_cache(self) -> Optional[IDCache]:
+        """Get the on-disk ID cache, loading it for this instance.
+
+        Returns:
+            IDCache: The loaded cache, or None if caching is disabled
+        """
+        if self._id_cache is None:
+            return None
+        instance = self._get_api_url()
+        if not self._id_cache.is_loaded(instance):
+            self._id_cache.load(instance)
+        return self._id_cache
+
+    def _read_cache(self, resource: str, key: str) -> Optional[Any]:
+        """Get an object from the response cache.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (str): Key of the object, eg its endpoint
+
+        Returns:
+            Any: The cached object, or None if it isn't cached
+        """
+        if self._response_cache is None:
+            return None
+        return self._response_cache.get(resource, key)
+
+    def _write_cache(self, resource: str, key: str, value: Any) -> None:
+        """Store an object in the response cache.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (str): Key of the object, eg its endpoint
+            value (Any): Object to cache
+        """
+        if self._response_cache is not None:
+            self._response_cache.set(resource, key, value)
+
+    def _invalidate_cache(self, resource: str, key: str) -> None:
+        """Drop an object that was written to from the response cache.
+
+        Args:
+            resource (str): Kind of object, eg "asset"
+            key (str): Key of the object, eg its endpoint
+        """
+        if self._response_cache is not None:
+            self._response_cache.invalidate(resource, key)
+
+    def get_write_stats(self) -> dict[str, int]:
+        """Get the number of asset updates sent and skipped as unchanged.
+
+        Returns:
+            dict: Updates sent and skipped
+        """
+        return dict(self._write_stats)
+
+    def get_concurrency_stats(self) -> dict[str, Any]:
+        """Get the state of the adaptive concurrency limiter.
+
+        Returns:
+            dict: Current limit, requests in flight and waiting, and
+            recent and long-run latencies
+        """
+        return self._concurrency_limiter.get_stats()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get the hit and miss counters of the response cache.
+
+        Returns:
+            dict: Hits, misses and size, all 0 if caching is disabled
+        """
+        if self._response_cache is None:
+            return {"hits": 0, "misses": 0, "size": 0}
+        return self._response_cache.get_stats()
+
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode the body of an async response with the JSON codec.
+
+        Args:
+            response (aiohttp.ClientResponse): Response with a JSON body
+
+        Returns:
+            Any: The decoded body
+        """
+        try:
+            data = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logging.error("Client Communication Error!")
+            raise exceptions.TDXCommunicationException
+        return self._json_codec.loads(data)
+
+    def _read_json_sync(self, response: requests.Response) -> Any:
+        """Decode the body of a sync response with the JSON codec.
+
+        Args:
+            response (requests.Response): Response with a JSON body
+
+        Returns:
+            Any: The decoded body
+        """
+        return self._json_codec.loads(response.content)
+
+    def _get_api_url(self) -> str:
+        """Get the base url of the remote TDx web api.
+
+        Returns:
+            str: Url of the api, eg https://domain/SBTDWebApi/api
+        """
+        if self._sandbox:
+            api_version = "SBTDWebApi"
+        else:
+            api_version = "TDWebApi"
+        return f"https://{self._domain}/{api_version}/api"
+
+    def _get_session(self) -> requests.Session:
+        """Get the pooled session used for sync requests.
+
+        The session keeps connections to TDx alive between calls so each
+        request doesn't pay for a new TCP and TLS handshake.
+
+        Returns:
+            requests.Session: Session with a connection pool for TDx
+        """
+        if self._session is None:
+            logging.debug("Creating pooled sync session")
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self._max_connections_per_host,
+            )
+            self._session.mount("https://", adapter)
+        return self._session
+
+    def _get_api_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session used for async requests.
+
+        Returns:
+            aiohttp.ClientSession: Session with a connection pool for TDx
+        """
+        if self._api_session is None or self._api_session.closed:
+            logging.debug("Creating pooled async session")
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._max_connections_per_host,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
+            self._api_session = aiohttp.ClientSession(
+                f"https://{self._domain}", connector=connector
+            )
+        return self._api_session
 
     def _make_request(
         self,
@@ -739,9 +2396,14 @@ class TeamDynamixInstance:
         endpoint: str,
         requires_auth: bool = True,
         body: Optional[dict[str, Any]] = None,
+        retry: Optional[bool] = None,
     ) -> requests.Response:
         """Make a request to the remote TDx instance.
 
+        Requests are scheduled by the instance's rate limiter and resent
+        when TDx responds with 429 Too Many Requests. Failed attempts are
+        retried according to the instance's retry policy.
+
         Args:
             type (str):
             The type of request to make, eg "post", "get"
@@ -755,6 +2417,10 @@ class TeamDynamixInstance:
             body (dict, optional):
             Body of the request to send. Defaults to {}.
 
+            retry (bool, optional):
+            Whether failed attempts may be resent. Defaults to retrying
+            only gets and searches.
+
         Returns:
             requests.Response: Response from the API endpoint
         """
@@ -767,24 +2433,71 @@ class TeamDynamixInstance:
         if self._auth_token and requires_auth:
             headers["Authorization"] = f"Bearer {self._auth_token}"
 
-        if self._sandbox:
-            api_version = "SBTDWebApi"
-        else:
-            api_version = "TDWebApi"
+        if request_type not in ("get", "post"):
+            logging.error(f"Expected post or get, got {request_type}")
+            raise exceptions.InvalidHTTPMethodException
 
-        url: str = f"https://{self._domain}/{api_version}/api/{endpoint}"
+        if retry is None:
+            retry = self._retry_policy.is_idempotent(request_type, endpoint)
 
-        if request_type == "get":
-            response = requests.get(url=url, headers=headers, timeout=10)
-        elif request_type == "post":
-            response = requests.post(
-                url=url, headers=headers, json=body, timeout=10
+        url: str = f"{self._get_api_url()}/{endpoint}"
+        attempts = _RequestAttempts(
+            endpoint, retry, self._rate_limiter, self._retry_policy
+        )
+        while True:
+            self._rate_limiter.acquire_sync(endpoint)
+            try:
+                response = self._send_request(
+                    request_type, url, headers, body
+                )
+            except Exception as error:
+                delay = attempts.get_error_delay(error)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+
+            delay = attempts.get_resend_delay(
+                response.status_code, response.headers
             )
-        else:
-            logging.error(f"Expected post or get, got {request_type}")
-            raise exceptions.InvalidHTTPMethodException
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
 
-        return response
+    def _send_request(
+        self,
+        request_type: str,
+        url: str,
+        headers: dict[str, str],
+        body: dict[str, Any],
+    ) -> requests.Response:
+        """Send a single request through the pooled sync session.
+
+        Args:
+            request_type (str): The type of request to make, eg "get"
+            url (str): Full url to send the request to
+            headers (dict): Headers of the request
+            body (dict): Body of the request, only sent with posts
+
+        Returns:
+            requests.Response: Response from the API endpoint
+        """
+        session = self._get_session()
+        try:
+            if request_type == "get":
+                return session.get(
+                    url=url, headers=headers, timeout=self._timeout
+                )
+            return session.post(
+                url=url,
+                headers=headers,
+                data=self._json_codec.dumps(body),
+                timeout=self._timeout
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            logging.error("Client Communication Error!")
+            raise exceptions.TDXCommunicationException
 
     async def _make_async_request(
         self,
@@ -792,45 +2505,585 @@ class TeamDynamixInstance:
         endpoint: str,
         requires_auth: bool = True,
         body: Optional[dict[str, Any]] = None,
+        retry: Optional[bool] = None,
+        stream: bool = False,
     ) -> aiohttp.ClientResponse:
-        if self._sandbox:
-            api_version = "SBTDWebApi"
+        """Make an async request to the remote TDx instance.
+
+        Requests are scheduled by the instance's rate limiter, the number
+        in flight is capped by its adaptive concurrency limiter, and they
+        are resent when TDx responds with 429 Too Many Requests. Failed
+        attempts are retried according to the instance's retry policy.
+        Identical gets and searches that are in flight at the same time
+        share a single request and response.
+
+        Args:
+            id_type (str):
+            The type of request to make, eg "post", "get"
+
+            endpoint (str):
+            Api endpoint to send the request to, eg "assets/statuses"
+
+            requires_auth (bool, optional):
+            Whether the request requires auth. Defaults to True.
+
+            body (dict, optional):
+            Body of the request to send. Defaults to {}.
+
+            retry (bool, optional):
+            Whether failed attempts may be resent. Defaults to retrying
+            only gets and searches.
+
+            stream (bool, optional):
+            Whether the caller will stream the body, eg with
+            iter_json_array(). Streamed requests are never shared with
+            other callers. Defaults to False.
+
+        Returns:
+            aiohttp.ClientResponse: Response from the API endpoint
+        """
+        if not body:
+            body = {}
+
+        if id_type not in ("get", "post"):
+            logging.error(f"Expected post or get, got {id_type}")
+            raise exceptions.InvalidHTTPMethodException
+
+        if stream or not (
+            self._coalesce_requests
+            and self._retry_policy.is_idempotent(id_type, endpoint)
+        ):
+            return await self._send_with_retries(
+                id_type, endpoint, requires_auth, body, retry
+            )
+
+        key = self._get_request_key(id_type, endpoint, requires_auth, body)
+        task = self._inflight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_and_read(
+                id_type, endpoint, requires_auth, body, retry
+            ))
+            self._inflight_requests[key] = task
+            task.add_done_callback(
+                lambda _: self._inflight_requests.pop(key, None)
+            )
         else:
-            api_version = "TDWebApi"
+            logging.debug(f"Joining in-flight {id_type} to {endpoint}")
+        return await asyncio.shield(task)
 
-        url: str = f"https://{self._domain}"
+    def _get_request_key(
+        self,
+        id_type: str,
+        endpoint: str,
+        requires_auth: bool,
+        body: dict[str, Any],
+    ) -> str:
+        """Get a key identifying identical requests.
+
+        Args:
+            id_type (str): The type of request, eg "get"
+            endpoint (str): Api endpoint of the request
+            requires_auth (bool): Whether the request is authenticated
+            body (dict): Body of the request
+
+        Returns:
+            str: Hash of the method, url and body
+        """
+        body_hash = hashlib.sha256(
+            json.dumps(body, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{id_type} {endpoint} {requires_auth} {body_hash}"
+
+    async def _send_and_read(
+        self,
+        id_type: str,
+        endpoint: str,
+        requires_auth: bool,
+        body: dict[str, Any],
+        retry: Optional[bool],
+    ) -> aiohttp.ClientResponse:
+        """Send a request and read its body so the response can be shared.
+
+        aiohttp keeps the body once it is read, so every caller sharing
+        the response can call json() or text() on it.
+
+        Args:
+            id_type (str): The type of request to make, eg "get"
+            endpoint (str): Api endpoint to send the request to
+            requires_auth (bool): Whether the request requires auth
+            body (dict): Body of the request to send
+            retry (bool, optional): Whether failed attempts may be resent
+
+        Returns:
+            aiohttp.ClientResponse: Response with its body already read
+        """
+        response = await self._send_with_retries(
+            id_type, endpoint, requires_auth, body, retry
+        )
+        try:
+            await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logging.error("Client Communication Error!")
+            raise exceptions.TDXCommunicationException
+        return response
+
+    async def _send_with_retries(
+        self,
+        id_type: str,
+        endpoint: str,
+        requires_auth: bool,
+        body: dict[str, Any],
+        retry: Optional[bool],
+    ) -> aiohttp.ClientResponse:
+        """Send a request, handling rate limits, auth and retries.
+
+        Args:
+            id_type (str): The type of request to make, eg "get"
+            endpoint (str): Api endpoint to send the request to
+            requires_auth (bool): Whether the request requires auth
+            body (dict): Body of the request to send
+            retry (bool, optional): Whether failed attempts may be resent
+
+        Returns:
+            aiohttp.ClientResponse: Response from the API endpoint
+        """
         headers: dict[str, str] = {
             "Content-Type": "application/json; charset=utf-8",
         }
 
-        if not body:
-            body = {}
+        if retry is None:
+            retry = self._retry_policy.is_idempotent(id_type, endpoint)
 
-        if self._auth_token and requires_auth:
-            if (self._reauth_time < time.time()):
-                logging.debug("Auth token expired, reauthenticating...88")
-                await self.login()
-            headers["Authorization"] = f"Bearer {self._auth_token}"
-
-        if self._api_session is None:
-            self._api_session = aiohttp.ClientSession(
-                f"{url}", headers=headers
+        attempts = _RequestAttempts(
+            endpoint, retry, self._rate_limiter, self._retry_policy
+        )
+        # Resent attempts are judged as the first one, so a request that
+        # keeps failing cuts the concurrency limit only once
+        first_started: Optional[float] = None
+        while True:
+            # Checked on every attempt since the token can expire while
+            # waiting on the rate limiter or a backoff
+            if self._auth_token and requires_auth:
+                await self._refresh_auth_token()
+                headers["Authorization"] = f"Bearer {self._auth_token}"
+            await self._rate_limiter.acquire(endpoint)
+            family = self._rate_limiter.get_family(endpoint)
+            started = await self._concurrency_limiter.acquire()
+            if first_started is None:
+                first_started = started
+            try:
+                response = await self._send_async_request(
+                    id_type, endpoint, headers, body
+                )
+            except asyncio.CancelledError:
+                self._concurrency_limiter.abandon()
+                raise
+            except Exception as error:
+                self._concurrency_limiter.release(
+                    started, None, family, first_started
+                )
+                delay = attempts.get_error_delay(error)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            self._concurrency_limiter.release(
+                started, response.status, family, first_started
+            )
+            delay = attempts.get_resend_delay(
+                response.status, response.headers
             )
+            if delay is None:
+                return response
+            response.release()
+            await asyncio.sleep(delay)
+
+    async def _send_async_request(
+        self,
+        id_type: str,
+        endpoint: str,
+        headers: dict[str, str],
+        body: dict[str, Any],
+    ) -> aiohttp.ClientResponse:
+        """Send a single request through the pooled async session.
+
+        Args:
+            id_type (str): The type of request to make, eg "get"
+            endpoint (str): Api endpoint to send the request to
+            headers (dict): Headers of the request
+            body (dict): Body of the request, only sent with posts
+
+        Returns:
+            aiohttp.ClientResponse: Response from the API endpoint
+        """
+        if self._sandbox:
+            api_version = "SBTDWebApi"
+        else:
+            api_version = "TDWebApi"
+
+        api_session = self._get_api_session()
+        timeout = aiohttp.ClientTimeout(total=self._timeout)
         try:
             if id_type == "get":
-                return await self._api_session.get(
-                    f"/{api_version}/api/{endpoint}",
-                    headers=headers
-                )
-            elif id_type == "post":
-                return await self._api_session.post(
+                return await api_session.get(
                     f"/{api_version}/api/{endpoint}",
                     headers=headers,
-                    json=body
+                    timeout=timeout
                 )
-            else:
-                logging.error(f"Expected post or get, got {id_type}")
-                raise exceptions.InvalidHTTPMethodException
-        except aiohttp.ClientError:
+            return await api_session.post(
+                f"/{api_version}/api/{endpoint}",
+                headers=headers,
+                data=self._json_codec.dumps(body),
+                timeout=timeout
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             logging.error("Client Communication Error!")
             raise exceptions.TDXCommunicationException
+
+
+def _parse_tdx_date(value: Any) -> Optional[datetime]:
+    """Parse a date from TDx or search criteria.
+
+    Args:
+        value (Any): A datetime, an ISO 8601 string or None
+
+    Returns:
+        datetime: Timezone aware datetime, or None if no date was given
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _get_search_window(
+    criteria: dict[str, Any]
+) -> tuple[Optional[datetime], datetime]:
+    """Get the window of creation dates a ticket search covers.
+
+    Args:
+        criteria (dict): Ticket search criteria
+
+    Returns:
+        tuple: Earliest creation date, None for no limit, and latest
+    """
+    return (
+        _parse_tdx_date(criteria.get("CreatedDateFrom")),
+        _parse_tdx_date(criteria.get("CreatedDateTo"))
+        or datetime.now(timezone.utc),
+    )
+
+
+def _get_window_criteria(
+    search: dict[str, Any],
+    window: tuple[Optional[datetime], datetime],
+    page_size: int,
+) -> dict[str, Any]:
+    """Limit ticket search criteria to a window of creation dates.
+
+    Args:
+        search (dict): Ticket search criteria
+        window (tuple): Earliest and latest creation date to search
+        page_size (int): Most tickets to return
+
+    Returns:
+        dict: Copy of the criteria searching only the window
+    """
+    body = dict(search)
+    window_start, window_end = window
+    body.pop("CreatedDateFrom", None)
+    if window_start is not None:
+        body["CreatedDateFrom"] = _format_tdx_date(window_start)
+    body["CreatedDateTo"] = _format_tdx_date(window_end)
+    body["MaxResults"] = page_size
+    return body
+
+
+def _split_search_window(
+    window: tuple[Optional[datetime], datetime],
+    page_size: int,
+) -> list[tuple[Optional[datetime], datetime]]:
+    """Split a window of a ticket search that returned a full page.
+
+    A window without a start is split a year before its end, then twice
+    as far back each time, until a window reaches past the oldest ticket.
+
+    Args:
+        window (tuple): Earliest and latest creation date searched
+        page_size (int): Most tickets a search returns
+
+    Returns:
+        list: Windows to search instead, the earliest last so it is
+        searched first, empty if the window can't be split
+    """
+    window_start, window_end = window
+    if window_start is None:
+        span = max(
+            timedelta(days=365), datetime.now(timezone.utc) - window_end
+        )
+        middle = window_end - span
+        return [(middle, window_end), (None, middle)]
+    if window_end - window_start > timedelta(seconds=1):
+        middle = window_start + (window_end - window_start) / 2
+        return [(middle, window_end), (window_start, middle)]
+    logging.warning(
+        f"More than {page_size} tickets created at {window_start}, "
+        "some may be missing"
+    )
+    return []
+
+
+class _TicketSearch:
+    """Windows and results of a ticket search, shared by its sync and
+    async loops, which only send each search and decode its tickets.
+
+    Iterating gives the criteria of each window to search. Every ticket
+    a search returns is passed to add() before the next window is
+    taken, so full windows can be split and searched again.
+    """
+
+    def __init__(
+        self,
+        search: dict[str, Any],
+        title: str,
+        page_size: int,
+    ) -> None:
+        """Start a search.
+
+        Args:
+            search (dict): Ticket search criteria
+            title (str): Title of the ticket, empty to match any
+            page_size (int): Most tickets requested per search
+        """
+        self._search: dict[str, Any] = search
+        self._title: str = title
+        self._page_size: int = page_size
+        self._limit: Optional[int] = search.get("MaxResults")
+        self._seen_ids: set[Any] = set()
+        self._count: int = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether MaxResults tickets were found."""
+        return (
+            self._limit is not None
+            and 0 < self._limit <= len(self._seen_ids)
+        )
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        windows = [_get_search_window(self._search)]
+        while windows and not self.done:
+            window = windows.pop()
+            self._count = 0
+            yield _get_window_criteria(self._search, window, self._page_size)
+            if self._count >= self._page_size:
+                windows.extend(_split_search_window(window, self._page_size))
+
+    def add(self, ticket: dict[str, Any]) -> bool:
+        """Count a searched ticket and check if it should be returned.
+
+        Windows share their boundaries and full windows are searched
+        again, so tickets already returned are skipped. TDx search text
+        also matches descriptions and comments, so titles are checked
+        here.
+
+        Args:
+            ticket (dict): Ticket returned by the search
+
+        Returns:
+            bool: True if the ticket matches and wasn't returned yet
+        """
+        self._count += 1
+        if (
+            self.done
+            or (self._title and ticket["Title"] != self._title)
+            or ticket["ID"] in self._seen_ids
+        ):
+            return False
+        self._seen_ids.add(ticket["ID"])
+        return True
+
+
+class _RequestAttempts:
+    """Attempts of one request, deciding whether to resend it.
+
+    Shared by the sync and async request loops, which only differ in how
+    they send and wait.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        retry: bool,
+        rate_limiter: RateLimiter,
+        retry_policy: RetryPolicy,
+    ) -> None:
+        """Start counting the attempts of a request.
+
+        Args:
+            endpoint (str): Api endpoint the request is sent to
+            retry (bool): Whether failed attempts may be resent
+            rate_limiter (RateLimiter): Rate limiter of the instance
+            retry_policy (RetryPolicy): Retry policy of the instance
+        """
+        self._endpoint: str = endpoint
+        self._retry: bool = retry
+        self._rate_limiter: RateLimiter = rate_limiter
+        self._retry_policy: RetryPolicy = retry_policy
+        self._attempt: int = 1
+        self._rate_limit_retries: int = 0
+
+    def get_error_delay(self, error: Exception) -> Optional[float]:
+        """Get how long to wait before resending an attempt that raised.
+
+        Args:
+            error (Exception): Exception raised sending the attempt
+
+        Returns:
+            float: Seconds to wait, None if the error should be raised
+        """
+        if not (
+            self._retry
+            and self._retry_policy.should_retry_exception(
+                error, self._attempt
+            )
+        ):
+            return None
+        delay = self._retry_policy.get_delay(self._attempt)
+        logging.warning(
+            f"Attempt {self._attempt} at {self._endpoint} failed, "
+            f"retrying in {delay:.2f}s"
+        )
+        self._attempt += 1
+        return delay
+
+    def get_resend_delay(
+        self, status: int, headers: Mapping[str, str]
+    ) -> Optional[float]:
+        """Record a response and get how long to wait before resending.
+
+        Requests TDx rate limited are resent right away, since the rate
+        limiter already holds them back.
+
+        Args:
+            status (int): Status code of the response
+            headers (Mapping): Headers of the response
+
+        Returns:
+            float: Seconds to wait, None if the response should be
+            returned
+        """
+        self._rate_limiter.update(self._endpoint, status, headers)
+        if (
+            status == HTTPStatus.TOO_MANY_REQUESTS
+            and self._rate_limit_retries
+            < self._rate_limiter.max_rate_limit_retries
+        ):
+            self._rate_limit_retries += 1
+            return 0
+        if self._retry and self._retry_policy.should_retry_status(
+            status, self._attempt
+        ):
+            delay = self._retry_policy.get_delay(self._attempt)
+            logging.warning(
+                f"Attempt {self._attempt} at {self._endpoint} returned "
+                f"{status}, retrying in {delay:.2f}s"
+            )
+            self._attempt += 1
+            return delay
+        return None
+
+
+def _get_asset_fingerprint(asset: dict[str, Any]) -> int:
+    """Get a hash that is equal for assets an update wouldn't change.
+
+    Fields set to None count as missing, and custom attributes are
+    compared by ID and value, in any order, since TDx returns extra
+    fields like ValueText that updates leave out.
+
+    Args:
+        asset (dict): Asset as it is in TDx or would be sent to it
+
+    Returns:
+        int: Hash of the asset's fields and attribute values
+    """
+    fields = sorted(
+        (field, repr(value)) for field, value in asset.items()
+        if field != "Attributes" and value is not None
+    )
+    attributes = sorted(
+        (repr(attr_id), repr(value))
+        for attr_id, value in _get_attribute_values(asset).items()
+    )
+    return hash((tuple(fields), tuple(attributes)))
+
+
+def _get_attribute_values(record: dict[str, Any]) -> dict[Any, Any]:
+    """Get the custom attribute values of a record by attribute ID.
+
+    Args:
+        record (dict): Ticket or asset dictionary
+
+    Returns:
+        dict: Value of each attribute as text, by attribute ID
+    """
+    return {
+        attr.get("ID"): None if attr.get("Value") is None
+        else str(attr.get("Value"))
+        for attr in record.get("Attributes") or []
+    }
+
+
+def _find_attribute(
+    record: dict[str, Any], attr_name: str
+) -> dict[str, Any]:
+    """Find a custom attribute of a record by name.
+
+    A single scan is cheaper than indexing a record for one lookup.
+
+    Args:
+        record (dict): Ticket or asset dictionary
+        attr_name (str): Internal TDx name of the attribute
+
+    Raises:
+        NoSuchAttributeException: The record has no such attribute
+
+    Returns:
+        dict: Dictionary of the attribute
+    """
+    for attr in record.get("Attributes") or []:
+        if attr.get("Name") == attr_name:
+            return attr
+    raise exceptions.NoSuchAttributeException
+
+
+def _get_criteria_key(
+    criteria: dict[str, Any]
+) -> tuple[tuple[str, str], ...]:
+    """Get a hashable key that is equal for identical search criteria.
+
+    Args:
+        criteria (dict): Search criteria
+
+    Returns:
+        tuple: Sorted criteria names and values
+    """
+    return tuple(sorted((key, repr(value)) for key, value in criteria.items()))
+
+
+def _format_tdx_date(moment: datetime) -> str:
+    """Format a datetime for TDx search criteria.
+
+    Args:
+        moment (datetime): Timezone aware datetime
+
+    Returns:
+        str: ISO 8601 date in UTC, eg 2023-01-31T12:00:00Z
+    """
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
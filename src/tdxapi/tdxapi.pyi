@@ -1,32 +1,68 @@
 import aiohttp
 import requests
 from tdxapi import exceptions as exceptions
-from typing import Any, Optional
+from tdxapi.bulk import BulkResult as BulkResult
+from tdxapi.cache import ResponseCache as ResponseCache
+from tdxapi.codec import JSONCodec as JSONCodec
+from tdxapi.idcache import IDCache as IDCache
+from tdxapi.models import Asset as Asset, Person as Person, Ticket as Ticket
+from tdxapi.people import PeopleDirectory as PeopleDirectory
+from tdxapi.ratelimit import AdaptiveConcurrencyLimiter as AdaptiveConcurrencyLimiter, RateLimiter as RateLimiter
+from tdxapi.retry import RetryPolicy as RetryPolicy
+from typing import Any, AsyncIterator, Iterable, Optional, Union
 
 class TeamDynamixInstance:
     no_owner_uid: str
-    def __init__(self, domain: str = ..., auth_token: str = ..., sandbox: bool = ..., default_ticket_app_name: str = ..., default_asset_app_name: str = ..., api_session: Optional[aiohttp.ClientSession] = ...) -> None: ...
+    def __init__(self, domain: str = ..., auth_token: str = ..., sandbox: bool = ..., default_ticket_app_name: str = ..., default_asset_app_name: str = ..., api_session: Optional[aiohttp.ClientSession] = ..., max_connections_per_host: int = ..., dns_cache_ttl: int = ..., rate_limiter: Optional[RateLimiter] = ..., retry_policy: Optional[RetryPolicy] = ..., timeout: float = ..., token_refresh_margin: float = ..., id_cache: Optional[IDCache] = ..., response_cache: Optional[ResponseCache] = ..., coalesce_requests: bool = ..., json_codec: Optional[JSONCodec] = ..., people_directory: Optional[PeopleDirectory] = ..., concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = ...) -> None: ...
     async def load_ids(self, filename: str = ...): ...
     async def login(self) -> None: ...
     def get_id(self, app_name: str, name: str, id_type: Optional[str] = ...) -> str: ...
+    async def get_id_async(self, app_name: str, name: str, id_type: Optional[str] = ...) -> str: ...
     def get_default_app_name(self, app_type: str) -> str: ...
     async def close_api_session(self) -> None: ...
     def set_auth_token(self, token: str) -> None: ...
+    def start_token_refresh(self) -> None: ...
+    async def stop_token_refresh(self) -> None: ...
     def get_current_user(self) -> dict[str, Any]: ...
+    async def get_current_user_async(self) -> dict[str, Any]: ...
     def get_domain(self) -> str: ...
     def set_domain(self, domain: str) -> None: ...
     async def initialize(self) -> None: ...
     async def populate_ids_for_app(self, app_type: str, app_name: str) -> None: ...
+    def invalidate_ids(self, id_type: Optional[str] = ..., app_name: Optional[str] = ...) -> None: ...
+    def get_write_stats(self) -> dict[str, int]: ...
+    def get_concurrency_stats(self) -> dict[str, Any]: ...
+    def get_cache_stats(self) -> dict[str, int]: ...
     def load_auth_token(self, filename: str = ...) -> None: ...
     def save_auth_token(self, filename: str = ...) -> None: ...
-    async def get_asset(self, asset_id: str, app_name: str = ...) -> dict[str, Any]: ...
+    async def get_asset(self, asset_id: str, app_name: str = ..., typed: bool = ..., cached: bool = ...) -> Union[dict[str, Any], Asset]: ...
+    async def get_assets(self, asset_ids: Iterable[str], app_name: str = ..., concurrency: int = ..., typed: bool = ...) -> list[BulkResult]: ...
+    def iter_assets(self, asset_ids: Iterable[str], app_name: str = ..., concurrency: int = ..., typed: bool = ..., cached: bool = ...) -> AsyncIterator[BulkResult]: ...
     async def search_assets(self, search_string: str, app_name: str = ...) -> list[dict[str, Any]]: ...
-    async def update_asset(self, asset: dict[str, Any], app_name: str = ...) -> aiohttp.ClientResponse: ...
+    def iter_search_assets(self, search_string: str, app_name: str = ..., criteria: Optional[dict[str, Any]] = ...) -> AsyncIterator[dict[str, Any]]: ...
+    async def update_asset(self, asset: dict[str, Any], app_name: str = ..., skip_unchanged: bool = ...) -> Optional[aiohttp.ClientResponse]: ...
+    def is_asset_unchanged(self, asset: dict[str, Any], app_name: str = ...) -> bool: ...
+    async def import_assets(self, assets: list[dict[str, Any]], app_name: str = ..., settings: Optional[dict[str, Any]] = ...) -> Any: ...
     def attach_asset_to_ticket(self, ticket_id: str, asset_id: str, ticket_app_name: str = ...) -> requests.Response: ...
+    async def attach_asset_to_ticket_async(self, ticket_id: str, asset_id: str, ticket_app_name: str = ...) -> aiohttp.ClientResponse: ...
+    async def attach_assets(self, pairs: Iterable[tuple[str, str]], ticket_app_name: str = ..., concurrency: int = ...) -> list[BulkResult]: ...
     async def get_ticket_assets(self, ticket_id: str, app_name: str = ...) -> list[dict[str, Any]]: ...
-    def search_tickets(self, title: str, criteria: dict[str, Any], app_name: str = ...) -> list[dict[str, Any]]: ...
-    def get_ticket(self, ticket_id: str, app_name: str = ...) -> dict[str, Any]: ...
+    def search_tickets(self, title: str, criteria: dict[str, Any], app_name: str = ..., page_size: int = ...) -> list[dict[str, Any]]: ...
+    async def search_tickets_async(self, title: str, criteria: dict[str, Any], app_name: str = ...) -> list[dict[str, Any]]: ...
+    def iter_search_tickets(self, title: str, criteria: dict[str, Any], app_name: str = ..., page_size: int = ...) -> AsyncIterator[dict[str, Any]]: ...
+    def get_ticket(self, ticket_id: str, app_name: str = ..., typed: bool = ...) -> Union[dict[str, Any], Ticket]: ...
+    async def get_ticket_async(self, ticket_id: str, app_name: str = ..., typed: bool = ..., cached: bool = ...) -> Union[dict[str, Any], Ticket]: ...
+    async def get_tickets(self, ticket_ids: Iterable[str], app_name: str = ..., concurrency: int = ..., typed: bool = ...) -> list[BulkResult]: ...
+    def iter_tickets(self, ticket_ids: Iterable[str], app_name: str = ..., concurrency: int = ..., typed: bool = ..., cached: bool = ...) -> AsyncIterator[BulkResult]: ...
     def get_ticket_attribute(self, ticket: dict[str, Any], attr_name: str) -> dict[str, Any]: ...
+    def set_ticket_attribute(self, ticket: dict[str, Any], attr_name: str, value: Any) -> dict[str, Any]: ...
+    def get_asset_attribute(self, asset: dict[str, Any], attr_name: str) -> dict[str, Any]: ...
+    def set_asset_attribute(self, asset: dict[str, Any], attr_name: str, value: Any) -> dict[str, Any]: ...
+    def get_attribute_name(self, id_type: str, attr_id: Any) -> str: ...
     def update_ticket_status(self, ticket_id: str, status_name: str, comments: str, app_name: str = ...) -> requests.Response: ...
+    async def update_ticket_status_async(self, ticket_id: str, status_name: str, comments: str, app_name: str = ...) -> aiohttp.ClientResponse: ...
+    async def update_ticket_statuses(self, updates: Iterable[tuple[str, str, str]], app_name: str = ..., concurrency: int = ..., checkpoint: Optional[str] = ...) -> list[BulkResult]: ...
     async def search_person(self, criteria: dict[str, Any]) -> dict[str, Any]: ...
-    async def get_person(self, uid: str) -> dict[str, Any]: ...
+    async def resolve_people(self, criteria_list: Iterable[dict[str, Any]], concurrency: int = ...) -> list[BulkResult]: ...
+    async def load_people(self, criteria: dict[str, Any]) -> int: ...
+    async def get_person(self, uid: str, typed: bool = ...) -> Union[dict[str, Any], Person]: ...
@@ -0,0 +1,300 @@
+"""Write-behind queue batching asset updates to TDx."""
+import logging
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Optional
+
+from tdxapi import exceptions
+from tdxapi.bulk import BulkResult, gather_bounded
+
+if TYPE_CHECKING:
+    from tdxapi.tdxapi import TeamDynamixInstance
+
+
+class WriteReport:
+    """Outcome of flushing a write queue."""
+
+    def __init__(
+        self,
+        results: list[BulkResult],
+        superseded: int = 0,
+        elapsed: float = 0,
+    ) -> None:
+        """Create the report of a flush.
+
+        Args:
+            results (list[BulkResult]): Outcome of each asset written
+            superseded (int, optional): Updates dropped because a later
+                update to the same asset replaced them
+            elapsed (float, optional): Seconds the flush took
+        """
+        self.results: list[BulkResult] = results
+        self.superseded: int = superseded
+        self.elapsed: float = elapsed
+
+    @property
+    def succeeded(self) -> list[BulkResult]:
+        """Outcomes of the assets that were written."""
+        return [
+            result for result in self.results
+            if result.ok and result.result is not None
+        ]
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        """Outcomes of the assets that could not be written."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def skipped(self) -> list[BulkResult]:
+        """Outcomes of the assets that were unchanged and not sent."""
+        return [
+            result for result in self.results
+            if result.ok and result.result is None
+        ]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every asset was written."""
+        return all(result.ok for result in self.results)
+
+    def __repr__(self) -> str:
+        return (
+            f"WriteReport(written={len(self.succeeded)}, "
+            f"skipped={len(self.skipped)}, failed={len(self.failed)}, "
+            f"superseded={self.superseded})"
+        )
+
+
+class AssetWriteQueue:
+    """Collects asset updates and writes them to TDx in batches.
+
+    Only the last update queued for an asset is written, since each
+    update posts the whole asset. Flushing writes assets concurrently
+    through the instance, so its rate limiter still applies, or with
+    TDx's bulk import when enough assets are queued.
+
+    Can be used as an async context manager that flushes when the block
+    exits without an exception.
+    """
+
+    def __init__(
+        self,
+        tdx: "TeamDynamixInstance",
+        app_name: str = "",
+        concurrency: int = 10,
+        import_threshold: Optional[int] = None,
+        import_batch_size: int = 1000,
+        skip_unchanged: bool = False,
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            tdx (TeamDynamixInstance):
+            Instance the assets are written to.
+
+            app_name (str, optional):
+            App the assets exist in. Defaults to the default asset app.
+
+            concurrency (int, optional):
+            Most updates sent at once. Defaults to 10.
+
+            import_threshold (int, optional):
+            Number of queued assets from which a flush uses the bulk
+            import endpoint instead of one update per asset. Defaults
+            to None, which never imports.
+
+            import_batch_size (int, optional):
+            Most assets sent in one import. Defaults to 1000.
+
+            skip_unchanged (bool, optional):
+            Don't send updates of assets identical to how they were last
+            fetched or written, see
+            TeamDynamixInstance.is_asset_unchanged(). Defaults to False.
+        """
+        self._tdx: "TeamDynamixInstance" = tdx
+        self.app_name: str = app_name
+        self.concurrency: int = concurrency
+        self.import_threshold: Optional[int] = import_threshold
+        self.import_batch_size: int = import_batch_size
+        self.skip_unchanged: bool = skip_unchanged
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._superseded: int = 0
+
+    def put(self, asset: dict[str, Any]) -> None:
+        """Queue an update, replacing any update queued for the asset.
+
+        Args:
+            asset (dict): Asset with updated values to be synced with TDx
+        """
+        asset_id = str(asset["ID"])
+        if asset_id in self._pending:
+            logging.debug(f"Replacing queued update of asset {asset_id}")
+            self._superseded += 1
+            # Move to the end so assets are written in the order last set
+            del self._pending[asset_id]
+        self._pending[asset_id] = asset
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> WriteReport:
+        """Write every queued update to TDx.
+
+        Updates queued while the flush runs are kept for the next one.
+
+        Returns:
+            WriteReport: Outcome of each asset written
+        """
+        assets = list(self._pending.values())
+        superseded = self._superseded
+        self._pending = {}
+        self._superseded = 0
+        started = time.monotonic()
+        if not assets:
+            return WriteReport([], superseded)
+
+        if (
+            self.import_threshold is not None
+            and len(assets) >= self.import_threshold
+        ):
+            results = await self._import(assets)
+        else:
+            results = await gather_bounded(
+                assets, self._update, self.concurrency
+            )
+        report = WriteReport(
+            results, superseded, time.monotonic() - started
+        )
+        logging.info(f"Flushed asset write queue: {report}")
+        return report
+
+    async def _update(self, asset: dict[str, Any]) -> Optional[int]:
+        """Write one asset.
+
+        Args:
+            asset (dict): Asset with updated values
+
+        Raises:
+            RequestFailedException: TDx rejected the update
+
+        Returns:
+            int: HTTP status of the update, None if it was skipped
+        """
+        response = await self._tdx.update_asset(
+            asset, self.app_name, self.skip_unchanged
+        )
+        if response is None:
+            return None
+        if not response.ok:
+            raise exceptions.RequestFailedException
+        return response.status
+
+    async def _import(
+        self, assets: list[dict[str, Any]]
+    ) -> list[BulkResult]:
+        """Write assets with bulk imports of import_batch_size assets.
+
+        Args:
+            assets (list[dict]): Assets with updated values
+
+        Returns:
+            list[BulkResult]: Outcome of each asset, every written asset
+            of an import shares its result, None for skipped assets.
+            Assets the import rejected, or that its result doesn't
+            account for, are failed.
+        """
+        results: list[BulkResult] = []
+        if self.skip_unchanged:
+            changed: list[dict[str, Any]] = []
+            for asset in assets:
+                if self._tdx.is_asset_unchanged(asset, self.app_name):
+                    results.append(BulkResult(asset, len(results), None))
+                else:
+                    changed.append(asset)
+            assets = changed
+        batches = [
+            assets[start:start + self.import_batch_size]
+            for start in range(0, len(assets), self.import_batch_size)
+        ]
+        outcomes = await gather_bounded(
+            batches,
+            lambda batch: self._tdx.import_assets(batch, self.app_name),
+            self.concurrency,
+        )
+        for outcome in outcomes:
+            if outcome.ok:
+                errors = _get_import_errors(outcome.item, outcome.result)
+            else:
+                errors = [outcome.error] * len(outcome.item)
+            for asset, error in zip(outcome.item, errors):
+                results.append(BulkResult(
+                    asset,
+                    len(results),
+                    outcome.result if error is None else None,
+                    error,
+                ))
+        return results
+
+    async def __aenter__(self) -> "AssetWriteQueue":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+
+
+def _get_import_errors(
+    assets: list[dict[str, Any]], import_result: Any
+) -> list[Optional[Exception]]:
+    """Find which assets of an import TDx didn't write.
+
+    Rows TDx rejects don't fail the import itself, they're listed in the
+    Errors of its result. Errors that don't name their asset, or fewer
+    items written than sent, leave every asset of the import unconfirmed
+    so none of them are reported as written.
+
+    Args:
+        assets (list[dict]): Assets sent in the import
+        import_result (Any): Import result returned by TDx
+
+    Returns:
+        list[Exception | None]: Error of each asset, None if written
+    """
+    if not isinstance(import_result, dict):
+        import_result = {}
+    rejected: dict[str, str] = {}
+    unmatched = False
+    for error in import_result.get("Errors") or []:
+        if not isinstance(error, dict):
+            unmatched = True
+            continue
+        item_id = error.get("ItemID", error.get("ID"))
+        if item_id is None:
+            unmatched = True
+            continue
+        rejected[str(item_id)] = str(error.get("ErrorMessage", error))
+    written = (
+        (import_result.get("ItemsCreated") or 0)
+        + (import_result.get("ItemsModified") or 0)
+    )
+    confirmed = not unmatched and written >= len(assets) - len(rejected)
+
+    errors: list[Optional[Exception]] = []
+    for asset in assets:
+        message = rejected.get(str(asset["ID"]))
+        if message is not None:
+            logging.error(f"Import rejected asset {asset['ID']}: {message}")
+            errors.append(exceptions.RequestFailedException(message))
+        elif not confirmed:
+            errors.append(exceptions.RequestFailedException(
+                "Import result doesn't confirm the asset was written"
+            ))
+        else:
+            errors.append(None)
+    return errors
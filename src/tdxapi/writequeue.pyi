@@ -0,0 +1,31 @@
+from tdxapi.bulk import BulkResult as BulkResult
+from tdxapi.tdxapi import TeamDynamixInstance as TeamDynamixInstance
+from types import TracebackType
+from typing import Any, Optional
+
+class WriteReport:
+    results: list[BulkResult]
+    superseded: int
+    elapsed: float
+    def __init__(self, results: list[BulkResult], superseded: int = ..., elapsed: float = ...) -> None: ...
+    @property
+    def succeeded(self) -> list[BulkResult]: ...
+    @property
+    def failed(self) -> list[BulkResult]: ...
+    @property
+    def skipped(self) -> list[BulkResult]: ...
+    @property
+    def ok(self) -> bool: ...
+
+class AssetWriteQueue:
+    app_name: str
+    concurrency: int
+    import_threshold: Optional[int]
+    import_batch_size: int
+    skip_unchanged: bool
+    def __init__(self, tdx: TeamDynamixInstance, app_name: str = ..., concurrency: int = ..., import_threshold: Optional[int] = ..., import_batch_size: int = ..., skip_unchanged: bool = ...) -> None: ...
+    def put(self, asset: dict[str, Any]) -> None: ...
+    def __len__(self) -> int: ...
+    async def flush(self) -> WriteReport: ...
+    async def __aenter__(self) -> AssetWriteQueue: ...
+    async def __aexit__(self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], traceback: Optional[TracebackType]) -> None: ...
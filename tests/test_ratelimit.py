@@ -0,0 +1,97 @@
+"""Tests of the adaptive concurrency limiter."""
+import asyncio
+import random
+import types
+from typing import Iterable, Optional
+
+import pytest
+
+from tdxapi import ratelimit
+from tdxapi.ratelimit import AdaptiveConcurrencyLimiter
+
+
+class _Clock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(
+        ratelimit, "time", types.SimpleNamespace(monotonic=fake.monotonic)
+    )
+    return fake
+
+
+def _serve(
+    limiter: AdaptiveConcurrencyLimiter,
+    clock: _Clock,
+    latencies: Iterable[float],
+    status: Optional[int] = 200,
+) -> None:
+    """Run one request per latency through the limiter, one at a time."""
+
+    async def serve() -> None:
+        for latency in latencies:
+            started = await limiter.acquire()
+            clock.now += latency
+            limiter.release(started, status)
+
+    asyncio.run(serve())
+
+
+def test_limit_grows_with_noisy_flat_latency(clock: _Clock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    rng = random.Random(0)
+    # Single responses often take several times the fastest one
+    _serve(limiter, clock, (rng.uniform(0.05, 0.5) for _ in range(1000)))
+    assert limiter.limit > 20
+
+
+def test_limit_shrinks_when_latency_inflates(clock: _Clock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    rng = random.Random(0)
+    _serve(limiter, clock, (rng.uniform(0.05, 0.15) for _ in range(200)))
+    grown = limiter.limit
+    _serve(limiter, clock, (rng.uniform(0.5, 0.6) for _ in range(20)))
+    assert limiter.limit < grown / 2 + 1
+
+
+def test_limit_shrinks_on_too_many_requests(clock: _Clock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    _serve(limiter, clock, [0.1], status=429)
+    assert limiter.limit == 5
+    assert limiter.in_flight == 0
+
+
+def test_limit_stays_within_bounds(clock: _Clock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, min_limit=2, max_limit=6
+    )
+    _serve(limiter, clock, [0.1] * 200)
+    assert limiter.limit == 6
+    for _ in range(5):
+        _serve(limiter, clock, [0.1], status=503)
+    assert limiter.limit == 2
+
+
+def test_retries_of_one_request_cut_once(clock: _Clock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+    async def serve() -> None:
+        first_started = None
+        for _ in range(5):
+            started = await limiter.acquire()
+            if first_started is None:
+                first_started = started
+            clock.now += 0.1
+            limiter.release(started, 500, first_started=first_started)
+
+    asyncio.run(serve())
+    assert limiter.limit == 5
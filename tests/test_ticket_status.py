@@ -0,0 +1,129 @@
+"""Tests of batched ticket status updates."""
+import asyncio
+import json
+from typing import Any, Optional
+
+import pytest
+
+from tdxapi.retry import RetryPolicy
+from tdxapi.tdxapi import TeamDynamixInstance
+
+CLOSED = 2
+
+
+class _Response:
+    """Response of the fake transport."""
+
+    def __init__(self, status: int, body: Any = None) -> None:
+        self.status: int = status
+        self.ok: bool = status < 400
+        self._body: bytes = json.dumps(body).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+
+class _FakeTDx:
+    """Tickets and feed of a fake TDx ticket app."""
+
+    def __init__(
+        self,
+        statuses: dict[str, int],
+        failing: frozenset[str] = frozenset(),
+        landing: frozenset[str] = frozenset(),
+    ) -> None:
+        self.statuses: dict[str, int] = statuses
+        # Tickets whose feed posts fail without landing
+        self.failing: frozenset[str] = failing
+        # Tickets whose feed posts land but fail anyway
+        self.landing: frozenset[str] = landing
+        self.posts: list[str] = []
+
+    async def request(
+        self,
+        id_type: str,
+        endpoint: str,
+        requires_auth: bool = True,
+        body: Optional[dict[str, Any]] = None,
+        retry: Optional[bool] = None,
+        stream: bool = False,
+    ) -> _Response:
+        parts = endpoint.split("/")
+        ticket_id = parts[2]
+        if id_type == "get":
+            return _Response(
+                200, {"ID": ticket_id, "StatusID": self.statuses[ticket_id]}
+            )
+        self.posts.append(ticket_id)
+        if ticket_id in self.failing:
+            return _Response(500, {"Message": "Internal error"})
+        assert body is not None
+        self.statuses[ticket_id] = body["NewStatusID"]
+        if ticket_id in self.landing:
+            return _Response(504, {"Message": "Gateway timeout"})
+        return _Response(200, {})
+
+
+def _update(
+    fake: _FakeTDx,
+    updates: list[tuple[str, str, str]],
+    monkeypatch: pytest.MonkeyPatch,
+    checkpoint: Optional[str] = None,
+) -> list[Any]:
+    tdx = TeamDynamixInstance(
+        default_ticket_app_name="Tickets",
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+    )
+    tdx._content["AppIDs"] = {  # pylint: disable=protected-access
+        "Tickets": 1
+    }
+
+    async def ensure_ids(id_type: str, app_name: str = "") -> dict[str, Any]:
+        return {"Closed": CLOSED}
+
+    monkeypatch.setattr(tdx, "_make_async_request", fake.request)
+    monkeypatch.setattr(tdx, "_ensure_ids", ensure_ids)
+    return asyncio.run(tdx.update_ticket_statuses(
+        updates, checkpoint=checkpoint
+    ))
+
+
+def test_failed_post_to_ticket_already_in_status_fails(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = _FakeTDx({"1": 1, "2": CLOSED}, failing=frozenset({"2"}))
+    journal = str(tmp_path / "statuses.jsonl")
+    results = _update(
+        fake,
+        [("1", "Closed", "Done"), ("2", "Closed", "Done")],
+        monkeypatch,
+        journal,
+    )
+    assert results[0].ok and results[0].result == "updated"
+    assert not results[1].ok
+    with open(journal, encoding="UTF-8") as file:
+        entries = {
+            entry["Key"]: entry["OK"] for entry in map(json.loads, file)
+        }
+    assert entries == {"1": True, "2": False}
+
+
+def test_failed_post_is_resent_while_status_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = _FakeTDx({"1": 1}, failing=frozenset({"1"}))
+    results = _update(fake, [("1", "Closed", "Done")], monkeypatch)
+    assert not results[0].ok
+    assert fake.posts == ["1", "1"]
+
+
+def test_failed_post_that_changed_status_is_not_resent(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = _FakeTDx({"1": 1}, landing=frozenset({"1"}))
+    results = _update(fake, [("1", "Closed", "Done")], monkeypatch)
+    assert results[0].ok and results[0].result == "updated"
+    assert fake.posts == ["1"]